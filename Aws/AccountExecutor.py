@@ -0,0 +1,195 @@
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+
+from Aws.CredentialPool import CredentialPool
+from Aws.Lambda.Log import Log
+
+
+class AccountExecutor:
+    """
+    Execute a function in multiple AWS accounts (and optionally multiple regions) concurrently using assumed IAM roles
+    """
+    def __init__(self, role_arns, max_workers=16, max_workers_per_account=4, refresh_margin=300):
+        """
+        Initialize the account executor
+
+        :param role_arns: The IAM role to assume in each account
+        :type role_arns: List[str]
+
+        :param max_workers: Maximum number of functions executed concurrently across all accounts
+        :type max_workers: int
+
+        :param max_workers_per_account: Maximum number of functions executed concurrently in a single account
+        :type max_workers_per_account: int
+
+        :param refresh_margin: Number of seconds before expiration at which assumed role credentials are refreshed
+        :type refresh_margin: float
+        """
+        self.__max_workers__ = max_workers
+        self.__credential_pool__ = CredentialPool(role_arns=role_arns, refresh_margin=refresh_margin, max_workers=max_workers)
+        self.__semaphores__ = {role_arn: threading.BoundedSemaphore(max_workers_per_account) for role_arn in role_arns}
+
+        # Notified whenever an account semaphore is released, shared by concurrent executions of this executor
+        self.__condition__ = threading.Condition()
+
+    def get_credential_pool(self) -> CredentialPool:
+        """
+        Return the pool of assumed role credentials
+
+        :return: Credential pool
+        """
+        return self.__credential_pool__
+
+    def execute(self, function, region_names=None) -> dict:
+        """
+        Call a function once per account, or once per account and region, concurrently. The function is called with the keyword arguments
+        "credential" (the assumed role credential) and "role_arn", plus "region_name" if a list of regions was supplied
+
+        :param function: The function to call
+        :type function: Callable
+
+        :param region_names: Optional list of region names in which the function should be called
+        :type region_names: Optional[List[str]]
+
+        :return: Dictionary containing function return values ("results") and raised exceptions ("errors"), each indexed by role ARN (and then
+                 by region name if a list of regions was supplied)
+        """
+        results = {}
+        errors = {}
+        role_arns = self.__credential_pool__.get_role_arns()
+
+        # Assume all roles up front and concurrently, accounts we cannot access are reported and skipped
+        Log.trace('Assuming {count} IAM roles...'.format(count=len(role_arns)))
+        assume_errors = self.__credential_pool__.refresh()
+
+        # Pending regions indexed by role ARN, jobs are dispatched round robin across accounts
+        jobs = {}
+
+        for role_arn in role_arns:
+            for region_name in (region_names or [None]):
+                if role_arn in assume_errors:
+                    AccountExecutor.__set_value__(errors, role_arn, region_name, assume_errors[role_arn])
+                    continue
+
+                jobs.setdefault(role_arn, []).append(region_name)
+
+        if len(jobs) == 0:
+            return {'results': results, 'errors': errors}
+
+        count = sum([len(job_region_names) for job_region_names in jobs.values()])
+
+        with ThreadPoolExecutor(max_workers=min(self.__max_workers__, count)) as executor:
+            futures = self.__dispatch__(executor, function, jobs)
+
+            for (role_arn, region_name), future in futures.items():
+                try:
+                    value = future.result()
+                except Exception as account_exception:
+                    Log.warning('Failed to execute function in account ({role_arn}) region ({region_name}): {account_exception}'.format(
+                        role_arn=role_arn,
+                        region_name=region_name,
+                        account_exception=account_exception
+                    ))
+                    AccountExecutor.__set_value__(errors, role_arn, region_name, account_exception)
+                    continue
+
+                AccountExecutor.__set_value__(results, role_arn, region_name, value)
+
+        return {'results': results, 'errors': errors}
+
+    def __dispatch__(self, executor, function, jobs) -> dict:
+        """
+        Submit jobs round robin across accounts. A job is only submitted once its account is below the configured number of concurrent calls,
+        so one account with many jobs never fills the pool with workers waiting on it while other accounts have work ready
+
+        :param executor: The executor jobs are submitted to
+        :type executor: ThreadPoolExecutor
+
+        :param function: The function to call
+        :type function: Callable
+
+        :param jobs: Pending region names (or None) indexed by role ARN, emptied as jobs are submitted
+        :type jobs: Dict[str, List[Optional[str]]]
+
+        :return: Dictionary of futures indexed by role ARN and region name
+        """
+        futures = {}
+        condition = self.__condition__
+
+        def release(role_arn):
+            with condition:
+                self.__semaphores__[role_arn].release()
+                condition.notify()
+
+        with condition:
+            while len(jobs) > 0:
+                submitted = False
+
+                for role_arn in list(jobs.keys()):
+                    if self.__semaphores__[role_arn].acquire(blocking=False) is False:
+                        continue
+
+                    region_name = jobs[role_arn].pop(0)
+
+                    if len(jobs[role_arn]) == 0:
+                        del jobs[role_arn]
+
+                    future = executor.submit(self.__execute_account__, function, role_arn, region_name)
+                    future.add_done_callback(lambda completed, completed_role_arn=role_arn: release(completed_role_arn))
+                    futures[(role_arn, region_name)] = future
+                    submitted = True
+
+                # Every account with pending jobs is at its limit, wait for one of its calls to complete
+                if submitted is False:
+                    condition.wait()
+
+        return futures
+
+    def __execute_account__(self, function, role_arn, region_name):
+        """
+        Call a function in a single account, the caller must hold a slot in the accounts semaphore
+
+        :param function: The function to call
+        :type function: Callable
+
+        :param role_arn: The IAM role ARN
+        :type role_arn: str
+
+        :param region_name: Optional region name
+        :type region_name: Optional[str]
+
+        :return: The functions return value
+        """
+        arguments = {
+            'credential': self.__credential_pool__.get_credential(role_arn),
+            'role_arn': role_arn
+        }
+
+        if region_name is not None:
+            arguments['region_name'] = region_name
+
+        return function(**arguments)
+
+    @staticmethod
+    def __set_value__(values, role_arn, region_name, value) -> None:
+        """
+        Store a value indexed by role ARN, and region name if supplied
+
+        :param values: Dictionary to be updated
+        :type values: dict
+
+        :param role_arn: The IAM role ARN
+        :type role_arn: str
+
+        :param region_name: Optional region name
+        :type region_name: Optional[str]
+
+        :param value: The value to store
+        :type value: Any
+        """
+        if region_name is None:
+            values[role_arn] = value
+            return
+
+        values.setdefault(role_arn, {})[region_name] = value
@@ -0,0 +1,152 @@
+import asyncio
+import weakref
+
+from aiobotocore.config import AioConfig
+from aiobotocore.session import AioSession
+
+from Aws.Credential import Credential
+from Aws.Instrumentation import Instrumentation
+from Aws.Lambda.Log import Log
+from Aws.RateLimiter import RateLimiter
+from Aws.ResponseCache import ResponseCache
+from Aws.Sso.CredentialProvider import CredentialProvider
+
+
+class AsyncBaseClient:
+    """
+    Base asyncio AWS client. The underlying aiobotocore client, and therefore its HTTP connection pool, is shared by every client in the same event
+    loop using the same credential, service and region. Clients must be opened before use, either with "async with" or open() and close()
+    """
+    __client_identifier__ = None
+
+    # Maximum number of concurrent HTTP connections held by each shared client, further requests wait for a free connection
+    __max_pool_connections__ = 100
+
+    __client_config__ = AioConfig(retries={'mode': 'standard', 'max_attempts': 5}, max_pool_connections=__max_pool_connections__)
+
+    # Shared clients indexed by event loop, credential, service and region, each with the number of clients using it
+    __clients__ = {}
+    __locks__ = weakref.WeakKeyDictionary()
+
+    def __init__(self, credential, region_name):
+        """
+        Setup an asyncio AWS client
+
+        :param credential: The credential used to authenticate to AWS
+        :type credential: Credential
+
+        :param region_name: Region in which client will operate
+        :type region_name: str
+        """
+        if self.__client_identifier__ is None:
+            raise Exception('Attempting to retrieve client but no identifier has been set')
+
+        # If no credential is supplied- use default system permission
+        if credential is None:
+            Log.trace('Using default system credentials')
+            credential = Credential()
+
+        self.__credential__ = credential
+        self.__region_name__ = region_name
+        self.__client__ = None
+        self.__client_key__ = None
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    def get_region_name(self) -> str:
+        """
+        Get the region in which the client operates
+        """
+        return self.__region_name__
+
+    async def open(self) -> None:
+        """
+        Open the client, creating the shared aiobotocore client if this is the first client to use it
+        """
+        if self.__client__ is not None:
+            return
+
+        loop = asyncio.get_running_loop()
+        key = (id(loop), self.__credential__.get_identifier(), self.__client_identifier__, self.__region_name__)
+
+        async with AsyncBaseClient.__get_lock__(loop):
+            shared = AsyncBaseClient.__clients__.get(key)
+
+            if shared is None:
+                context = self.__create_client_context__()
+                client = await context.__aenter__()
+
+                Instrumentation.register(client)
+                RateLimiter.register(client, self.__credential__.get_identifier(), asynchronous=True)
+                ResponseCache.register(client, self.__credential__.get_identifier())
+
+                shared = {'context': context, 'client': client, 'references': 0}
+                AsyncBaseClient.__clients__[key] = shared
+
+            shared['references'] = shared['references'] + 1
+
+        self.__client__ = shared['client']
+        self.__client_key__ = key
+
+    async def close(self) -> None:
+        """
+        Close the client, the shared aiobotocore client is closed once no other client is using it
+        """
+        if self.__client__ is None:
+            return
+
+        async with AsyncBaseClient.__get_lock__(asyncio.get_running_loop()):
+            shared = AsyncBaseClient.__clients__[self.__client_key__]
+            shared['references'] = shared['references'] - 1
+
+            if shared['references'] == 0:
+                del AsyncBaseClient.__clients__[self.__client_key__]
+                await shared['context'].__aexit__(None, None, None)
+
+        self.__client__ = None
+        self.__client_key__ = None
+
+    def __create_client_context__(self):
+        """
+        Create an aiobotocore client context using the clients credential
+
+        :return: aiobotocore client context
+        """
+        credential = self.__credential__
+        session = AioSession(profile=credential.get_profile_name())
+        arguments = {
+            'region_name': self.__region_name__,
+            'config': AsyncBaseClient.__client_config__,
+            'aws_access_key_id': credential.get_aws_access_key_id(),
+            'aws_secret_access_key': credential.get_aws_secret_access_key(),
+            'aws_session_token': credential.get_aws_session_token()
+        }
+
+        if credential.get_sso_profile_name() is not None:
+            # aiobotocore cannot refresh botocore credentials, use the current shared SSO credentials for the lifetime of the client
+            frozen = CredentialProvider.get_credentials(credential.get_sso_profile_name()).get_frozen_credentials()
+            arguments['aws_access_key_id'] = frozen.access_key
+            arguments['aws_secret_access_key'] = frozen.secret_key
+            arguments['aws_session_token'] = frozen.token
+
+        return session.create_client(self.__client_identifier__, **arguments)
+
+    @staticmethod
+    def __get_lock__(loop) -> asyncio.Lock:
+        """
+        Get the lock guarding the shared clients of an event loop
+
+        :param loop: The event loop
+        :type loop: asyncio.AbstractEventLoop
+
+        :return: Lock
+        """
+        if loop not in AsyncBaseClient.__locks__:
+            AsyncBaseClient.__locks__[loop] = asyncio.Lock()
+
+        return AsyncBaseClient.__locks__[loop]
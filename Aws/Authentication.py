@@ -19,6 +19,21 @@ class Authentication:
             profile_name=profile_name
         )
 
+    @staticmethod
+    def get_credential_for_sso_profile(profile_name) -> Credential:
+        """
+        Use AWS SSO profile name to get credential object, role credentials are resolved from the SSO cache and held in memory rather than
+        written to the AWS credentials file
+
+        :param profile_name: AWS SSO profile name
+        :type profile_name: str
+
+        :return: AWS credentials object
+        """
+        return Credential(
+            sso_profile_name=profile_name
+        )
+
     @staticmethod
     def get_credential_for_key_secret(aws_access_key_id, aws_secret_access_key, aws_session_token=None) -> Credential:
         """
@@ -60,14 +75,17 @@ class Authentication:
         session_name = hashlib.md5(role_arn.encode())
         session_name = str(session_name.hexdigest())
 
-        sts_client = boto3.client('sts')
+        # Use a dedicated session, the default boto3 session is not safe to create clients from concurrently
+        sts_client = boto3.session.Session().client('sts')
         assume_role_response = sts_client.assume_role(RoleArn=role_arn, RoleSessionName=session_name)
 
         if 'Credentials' in assume_role_response:
             return Credential(
                 aws_access_key_id=assume_role_response['Credentials']['AccessKeyId'],
                 aws_secret_access_key=assume_role_response['Credentials']['SecretAccessKey'],
-                aws_session_token=assume_role_response['Credentials']['SessionToken']
+                aws_session_token=assume_role_response['Credentials']['SessionToken'],
+                iam_role_arn=role_arn,
+                expiration=assume_role_response['Credentials'].get('Expiration')
             )
 
         raise Exception('Failed to assume IAM role ({role_arn})'.format(role_arn=role_arn))
@@ -0,0 +1,133 @@
+import random
+
+from time import sleep
+from typing import Any
+
+from botocore.exceptions import ClientError
+
+from Aws.Lambda.Log import Log
+
+
+class Backoff:
+    """
+    Exponential backoff helpers used to retry throttled AWS requests
+    """
+    # Error codes returned by AWS services when requests are being throttled
+    THROTTLING_ERROR_CODES = (
+        'Throttling',
+        'ThrottlingException',
+        'ThrottledException',
+        'RequestThrottledException',
+        'TooManyRequestsException',
+        'ProvisionedThroughputExceededException',
+        'RequestLimitExceeded',
+        'BandwidthLimitExceeded',
+        'RequestThrottled',
+        'SlowDown',
+        'PriorRequestNotComplete',
+        'EC2ThrottledException'
+    )
+
+    @staticmethod
+    def get_delay(attempt, base=0.5, cap=20.0, jitter=True) -> float:
+        """
+        Calculate the delay before the next attempt
+
+        :param attempt: The number of attempts made so far (starting at 1)
+        :type attempt: int
+
+        :param base: Delay in seconds after the first attempt
+        :type base: float
+
+        :param cap: Maximum delay in seconds
+        :type cap: float
+
+        :param jitter: If TRUE a random delay between zero and the exponential delay is returned ("full jitter")
+        :type jitter: bool
+
+        :return: Number of seconds to wait
+        """
+        delay = min(cap, base * (2 ** (attempt - 1)))
+
+        if jitter is True:
+            return random.uniform(0, delay)
+
+        return delay
+
+    @staticmethod
+    def is_throttling_error(exception) -> bool:
+        """
+        Check if an exception was raised due to request throttling
+
+        :param exception: The exception to check
+        :type exception: Exception
+
+        :return: True if the request was throttled
+        """
+        if isinstance(exception, ClientError) is False:
+            return False
+
+        return exception.response.get('Error', {}).get('Code') in Backoff.THROTTLING_ERROR_CODES
+
+    @staticmethod
+    def is_throttling_response(response) -> bool:
+        """
+        Check if a botocore response indicates the request was throttled
+
+        :param response: Tuple of HTTP response and parsed response, as passed to botocore event handlers
+        :type response: tuple
+
+        :return: True if the request was throttled
+        """
+        http_response, parsed = response
+
+        if http_response.status_code == 429:
+            return True
+
+        return (parsed or {}).get('Error', {}).get('Code') in Backoff.THROTTLING_ERROR_CODES
+
+    @staticmethod
+    def call(function, arguments=None, max_attempts=5, base=0.5, cap=20.0) -> Any:
+        """
+        Call a function, retrying with exponential backoff if the request is throttled
+
+        :param function: The function to call
+        :type function: Callable
+
+        :param arguments: Dictionary of keyword arguments to be passed to the function
+        :type arguments: Optional[dict]
+
+        :param max_attempts: Maximum number of attempts before giving up
+        :type max_attempts: int
+
+        :param base: Delay in seconds after the first attempt
+        :type base: float
+
+        :param cap: Maximum delay in seconds
+        :type cap: float
+
+        :return: The functions return value
+
+        :raises ClientError: if the request fails for any reason other than throttling, or is still throttled after the maximum number of attempts
+        """
+        if arguments is None:
+            arguments = {}
+
+        attempt = 0
+
+        while True:
+            attempt = attempt + 1
+
+            try:
+                return function(**arguments)
+            except ClientError as client_error:
+                if Backoff.is_throttling_error(client_error) is False or attempt >= max_attempts:
+                    raise client_error
+
+                delay = Backoff.get_delay(attempt=attempt, base=base, cap=cap)
+                Log.debug('Request throttled, retrying in {delay:.2f} seconds (attempt {attempt} of {max_attempts})'.format(
+                    delay=delay,
+                    attempt=attempt,
+                    max_attempts=max_attempts
+                ))
+                sleep(delay)
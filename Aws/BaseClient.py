@@ -1,5 +1,12 @@
+import threading
+
+from botocore.config import Config
+
 from Aws.Credential import Credential
+from Aws.Instrumentation import Instrumentation
 from Aws.Lambda.Log import Log
+from Aws.RateLimiter import RateLimiter
+from Aws.ResponseCache import ResponseCache
 
 
 class BaseClient:
@@ -11,6 +18,12 @@ class BaseClient:
     __client_identifier__ = None
     __caller_identity__ = None
 
+    # Creating clients from a shared session is not thread safe
+    __client_lock__ = threading.Lock()
+
+    # Standard retry mode backs off with jitter and stops retrying when most recent requests have failed, rather than amplifying throttling
+    __client_config__ = Config(retries={'mode': 'standard', 'max_attempts': 5})
+
     def __init__(self, credential, region_name):
         """
         Setup an AWS client
@@ -30,26 +43,58 @@ class BaseClient:
             credential = Credential()
 
         self.__credential__ = credential
-        self.__session__ = credential.get_boto3_session(region_name)
-        self.__client__ = self.__session__.client(self.__client_identifier__)
+        self.__region_name__ = region_name
+
+        with BaseClient.__client_lock__:
+            self.__session__ = credential.get_boto3_session(region_name)
+            self.__client__ = self.__session__.client(self.__client_identifier__, config=BaseClient.__client_config__)
+
+        # Statistics are registered first so calls answered from the response cache are still counted
+        Instrumentation.register(self.__client__)
+
+        # Requests are limited by a token bucket shared with every other client for the same service, region and credentials
+        RateLimiter.register(self.__client__, credential.get_identifier())
+
+        # Read only responses are cached once enabled with ResponseCache.set_enabled()
+        ResponseCache.register(self.__client__, credential.get_identifier())
+
+        # Caller identity is retrieved on demand to avoid an STS request every time a client is created
+        self.__sts_client__ = None
+        self.__caller_identity__ = None
+
+    def get_region_name(self) -> str:
+        """
+        Get the region in which the client operates
+        """
+        return self.__region_name__
+
+    def get_caller_identity(self) -> dict:
+        """
+        Get the AWS caller identity, retrieving it from STS on first use
+        """
+        if self.__caller_identity__ is None:
+            with BaseClient.__client_lock__:
+                if self.__sts_client__ is None:
+                    self.__sts_client__ = self.__session__.client("sts")
+
+            self.__caller_identity__ = self.__sts_client__.get_caller_identity()
 
-        self.__sts_client__ = self.__session__.client("sts")
-        self.__caller_identity__ = self.__sts_client__.get_caller_identity()
+        return self.__caller_identity__
 
     def get_caller_user_id(self) -> str:
         """
         Get the AWS user ID
         """
-        return self.__caller_identity__['UserId']
+        return self.get_caller_identity()['UserId']
 
     def get_caller_aws_account_id(self) -> str:
         """
         Get the AWS account ID
         """
-        return self.__caller_identity__['Account']
+        return self.get_caller_identity()['Account']
 
     def get_caller_arn(self) -> str:
         """
         Get the AWS user ARN
         """
-        return self.__caller_identity__['Arn']
+        return self.get_caller_identity()['Arn']
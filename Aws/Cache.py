@@ -0,0 +1,243 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+
+from collections import OrderedDict
+from datetime import datetime
+from time import time
+from typing import Any, Optional
+
+from Aws.Lambda.Log import Log
+
+
+class Cache:
+    """
+    Thread safe in-memory LRU cache with optional expiry and optional on-disk persistence (e.g. under /tmp in Lambda). Values persisted to disk must
+    be JSON serializable, datetime values are preserved
+    """
+    def __init__(self, max_size=1024, ttl=None, path=None):
+        """
+        Initialize cache
+
+        :param max_size: Maximum number of entries held in memory before the least recently used entry is evicted
+        :type max_size: int
+
+        :param ttl: Default number of seconds an entry remains valid, or None if entries never expire
+        :type ttl: Optional[float]
+
+        :param path: Optional directory in which entries are persisted, if None entries are held in memory only
+        :type path: Optional[str]
+        """
+        self.__max_size__ = max_size
+        self.__ttl__ = ttl
+        self.__path__ = path
+        self.__entries__ = OrderedDict()
+        self.__lock__ = threading.RLock()
+
+        if path is not None:
+            os.makedirs(path, exist_ok=True)
+
+    def get(self, key) -> Optional[Any]:
+        """
+        Retrieve a cached value
+
+        :param key: The cache key
+        :type key: str
+
+        :return: The cached value, or None if not cached or expired
+        """
+        with self.__lock__:
+            entry = self.__entries__.get(key)
+
+            if entry is None and self.__path__ is not None:
+                entry = self.__read_entry__(key)
+
+                if entry is not None:
+                    self.__store_entry__(key, entry)
+
+            if entry is None:
+                return None
+
+            if entry['expires'] is not None and entry['expires'] < time():
+                self.delete(key)
+                return None
+
+            self.__entries__.move_to_end(key)
+
+            return entry['value']
+
+    def set(self, key, value, ttl=None) -> None:
+        """
+        Store a value in the cache
+
+        :param key: The cache key
+        :type key: str
+
+        :param value: The value to cache
+        :type value: Any
+
+        :param ttl: Number of seconds the entry remains valid, defaults to the caches TTL
+        :type ttl: Optional[float]
+        """
+        if ttl is None:
+            ttl = self.__ttl__
+
+        entry = {
+            'key': key,
+            'expires': time() + ttl if ttl is not None else None,
+            'value': value
+        }
+
+        with self.__lock__:
+            self.__store_entry__(key, entry)
+
+            if self.__path__ is not None:
+                self.__write_entry__(key, entry)
+
+    def delete(self, key) -> None:
+        """
+        Remove a value from the cache
+
+        :param key: The cache key
+        :type key: str
+        """
+        with self.__lock__:
+            self.__entries__.pop(key, None)
+
+            if self.__path__ is not None:
+                try:
+                    os.remove(self.__get_entry_path__(key))
+                except FileNotFoundError:
+                    pass
+
+    def delete_matching(self, predicate) -> None:
+        """
+        Remove all in-memory values whose key matches the supplied predicate
+
+        :param predicate: Function accepting a cache key and returning True if the entry should be removed
+        :type predicate: Callable[[str], bool]
+        """
+        with self.__lock__:
+            for key in [key for key in self.__entries__.keys() if predicate(key)]:
+                self.delete(key)
+
+    def clear(self) -> None:
+        """
+        Remove all values from the cache
+        """
+        with self.__lock__:
+            self.__entries__.clear()
+
+            if self.__path__ is not None and os.path.exists(self.__path__):
+                for filename in os.listdir(self.__path__):
+                    if filename.startswith('cache-') and filename.endswith('.json'):
+                        os.remove(os.path.join(self.__path__, filename))
+
+    def __store_entry__(self, key, entry) -> None:
+        """
+        Store an entry in memory, evicting the least recently used entry if the cache is full
+
+        :param key: The cache key
+        :type key: str
+
+        :param entry: The cache entry
+        :type entry: dict
+        """
+        self.__entries__[key] = entry
+        self.__entries__.move_to_end(key)
+
+        while len(self.__entries__) > self.__max_size__:
+            self.__entries__.popitem(last=False)
+
+    def __get_entry_path__(self, key) -> str:
+        """
+        Get the on-disk filename of a cache entry
+
+        :param key: The cache key
+        :type key: str
+
+        :return: Filename
+        """
+        filename = 'cache-{hash}.json'.format(hash=hashlib.md5(str(key).encode()).hexdigest())
+
+        return os.path.join(self.__path__, filename)
+
+    def __read_entry__(self, key) -> Optional[dict]:
+        """
+        Read a cache entry from disk, ignoring missing or invalid files
+
+        :param key: The cache key
+        :type key: str
+
+        :return: Cache entry, or None if not found
+        """
+        try:
+            with open(self.__get_entry_path__(key)) as context:
+                entry = json.load(context, object_hook=Cache.__decode_value__)
+        except (OSError, ValueError):
+            return None
+
+        # Guard against hash collisions
+        if entry.get('key') != key:
+            return None
+
+        return entry
+
+    def __write_entry__(self, key, entry) -> None:
+        """
+        Atomically write a cache entry to disk, failure to persist is logged but otherwise ignored
+
+        :param key: The cache key
+        :type key: str
+
+        :param entry: The cache entry
+        :type entry: dict
+        """
+        temporary_path = None
+
+        try:
+            file_descriptor, temporary_path = tempfile.mkstemp(dir=self.__path__, suffix='.tmp')
+
+            with os.fdopen(file_descriptor, 'w') as destination:
+                json.dump(entry, destination, default=Cache.__encode_value__)
+
+            os.replace(temporary_path, self.__get_entry_path__(key))
+        except (OSError, TypeError, ValueError) as write_exception:
+            if temporary_path is not None and os.path.exists(temporary_path):
+                os.remove(temporary_path)
+
+            Log.warning('Failed to persist cache entry ({key}): {write_exception}'.format(key=key, write_exception=write_exception))
+
+    @staticmethod
+    def __encode_value__(value) -> dict:
+        """
+        Encode values that are not natively JSON serializable
+
+        :param value: The value to encode
+        :type value: Any
+
+        :return: Encoded value
+
+        :raises TypeError: if the value cannot be encoded
+        """
+        if isinstance(value, datetime):
+            return {'__datetime__': value.isoformat()}
+
+        raise TypeError('Object of type {type} is not JSON serializable'.format(type=type(value).__name__))
+
+    @staticmethod
+    def __decode_value__(value) -> Any:
+        """
+        Decode values encoded by __encode_value__
+
+        :param value: The decoded JSON object
+        :type value: dict
+
+        :return: Decoded value
+        """
+        if len(value) == 1 and '__datetime__' in value:
+            return datetime.fromisoformat(value['__datetime__'])
+
+        return value
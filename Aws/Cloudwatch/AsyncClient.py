@@ -0,0 +1,76 @@
+from Aws.AsyncBaseClient import AsyncBaseClient
+from Aws.Cloudwatch.Client import Client
+
+
+class AsyncClient(AsyncBaseClient):
+    """
+    Asyncio Cloudwatch Client, metric units are the constants defined on Aws.Cloudwatch.Client.Client
+    """
+    __client_identifier__ = 'cloudwatch'
+
+    def __init__(self, credential, region_name):
+        """
+        Setup an asyncio Cloudwatch client
+
+        :param credential: The credential used to authenticate to AWS
+        :type credential: Credential
+
+        :param region_name: Region in which client will operate
+        :type region_name: str
+        """
+        super().__init__(credential, region_name)
+
+    async def put_metric(self, namespace, metric_name, value, unit):
+        """
+        Push a Cloudwatch metric
+
+        :type namespace: The Cloudwatch namespace
+        :param namespace: str
+
+        :type metric_name: str
+        :param metric_name: Metric name
+
+        :type value: float
+        :param value: Value to save
+
+        :type unit: str
+        :param unit: Unit of measurement (e.g. Bytes, Count)
+
+        :return: None
+        """
+        await self.put_metrics(namespace, [{
+            'MetricName': metric_name,
+            'Unit': unit,
+            'Value': value
+        }])
+
+    async def increment_count(self, namespace, metric_name):
+        """
+        Increment a count Cloudwatch metric
+
+        :type namespace: The Cloudwatch namespace
+        :param namespace: str
+
+        :type metric_name: str
+        :param metric_name: Metric name
+
+        :return: None
+        """
+        await self.put_metric(namespace, metric_name, 1.0, Client.UNIT_COUNT)
+
+    async def put_metrics(self, namespace, metric_data):
+        """
+        Push multiple Cloudwatch metrics in a single request
+
+        :type namespace: The Cloudwatch namespace
+        :param namespace: str
+
+        :type metric_data: List[dict]
+        :param metric_data: Metric data as accepted by PutMetricData (each containing a MetricName, Unit and Value or StatisticValues)
+
+        :return: None
+        """
+        await self.__client__.put_metric_data(
+            Namespace=namespace,
+            MetricData=metric_data
+        )
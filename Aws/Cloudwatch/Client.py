@@ -94,3 +94,20 @@ class Client(BaseClient):
                 'Value': 1.0
             }]
         )
+
+    def put_metrics(self, namespace, metric_data):
+        """
+        Push multiple Cloudwatch metrics in a single request
+
+        :type namespace: The Cloudwatch namespace
+        :param namespace: str
+
+        :type metric_data: List[dict]
+        :param metric_data: Metric data as accepted by PutMetricData (each containing a MetricName, Unit and Value or StatisticValues)
+
+        :return: None
+        """
+        self.__client__.put_metric_data(
+            Namespace=namespace,
+            MetricData=metric_data
+        )
@@ -1,10 +1,14 @@
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 
 import boto3
+import botocore.session
 import hashlib
 
 from boto3 import Session
 
+from Aws.Sso.CredentialProvider import CredentialProvider
+
 
 class Credential:
     """
@@ -16,8 +20,19 @@ class Credential:
     __aws_secret_access_key__ = None
     __aws_session_token__ = None
     __iam_role_arn__ = None
-
-    def __init__(self, aws_access_key_id=None, aws_secret_access_key=None, aws_session_token=None, iam_role_arn=None, profile_name=None):
+    __expiration__ = None
+    __sso_profile_name__ = None
+
+    def __init__(
+            self,
+            aws_access_key_id=None,
+            aws_secret_access_key=None,
+            aws_session_token=None,
+            iam_role_arn=None,
+            profile_name=None,
+            expiration=None,
+            sso_profile_name=None
+    ):
         """
         Initialize credentials object
 
@@ -27,6 +42,10 @@ class Credential:
         :type aws_secret_access_key: Optional[str]
         :param aws_session_token: AWS session token value
         :type aws_session_token: Optional[str]
+        :param expiration: Time at which temporary credentials expire
+        :type expiration: Optional[datetime]
+        :param sso_profile_name: AWS SSO profile name, role credentials are resolved from the SSO cache and held in memory
+        :type sso_profile_name: Optional[str]
         """
         self.__cache__ = {}
         self.set_aws_access_key_id(aws_access_key_id)
@@ -34,6 +53,8 @@ class Credential:
         self.set_aws_session_token(aws_session_token)
         self.set_iam_role_arn(iam_role_arn)
         self.set_profile_name(profile_name)
+        self.set_expiration(expiration)
+        self.set_sso_profile_name(sso_profile_name)
 
     def get_boto3_session(self, region_name, cache=True) -> Session:
         """
@@ -49,11 +70,7 @@ class Credential:
         
         :raise Exception: on authentication failure
         """
-        session_name = str(self.__aws_access_key_id__) or ''
-        session_name = session_name + str(self.__aws_secret_access_key__) or ''
-        session_name = session_name + str(self.__aws_session_token__) or ''
-        session_name = session_name + str(self.__profile_name__) or ''
-        session_name = session_name + str(region_name)
+        session_name = self.get_identifier() + str(region_name)
         session_name = hashlib.md5(session_name.encode())
         session_name = str(session_name.hexdigest())
 
@@ -61,13 +78,16 @@ class Credential:
         if cache is True and session_name in self.__cache__.keys():
             return self.__cache__[session_name]
 
-        session = boto3.session.Session(
-            aws_access_key_id=self.__aws_access_key_id__,
-            aws_secret_access_key=self.__aws_secret_access_key__,
-            aws_session_token=self.__aws_session_token__,
-            region_name=region_name,
-            profile_name=self.__profile_name__
-        )
+        if self.__sso_profile_name__ is not None:
+            session = self.__get_sso_boto3_session__(region_name)
+        else:
+            session = boto3.session.Session(
+                aws_access_key_id=self.__aws_access_key_id__,
+                aws_secret_access_key=self.__aws_secret_access_key__,
+                aws_session_token=self.__aws_session_token__,
+                region_name=region_name,
+                profile_name=self.__profile_name__
+            )
 
         # If we are caching, persist this session to the cache
         if cache is True:
@@ -75,6 +95,35 @@ class Credential:
 
         return session
 
+    def __get_sso_boto3_session__(self, region_name) -> Session:
+        """
+        Create a Boto3 session using in memory SSO role credentials shared with every other session for the same SSO profile
+
+        :param region_name: The AWS region for the session to be created in
+        :type region_name: str
+
+        :return: Boto3 Session object
+        """
+        botocore_session = botocore.session.get_session()
+        botocore_session.get_component('credential_provider').insert_before('env', CredentialProvider(self.__sso_profile_name__))
+
+        return boto3.session.Session(botocore_session=botocore_session, region_name=region_name)
+
+    def get_identifier(self) -> str:
+        """
+        Return a hash uniquely identifying these credentials, suitable for use in cache keys
+
+        :return: Credential identifier
+        """
+        identifier = str(self.__aws_access_key_id__) or ''
+        identifier = identifier + str(self.__aws_secret_access_key__) or ''
+        identifier = identifier + str(self.__aws_session_token__) or ''
+        identifier = identifier + str(self.__profile_name__) or ''
+        identifier = identifier + str(self.__sso_profile_name__) or ''
+        identifier = hashlib.md5(identifier.encode())
+
+        return str(identifier.hexdigest())
+
     def get_profile_name(self) -> Optional[str]:
         """
         Retrieve AWS profile name
@@ -91,6 +140,22 @@ class Credential:
         """
         self.__profile_name__ = profile_name
 
+    def get_sso_profile_name(self) -> Optional[str]:
+        """
+        Retrieve AWS SSO profile name
+        :return: AWS SSO profile name or None if not set
+        """
+        return self.__sso_profile_name__
+
+    def set_sso_profile_name(self, sso_profile_name) -> None:
+        """
+        Set AWS SSO profile name
+
+        :param sso_profile_name: AWS SSO profile name
+        :type sso_profile_name: Optional[str]
+        """
+        self.__sso_profile_name__ = sso_profile_name
+
     def get_iam_role_arn(self) -> Optional[str]:
         """
         Retrieve AWS IAM role ARN
@@ -154,3 +219,33 @@ class Credential:
         :type aws_session_token: Optional[str]
         """
         self.__aws_session_token__ = aws_session_token
+
+    def get_expiration(self) -> Optional[datetime]:
+        """
+        Retrieve the time at which temporary credentials expire
+        :return: Expiration time, or None if the credentials do not expire
+        """
+        return self.__expiration__
+
+    def set_expiration(self, expiration) -> None:
+        """
+        Set the time at which temporary credentials expire
+
+        :param expiration: Timezone aware expiration time
+        :type expiration: Optional[datetime]
+        """
+        self.__expiration__ = expiration
+
+    def is_expiring(self, margin=0) -> bool:
+        """
+        Check if temporary credentials have expired, or will expire within the specified margin
+
+        :param margin: Number of seconds before expiration at which credentials are considered to be expiring
+        :type margin: float
+
+        :return: True if the credentials are expiring, always False for credentials without an expiration
+        """
+        if self.__expiration__ is None:
+            return False
+
+        return datetime.now(timezone.utc) + timedelta(seconds=margin) >= self.__expiration__
@@ -0,0 +1,94 @@
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+from Aws.Authentication import Authentication
+from Aws.Credential import Credential
+from Aws.Lambda.Log import Log
+
+
+class CredentialPool:
+    """
+    Pool of assumed IAM role credentials which are refreshed before they expire
+    """
+    def __init__(self, role_arns, refresh_margin=300, max_workers=16):
+        """
+        Initialize the credential pool
+
+        :param role_arns: The IAM roles to assume
+        :type role_arns: List[str]
+
+        :param refresh_margin: Number of seconds before expiration at which credentials are refreshed
+        :type refresh_margin: float
+
+        :param max_workers: Maximum number of roles assumed concurrently
+        :type max_workers: int
+        """
+        self.__role_arns__ = list(role_arns)
+        self.__refresh_margin__ = refresh_margin
+        self.__max_workers__ = max_workers
+        self.__credentials__ = {}
+        self.__locks__ = {role_arn: threading.Lock() for role_arn in self.__role_arns__}
+
+    def get_role_arns(self) -> List[str]:
+        """
+        Return the IAM roles in the pool
+
+        :return: List of IAM role ARNs
+        """
+        return list(self.__role_arns__)
+
+    def get_credential(self, role_arn) -> Credential:
+        """
+        Return credentials for an IAM role, assuming the role if the pooled credentials are missing or about to expire
+
+        :param role_arn: The IAM role ARN
+        :type role_arn: str
+
+        :return: AWS credentials object
+
+        :raise Exception: on failure to assume role
+        """
+        if role_arn not in self.__locks__:
+            raise Exception('Requested IAM role ({role_arn}) is not part of the credential pool'.format(role_arn=role_arn))
+
+        # Only one thread assumes each role, any others wait for it to finish and then use the refreshed credentials
+        with self.__locks__[role_arn]:
+            credential = self.__credentials__.get(role_arn)
+
+            if credential is None or credential.is_expiring(self.__refresh_margin__) is True:
+                Log.trace('Assuming IAM role ({role_arn})...'.format(role_arn=role_arn))
+                credential = Authentication.get_credential_for_iam_role(role_arn)
+                self.__credentials__[role_arn] = credential
+
+            return credential
+
+    def refresh(self, role_arns=None) -> Dict[str, Exception]:
+        """
+        Concurrently assume all IAM roles whose credentials are missing or about to expire
+
+        :param role_arns: Optional list of IAM role ARNs to refresh, defaults to all roles in the pool
+        :type role_arns: Optional[List[str]]
+
+        :return: Dictionary of exceptions indexed by the ARN of any role that could not be assumed
+        """
+        if role_arns is None:
+            role_arns = self.__role_arns__
+
+        errors = {}
+
+        if len(role_arns) == 0:
+            return errors
+
+        with ThreadPoolExecutor(max_workers=min(self.__max_workers__, len(role_arns))) as executor:
+            futures = {role_arn: executor.submit(self.get_credential, role_arn) for role_arn in role_arns}
+
+            for role_arn, future in futures.items():
+                try:
+                    future.result()
+                except Exception as assume_exception:
+                    Log.warning('Failed to assume IAM role ({role_arn}): {assume_exception}'.format(role_arn=role_arn, assume_exception=assume_exception))
+                    errors[role_arn] = assume_exception
+
+        return errors
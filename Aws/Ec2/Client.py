@@ -1,8 +1,10 @@
+from copy import deepcopy
 from typing import Optional, Dict
 
 from Aws.Iterator import Iterator
 
 from Aws.BaseClient import BaseClient
+from Aws.Cache import Cache
 from Aws.Ec2.Region import Region
 
 
@@ -12,6 +14,9 @@ class Client(BaseClient):
     """
     __client_identifier__ = 'ec2'
 
+    # Process wide cache of enabled regions indexed by credential and region
+    __regions_cache__ = Cache(max_size=64, ttl=3600)
+
     def __init__(self, credential, region_name):
         """
         Setup an EC2 client
@@ -24,12 +29,24 @@ class Client(BaseClient):
         """
         super().__init__(credential, region_name)
 
-    def describe_regions(self) -> Dict[str, Region]:
+    def describe_regions(self, use_cache=True) -> Dict[str, Region]:
         """
-        Describe a region
+        Describe the regions enabled for the account, results are cached for the lifetime of the regions cache (one hour by default)
+
+        :param use_cache: If FALSE the regions will always be retrieved from the API (and the cache updated)
+        :type use_cache: bool
 
         :return: Dictioanry of regions indexed by region name
         """
+        cache = Client.__regions_cache__
+        cache_key = '{identifier}:{region_name}'.format(identifier=self.__credential__.get_identifier(), region_name=self.get_region_name())
+
+        if cache is not None and use_cache is True:
+            regions = cache.get(cache_key)
+
+            if regions is not None:
+                return deepcopy(regions)
+
         regions = {}
 
         describe_regions = Iterator.iterate(
@@ -41,4 +58,26 @@ class Client(BaseClient):
         for region in describe_regions:
             regions[region["RegionName"]] = region
 
-        return regions
+        if cache is not None:
+            cache.set(cache_key, regions)
+
+        return deepcopy(regions)
+
+    @staticmethod
+    def set_regions_cache(cache) -> None:
+        """
+        Set the process wide cache used to store enabled regions, e.g. Cache(ttl=86400, path='/tmp/aws-regions') to share regions between
+        processes
+
+        :param cache: The cache to use, or None to disable caching
+        :type cache: Optional[Cache]
+        """
+        Client.__regions_cache__ = cache
+
+    @staticmethod
+    def invalidate_regions_cache() -> None:
+        """
+        Remove all cached regions
+        """
+        if Client.__regions_cache__ is not None:
+            Client.__regions_cache__.clear()
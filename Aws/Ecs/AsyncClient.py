@@ -0,0 +1,421 @@
+import asyncio
+
+from Aws.AsyncBaseClient import AsyncBaseClient
+from Aws.AsyncIterator import AsyncIterator
+from Aws.Ecs.Client import Client
+from Aws.Ecs.Cluster import Cluster
+from Aws.Ecs.Service import Service
+from Aws.Ecs.Task import Task
+from Aws.Ecs.TaskDefinition import TaskDefinition
+from Aws.ResponseCache import ResponseCache
+from typing import Dict, List, Optional
+
+
+class AsyncClient(AsyncBaseClient):
+    """
+    Asyncio ECS Client, describe requests are batched into the maximum number of resources supported by each API call and batches are sent
+    concurrently
+    """
+    __client_identifier__ = 'ecs'
+
+    # Default maximum number of requests sent concurrently by a single call
+    __max_concurrency__ = 10
+
+    def __init__(self, credential, region_name):
+        """
+        Setup an asyncio ECS client
+
+        :param credential: The credential used to authenticate to AWS
+        :type credential: Credential
+
+        :param region_name: Region in which client will operate
+        :type region_name: str
+        """
+        super().__init__(credential, region_name)
+
+    async def list_clusters(self) -> Dict[str, Cluster]:
+        """
+        List all ECS clusters available
+
+        :return: Dictionary of ECS clusters indexed by their ARN
+        """
+        return await self.describe_clusters(await self.list_cluster_arns())
+
+    async def list_cluster_arns(self) -> List[str]:
+        """
+        List the ARNs of all ECS clusters available
+
+        :return: List of ECS cluster ARNs
+        """
+        return await AsyncIterator.iterate(
+            client=self.__client__,
+            method_name='list_clusters',
+            data_key='clusterArns'
+        )
+
+    async def describe_cluster(self, arn) -> Optional[Cluster]:
+        """
+        Describe a cluster
+
+        :param arn: The clusters ARN
+        :type arn: str
+
+        :return: Cluster object, or None if not found
+        """
+        return (await self.describe_clusters([arn])).get(arn)
+
+    async def describe_clusters(self, cluster_arns) -> Dict[str, Cluster]:
+        """
+        Describe multiple clusters
+
+        :param cluster_arns: ARNs of the clusters to describe
+        :type cluster_arns: List[str]
+
+        :return: Dictionary of Cluster objects indexed by their ARN, clusters that could not be found are omitted
+        """
+        results = await AsyncClient.__describe_batches__(
+            function=self.__client__.describe_clusters,
+            arns=cluster_arns,
+            arns_key='clusters',
+            max_count=Client.__describe_clusters_max_count__,
+            arguments={'include': ['ATTACHMENTS', 'SETTINGS', 'STATISTICS', 'TAGS']}
+        )
+
+        clusters = {}
+
+        for cluster_values in results:
+            cluster = Cluster(cluster_values['clusterArn'])
+            cluster.set_values(cluster_values)
+            clusters[cluster.get_arn()] = cluster
+
+        return clusters
+
+    async def list_services(self, cluster_arn) -> Dict[str, Service]:
+        """
+        List all ECS services available
+
+        :param cluster_arn: The ARN of ECS cluster whose service you want to list
+        :type cluster_arn: str
+
+        :return: Dictionary of ECS services indexed by their ARN
+        """
+        return await self.describe_services(cluster_arn, await self.list_service_arns(cluster_arn))
+
+    async def list_service_arns(self, cluster_arn) -> List[str]:
+        """
+        List the ARNs of all ECS services in the specified cluster
+
+        :param cluster_arn: The ARN of ECS cluster whose service you want to list
+        :type cluster_arn: str
+
+        :return: List of ECS service ARNs
+        """
+        return await AsyncIterator.iterate(
+            client=self.__client__,
+            method_name='list_services',
+            data_key='serviceArns',
+            arguments={
+                'cluster': cluster_arn
+            }
+        )
+
+    async def describe_service(self, cluster_arn, service_arn) -> Optional[Service]:
+        """
+        Describe a service
+
+        :param cluster_arn: ARN of the cluster that hosts the service
+        :type cluster_arn: str
+
+        :param service_arn: ARN of the service to describe
+        :type service_arn: str
+
+        :return: Service object, or None if not found
+        """
+        return (await self.describe_services(cluster_arn, [service_arn])).get(service_arn)
+
+    async def describe_services(self, cluster_arn, service_arns) -> Dict[str, Service]:
+        """
+        Describe multiple services
+
+        :param cluster_arn: ARN of the cluster that hosts the services
+        :type cluster_arn: str
+
+        :param service_arns: ARNs of the services to describe
+        :type service_arns: List[str]
+
+        :return: Dictionary of Service objects indexed by their ARN, services that could not be found are omitted
+        """
+        results = await AsyncClient.__describe_batches__(
+            function=self.__client__.describe_services,
+            arns=service_arns,
+            arns_key='services',
+            max_count=Client.__describe_services_max_count__,
+            arguments={'cluster': cluster_arn, 'include': ['TAGS']}
+        )
+
+        services = {}
+
+        for service_values in results:
+            service = Service(service_values['serviceArn'])
+            service.set_values(service_values)
+            services[service.get_arn()] = service
+
+        return services
+
+    async def list_tasks(self, cluster_arn) -> Dict[str, Task]:
+        """
+        List all ECS tasks available in the specified cluster
+
+        :param cluster_arn: ARN of the cluster
+        :type cluster_arn: str
+
+        :return: Dictionary of ECS tasks indexed by their ARN
+        """
+        return await self.describe_tasks(cluster_arn, await self.list_task_arns(cluster_arn))
+
+    async def list_task_arns(self, cluster_arn, service_name=None) -> List[str]:
+        """
+        List the ARNs of all ECS tasks in the specified cluster
+
+        :param cluster_arn: ARN of the cluster
+        :type cluster_arn: str
+
+        :param service_name: Optional name of the service whose tasks should be listed
+        :type service_name: Optional[str]
+
+        :return: List of ECS task ARNs
+        """
+        arguments = {
+            'cluster': cluster_arn
+        }
+
+        if service_name is not None:
+            arguments['serviceName'] = service_name
+
+        return await AsyncIterator.iterate(
+            client=self.__client__,
+            method_name='list_tasks',
+            data_key='taskArns',
+            arguments=arguments
+        )
+
+    async def describe_task(self, cluster_arn, task_arn) -> Optional[Task]:
+        """
+        Describe a task
+
+        :param cluster_arn: ARN of the cluster that hosts the task
+        :type cluster_arn: str
+
+        :param task_arn: ARN of the task to describe
+        :type task_arn: str
+
+        :return: Task object, or None if not found
+        """
+        return (await self.describe_tasks(cluster_arn, [task_arn])).get(task_arn)
+
+    async def describe_tasks(self, cluster_arn, task_arns) -> Dict[str, Task]:
+        """
+        Describe multiple tasks
+
+        :param cluster_arn: ARN of the cluster that hosts the tasks
+        :type cluster_arn: str
+
+        :param task_arns: ARNs of the tasks to describe
+        :type task_arns: List[str]
+
+        :return: Dictionary of Task objects indexed by their ARN, tasks that could not be found are omitted
+        """
+        results = await AsyncClient.__describe_batches__(
+            function=self.__client__.describe_tasks,
+            arns=task_arns,
+            arns_key='tasks',
+            max_count=Client.__describe_tasks_max_count__,
+            arguments={'cluster': cluster_arn, 'include': ['TAGS']}
+        )
+
+        tasks = {}
+
+        for task_values in results:
+            task = Task(task_values['taskArn'])
+            task.set_values(task_values)
+            tasks[task.get_arn()] = task
+
+        return tasks
+
+    async def list_task_definitions(self, active=True, all_versions=False, by_family=False, max_concurrency=None) -> Dict[str, TaskDefinition]:
+        """
+        List all available task definitions, task definitions are described concurrently
+
+        :param active: If TRUE will only return ACTIVE task definitions, if FALSE will only return INACTIVE task definitions
+        :type active: bool
+
+        :param all_versions: If TRUE all versions of the task definition will be returned, otherwise only the most recent revision will be returned
+        :type all_versions: bool
+
+        :param by_family: If TRUE (and all_versions is FALSE) the task definition families will be enumerated and only the most recent revision of each
+                          family will be retrieved, rather than iterating every revision in the account
+        :type by_family: bool
+
+        :param max_concurrency: Maximum number of concurrent requests used when describing task definitions, defaults to 10
+        :type max_concurrency: Optional[int]
+
+        :return: Dictionary of task definitions indexed by their ARN
+        """
+        max_concurrency = max_concurrency or AsyncClient.__max_concurrency__
+        status = ('INACTIVE', 'ACTIVE')[active]
+
+        if all_versions is False and by_family is True:
+            families = await AsyncIterator.iterate(
+                client=self.__client__,
+                method_name='list_task_definition_families',
+                data_key='families',
+                arguments={
+                    'status': status
+                }
+            )
+            results = await AsyncClient.__gather__([self.__describe_latest_task_definition__(family, status) for family in families], max_concurrency)
+
+            return {task_definition.get_arn(): task_definition for task_definition in results if task_definition is not None}
+
+        task_definition_arns = await AsyncIterator.iterate(
+            client=self.__client__,
+            method_name='list_task_definitions',
+            data_key='taskDefinitionArns',
+            arguments={
+                'status': status,
+                'sort': 'DESC'
+            }
+        )
+
+        if all_versions is False:
+            task_definition_arns = Client.__get_latest_task_definition_arns__(task_definition_arns)
+
+        results = await AsyncClient.__gather__(
+            [self.__describe_task_definition__(task_definition_arn, status) for task_definition_arn in task_definition_arns],
+            max_concurrency
+        )
+
+        return dict(zip(task_definition_arns, results))
+
+    async def describe_task_definition(self, task_definition_arn) -> TaskDefinition:
+        """
+        Describe a task definition, revisioned task definition ARNs are served from the task definition cache shared with the synchronous client
+
+        :param task_definition_arn: ARN of the task definition to describe
+        :type task_definition_arn: str
+
+        :return: Task definition object
+        """
+        return await self.__describe_task_definition__(task_definition_arn)
+
+    async def __describe_latest_task_definition__(self, family, status) -> Optional[TaskDefinition]:
+        """
+        Describe the most recent revision of a task definition family
+
+        :param family: The task definition family name
+        :type family: str
+
+        :param status: The task definition status to filter by (ACTIVE/INACTIVE)
+        :type status: str
+
+        :return: Task definition object, or None if the family has no revisions with the requested status
+        """
+        task_definition_arn = None
+        finder = Client.__find_latest_family_revision__(family, status)
+
+        try:
+            arguments = next(finder)
+
+            while True:
+                arguments = finder.send(await self.__client__.list_task_definitions(**arguments))
+        except StopIteration as stop:
+            task_definition_arn = stop.value
+
+        if task_definition_arn is None:
+            return None
+
+        return await self.__describe_task_definition__(task_definition_arn, status)
+
+    async def __describe_task_definition__(self, task_definition_arn, status=None) -> TaskDefinition:
+        """
+        Describe a task definition using the task definition cache shared with the synchronous client
+
+        :param task_definition_arn: ARN of the task definition to describe
+        :type task_definition_arn: str
+
+        :param status: Optional status the task definition is known to have, cached task definitions with a different status are refreshed
+        :type status: Optional[str]
+
+        :return: Task definition object
+        """
+        cached = Client.__get_cached_task_definition__(task_definition_arn, status)
+
+        if cached is None:
+            # A status observed by the caller must be re-checked against AWS, a cached response may still hold the previous status
+            with ResponseCache.bypass(status is not None):
+                result = await self.__client__.describe_task_definition(
+                    taskDefinition=task_definition_arn,
+                    include=['TAGS']
+                )
+
+            cached = Client.__set_cached_task_definition__(task_definition_arn, result)
+
+        return Client.__create_task_definition__(task_definition_arn, cached)
+
+    @staticmethod
+    async def __describe_batches__(function, arns, arns_key, max_count, arguments) -> List[dict]:
+        """
+        Describe resources in concurrent batches
+
+        :param function: The aiobotocore client method to call
+        :type function: Callable
+
+        :param arns: ARNs of the resources to describe
+        :type arns: List[str]
+
+        :param arns_key: The argument (and result) key containing the resources
+        :type arns_key: str
+
+        :param max_count: Maximum number of resources described by a single call
+        :type max_count: int
+
+        :param arguments: Additional arguments passed with every batch
+        :type arguments: dict
+
+        :return: List of described resource values
+        """
+        arns = list(arns)
+        batches = [arns[offset:offset + max_count] for offset in range(0, len(arns), max_count)]
+
+        results = await AsyncClient.__gather__([function(**arguments, **{arns_key: batch}) for batch in batches], AsyncClient.__max_concurrency__)
+
+        values = []
+
+        for result in results:
+            if arns_key not in result:
+                raise Exception('Unexpected result when describing {arns_key}, could not find expected "{arns_key}" key'.format(arns_key=arns_key))
+
+            values.extend(result[arns_key])
+
+        return values
+
+    @staticmethod
+    async def __gather__(coroutines, max_concurrency) -> list:
+        """
+        Run coroutines concurrently, no more than the maximum number at a time
+
+        :param coroutines: The coroutines to run
+        :type coroutines: List[Coroutine]
+
+        :param max_concurrency: Maximum number of coroutines running at once
+        :type max_concurrency: int
+
+        :return: List of results, in the same order as the coroutines
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(coroutine):
+            async with semaphore:
+                return await coroutine
+
+        return await asyncio.gather(*[run(coroutine) for coroutine in coroutines])
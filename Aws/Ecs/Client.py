@@ -1,11 +1,19 @@
+import re
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from Aws.Backoff import Backoff
 from Aws.BaseClient import BaseClient
+from Aws.Cache import Cache
 from Aws.Ecs.Cluster import Cluster
 from Aws.Ecs.EcsException import EcsException
 from Aws.Ecs.Service import Service
 from Aws.Ecs.Task import Task
 from Aws.Ecs.TaskDefinition import TaskDefinition
 from Aws.Iterator import Iterator
-from typing import Optional
+from Aws.ResponseCache import ResponseCache
+from time import sleep, time
+from typing import Dict, Generator, List, Optional
 
 from Aws.Lambda.Log import Log
 
@@ -16,6 +24,23 @@ class Client(BaseClient):
     """
     __client_identifier__ = 'ecs'
 
+    # Maximum number of tasks that can be started by a single run task request
+    __run_task_max_count__ = 10
+
+    # Maximum number of clusters/services/tasks that can be described by a single describe request
+    __describe_clusters_max_count__ = 100
+    __describe_services_max_count__ = 10
+    __describe_tasks_max_count__ = 100
+
+    # Task lifecycle statuses in the order they are transitioned through
+    __task_statuses__ = ('PROVISIONING', 'PENDING', 'ACTIVATING', 'RUNNING', 'DEACTIVATING', 'STOPPING', 'DEPROVISIONING', 'STOPPED')
+
+    # Process wide cache of revisioned task definitions indexed by their ARN
+    __task_definition_cache__ = Cache(max_size=1024)
+
+    # Fully qualified task definition ARN including revision number
+    __revisioned_arn_pattern__ = re.compile(r'^arn:[^:]+:ecs:[^:]+:[0-9]+:task-definition/[^:]+:[0-9]+$')
+
     def __init__(self, credential, region_name):
         """
         Setup an ECS client
@@ -78,6 +103,49 @@ class Client(BaseClient):
 
         return cluster
 
+    def list_cluster_arns(self) -> List[str]:
+        """
+        List the ARNs of all ECS clusters available
+
+        :return: List of ECS cluster ARNs
+        """
+        return Iterator.iterate(
+            client=self.__client__,
+            method_name='list_clusters',
+            data_key='clusterArns'
+        )
+
+    def describe_clusters(self, cluster_arns) -> Dict[str, Cluster]:
+        """
+        Describe multiple clusters, requests are batched into the maximum number of clusters supported by each API call
+
+        :param cluster_arns: ARNs of the clusters to describe
+        :type cluster_arns: List[str]
+
+        :return: Dictionary of Cluster objects indexed by their ARN, clusters that could not be found are omitted
+        """
+        clusters = {}
+        cluster_arns = list(cluster_arns)
+
+        for offset in range(0, len(cluster_arns), Client.__describe_clusters_max_count__):
+            result = Backoff.call(
+                function=self.__client__.describe_clusters,
+                arguments={
+                    'clusters': cluster_arns[offset:offset + Client.__describe_clusters_max_count__],
+                    'include': ['ATTACHMENTS', 'SETTINGS', 'STATISTICS', 'TAGS']
+                }
+            )
+
+            if 'clusters' not in result:
+                raise Exception('Unexpected result when describing clusters, could not find expected "clusters" key')
+
+            for cluster_values in result['clusters']:
+                cluster = Cluster(cluster_values['clusterArn'])
+                cluster.set_values(cluster_values)
+                clusters[cluster.get_arn()] = cluster
+
+        return clusters
+
     def list_services(self, cluster_arn) -> dict:
         """
         List all ECS services available
@@ -140,6 +208,59 @@ class Client(BaseClient):
 
         return service
 
+    def list_service_arns(self, cluster_arn) -> List[str]:
+        """
+        List the ARNs of all ECS services in the specified cluster
+
+        :param cluster_arn: The ARN of ECS cluster whose service you want to list
+        :type cluster_arn: str
+
+        :return: List of ECS service ARNs
+        """
+        return Iterator.iterate(
+            client=self.__client__,
+            method_name='list_services',
+            data_key='serviceArns',
+            arguments={
+                'cluster': cluster_arn
+            }
+        )
+
+    def describe_services(self, cluster_arn, service_arns) -> Dict[str, Service]:
+        """
+        Describe multiple services, requests are batched into the maximum number of services supported by each API call
+
+        :param cluster_arn: ARN of the cluster that hosts the services
+        :type cluster_arn: str
+
+        :param service_arns: ARNs of the services to describe
+        :type service_arns: List[str]
+
+        :return: Dictionary of Service objects indexed by their ARN, services that could not be found are omitted
+        """
+        services = {}
+        service_arns = list(service_arns)
+
+        for offset in range(0, len(service_arns), Client.__describe_services_max_count__):
+            result = Backoff.call(
+                function=self.__client__.describe_services,
+                arguments={
+                    'cluster': cluster_arn,
+                    'services': service_arns[offset:offset + Client.__describe_services_max_count__],
+                    'include': ['TAGS']
+                }
+            )
+
+            if 'services' not in result:
+                raise Exception('Unexpected result when describing services, could not find expected "services" key')
+
+            for service_values in result['services']:
+                service = Service(service_values['serviceArn'])
+                service.set_values(service_values)
+                services[service.get_arn()] = service
+
+        return services
+
     def list_tasks(self, cluster_arn) -> dict:
         """
         List all ECS tasks available in the specified cluster
@@ -203,7 +324,149 @@ class Client(BaseClient):
 
         return task
 
-    def list_task_definitions(self, active=True, all_versions=False) -> dict:
+    def list_task_arns(self, cluster_arn, service_name=None) -> List[str]:
+        """
+        List the ARNs of all ECS tasks in the specified cluster
+
+        :param cluster_arn: ARN of the cluster
+        :type cluster_arn: str
+
+        :param service_name: Optional name of the service whose tasks should be listed
+        :type service_name: Optional[str]
+
+        :return: List of ECS task ARNs
+        """
+        arguments = {
+            'cluster': cluster_arn
+        }
+
+        if service_name is not None:
+            arguments['serviceName'] = service_name
+
+        return Iterator.iterate(
+            client=self.__client__,
+            method_name='list_tasks',
+            data_key='taskArns',
+            arguments=arguments
+        )
+
+    def describe_tasks(self, cluster_arn, task_arns) -> Dict[str, Task]:
+        """
+        Describe multiple tasks, requests are batched into the maximum number of tasks supported by each API call
+
+        :param cluster_arn: ARN of the cluster that hosts the tasks
+        :type cluster_arn: str
+
+        :param task_arns: ARNs of the tasks to describe
+        :type task_arns: List[str]
+
+        :return: Dictionary of Task objects indexed by their ARN, tasks that could not be found are omitted
+        """
+        tasks = {}
+        task_arns = list(task_arns)
+
+        for offset in range(0, len(task_arns), Client.__describe_tasks_max_count__):
+            result = Backoff.call(
+                function=self.__client__.describe_tasks,
+                arguments={
+                    'cluster': cluster_arn,
+                    'tasks': task_arns[offset:offset + Client.__describe_tasks_max_count__],
+                    'include': ['TAGS']
+                }
+            )
+
+            if 'tasks' not in result:
+                raise Exception('Unexpected result when describing tasks, could not find expected "tasks" key')
+
+            for task_values in result['tasks']:
+                task = Task(task_values['taskArn'])
+                task.set_values(task_values)
+                tasks[task.get_arn()] = task
+
+        return tasks
+
+    def wait_for_tasks(self, cluster_arn, task_arns, desired_status='STOPPED', timeout=600, delay=2.0, max_delay=30.0) -> Generator[dict, None, None]:
+        """
+        Wait for a set of tasks to reach the desired status, yielding each status transition as it is observed. Tasks are polled in batches, tasks
+        that have reached (or passed) the desired status are no longer polled, and the polling delay is doubled (up to the maximum delay) every
+        time a poll observes no transitions
+
+        :param cluster_arn: ARN of the cluster that hosts the tasks
+        :type cluster_arn: str
+
+        :param task_arns: ARNs of the tasks to wait for
+        :type task_arns: List[str]
+
+        :param desired_status: The task status to wait for (e.g. RUNNING or STOPPED)
+        :type desired_status: str
+
+        :param timeout: Maximum number of seconds to wait
+        :type timeout: float
+
+        :param delay: Initial number of seconds between polls
+        :type delay: float
+
+        :param max_delay: Maximum number of seconds between polls
+        :type max_delay: float
+
+        :return: Generator of dictionaries containing the "task_arn", "previous_status", "status" and "task" (Task object, or None if the task
+                 could not be found in which case the status will be MISSING)
+
+        :raises EcsException: if the desired status is unknown or the tasks do not reach the desired status before the timeout expires
+        """
+        if desired_status not in Client.__task_statuses__:
+            raise EcsException('Unknown ECS task status requested ({desired_status}), value must be one of "{statuses}"'.format(
+                desired_status=desired_status,
+                statuses='", "'.join(Client.__task_statuses__)
+            ))
+
+        desired_index = Client.__task_statuses__.index(desired_status)
+        pending = {task_arn: None for task_arn in task_arns}
+        poll_delay = delay
+        deadline = time() + timeout
+
+        while len(pending) > 0:
+            # Every poll must observe the current status, never a cached response
+            with ResponseCache.bypass():
+                tasks = self.describe_tasks(cluster_arn=cluster_arn, task_arns=pending.keys())
+            transitioned = False
+
+            for task_arn in list(pending.keys()):
+                task = tasks.get(task_arn)
+                status = task.get('lastStatus') if task is not None else 'MISSING'
+
+                if status == pending[task_arn]:
+                    continue
+
+                transitioned = True
+
+                yield {
+                    'task_arn': task_arn,
+                    'previous_status': pending[task_arn],
+                    'status': status,
+                    'task': task
+                }
+
+                if status not in Client.__task_statuses__ or Client.__task_statuses__.index(status) >= desired_index:
+                    del pending[task_arn]
+                else:
+                    pending[task_arn] = status
+
+            if len(pending) == 0:
+                break
+
+            if time() + poll_delay > deadline:
+                raise EcsException('Timed out waiting for {count} ECS tasks to reach {desired_status} status'.format(
+                    count=len(pending),
+                    desired_status=desired_status
+                ))
+
+            sleep(poll_delay)
+
+            # Back off while nothing is changing, but poll quickly again once tasks start moving
+            poll_delay = delay if transitioned is True else min(max_delay, poll_delay * 2)
+
+    def list_task_definitions(self, active=True, all_versions=False, by_family=False, max_workers=10) -> dict:
         """
         List all available task definitions
 
@@ -213,10 +476,20 @@ class Client(BaseClient):
         :param all_versions: If TRUE all versions of the task definition will be returned, otherwise only the most recent revision will be returned
         :type all_versions: bool
 
+        :param by_family: If TRUE (and all_versions is FALSE) the task definition families will be enumerated and only the most recent revision of each
+                          family will be retrieved, rather than iterating every revision in the account
+        :type by_family: bool
+
+        :param max_workers: Maximum number of concurrent requests used when retrieving task definitions by family
+        :type max_workers: int
+
         :return: Dictionary of task definitions indexed by their ARN, or None if none found
         """
         status = ('INACTIVE', 'ACTIVE')[active]
 
+        if all_versions is False and by_family is True:
+            return self.__list_latest_task_definitions_by_family__(status=status, max_workers=max_workers)
+
         Log.trace('Starting iteration of {status} ECS task definitions...'.format(status=status))
         task_definition_arns = Iterator.iterate(
             client=self.__client__,
@@ -231,62 +504,289 @@ class Client(BaseClient):
         # Prune to only most recent version
         if all_versions is False:
             Log.trace('Pruning task definition list to include most recent versions only...')
-            highest_versions = {}
+            task_definition_arns = Client.__get_latest_task_definition_arns__(task_definition_arns)
 
-            for task_definition_arn in task_definition_arns:
-                task_definition_arn_split = str(task_definition_arn).split(':')
-                split_count = len(task_definition_arn_split)
+        task_definitions = {}
 
-                task_definition_version = int(task_definition_arn_split[split_count - 1])
-                task_definition_identifier = task_definition_arn_split[split_count - 2]
+        for task_definition_arn in task_definition_arns:
+            Log.trace('Describing ECS task definition: {task_definition_arn}'.format(task_definition_arn=task_definition_arn))
+            task_definition = self.__describe_task_definition__(task_definition_arn=task_definition_arn, status=status)
+            task_definitions[task_definition_arn] = task_definition
 
-                # If we've already seen this task definition, check if it is the highest version
-                if task_definition_identifier in highest_versions.keys():
-                    if highest_versions[task_definition_identifier]['version'] > task_definition_version:
-                        # Already found a more recent version- skip this one
-                        continue
+        # Prune to return only the latest version
+        return task_definitions
 
-                # Update the highest version number for this task definition
-                highest_versions[task_definition_identifier] = {
-                    'version': int(task_definition_version),
-                    'arn': task_definition_arn
-                }
+    @staticmethod
+    def __get_latest_task_definition_arns__(task_definition_arns) -> List[str]:
+        """
+        Prune a list of task definition ARNs to the most recent revision of each task definition, shared by the synchronous and asyncio clients
+
+        :param task_definition_arns: Task definition ARNs
+        :type task_definition_arns: List[str]
+
+        :return: List of the most recent task definition ARNs
+        """
+        highest_versions = {}
+
+        for task_definition_arn in task_definition_arns:
+            task_definition_arn_split = str(task_definition_arn).split(':')
+            split_count = len(task_definition_arn_split)
+
+            task_definition_version = int(task_definition_arn_split[split_count - 1])
+            task_definition_identifier = task_definition_arn_split[split_count - 2]
+
+            # If we've already seen this task definition, check if it is the highest version
+            if task_definition_identifier in highest_versions.keys():
+                if highest_versions[task_definition_identifier]['version'] > task_definition_version:
+                    # Already found a more recent version- skip this one
+                    continue
+
+            # Update the highest version number for this task definition
+            highest_versions[task_definition_identifier] = {
+                'version': int(task_definition_version),
+                'arn': task_definition_arn
+            }
+
+        return [highest_version['arn'] for highest_version in highest_versions.values()]
+
+    def __list_latest_task_definitions_by_family__(self, status, max_workers) -> dict:
+        """
+        List the most recent revision of every task definition family
 
-            task_definition_arns.clear()
+        :param status: The task definition status to filter by (ACTIVE/INACTIVE)
+        :type status: str
 
-            for task_definition_identifier, highest_version in highest_versions.items():
-                task_definition_arns.append(highest_version['arn'])
+        :param max_workers: Maximum number of concurrent requests
+        :type max_workers: int
+
+        :return: Dictionary of task definitions indexed by their ARN
+        """
+        Log.trace('Starting iteration of {status} ECS task definition families...'.format(status=status))
+        families = Iterator.iterate(
+            client=self.__client__,
+            method_name='list_task_definition_families',
+            data_key='families',
+            arguments={
+                'status': status
+            }
+        )
 
         task_definitions = {}
 
-        for task_definition_arn in task_definition_arns:
-            Log.trace('Describing ECS task definition: {task_definition_arn}'.format(task_definition_arn=task_definition_arn))
-            task_definition = self.describe_task_definition(task_definition_arn=task_definition_arn)
-            task_definitions[task_definition_arn] = task_definition
+        if len(families) == 0:
+            return task_definitions
+
+        Log.trace('Describing most recent revision of {count} ECS task definition families...'.format(count=len(families)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self.__describe_latest_task_definition__, family, status) for family in families]
+
+            for future in futures:
+                task_definition = future.result()
+
+                if task_definition is not None:
+                    task_definitions[task_definition.get_arn()] = task_definition
 
-        # Prune to return only the latest version
         return task_definitions
 
-    def describe_task_definition(self, task_definition_arn) -> TaskDefinition:
+    def __describe_latest_task_definition__(self, family, status) -> Optional[TaskDefinition]:
+        """
+        Describe the most recent revision of a task definition family
+
+        :param family: The task definition family name
+        :type family: str
+
+        :param status: The task definition status to filter by (ACTIVE/INACTIVE)
+        :type status: str
+
+        :return: Task definition object, or None if the family has no revisions with the requested status
+        """
+        task_definition_arn = None
+        finder = Client.__find_latest_family_revision__(family, status)
+
+        try:
+            arguments = next(finder)
+
+            while True:
+                arguments = finder.send(self.__client__.list_task_definitions(**arguments))
+        except StopIteration as stop:
+            task_definition_arn = stop.value
+
+        if task_definition_arn is None:
+            return None
+
+        return self.__describe_task_definition__(task_definition_arn=task_definition_arn, status=status)
+
+    @staticmethod
+    def __find_latest_family_revision__(family, status) -> Generator[dict, dict, Optional[str]]:
+        """
+        Find the ARN of the most recent revision of a task definition family, shared by the synchronous and asyncio clients. The generator
+        yields the arguments of each list task definitions request, the caller sends back each result until the generator returns the ARN
+
+        :param family: The task definition family name
+        :type family: str
+
+        :param status: The task definition status to filter by (ACTIVE/INACTIVE)
+        :type status: str
+
+        :return: Generator of request arguments, returning the task definition ARN or None if the family has no revisions with the status
+        """
+        arguments = {
+            'familyPrefix': family,
+            'status': status,
+            'sort': 'DESC'
+        }
+
+        # The family prefix filter also matches longer family names (sorted ahead of this one in descending order), so keep paging until we
+        # find a revision belonging to this exact family
+        while True:
+            result = yield dict(arguments)
+
+            for task_definition_arn in result.get('taskDefinitionArns', []):
+                task_definition_family = str(task_definition_arn).split('/')[-1].rsplit(':', 1)[0]
+
+                if task_definition_family == family:
+                    return task_definition_arn
+
+            if result.get('nextToken') is None:
+                return None
+
+            arguments['nextToken'] = result['nextToken']
+
+    def describe_task_definition(self, task_definition_arn, refresh_tags=False) -> TaskDefinition:
         """
-        Describe a task definition
+        Describe a task definition, revisioned task definition ARNs are served from the task definition cache where possible
 
         :param task_definition_arn: ARN of the task definition to describe
         :type task_definition_arn: str
 
+        :param refresh_tags: If TRUE the tags of a cached task definition will be refreshed from the API
+        :type refresh_tags: bool
+
         :return: Task definition object
         """
-        result = self.__client__.describe_task_definition(
-            taskDefinition=task_definition_arn,
-            include=['TAGS']
-        )
+        return self.__describe_task_definition__(task_definition_arn=task_definition_arn, refresh_tags=refresh_tags)
+
+    @staticmethod
+    def set_task_definition_cache(cache) -> None:
+        """
+        Set the process wide cache used to store revisioned task definitions, e.g. Cache(path='/tmp/ecs-task-definitions') to share task
+        definitions between processes
+
+        :param cache: The cache to use, or None to disable caching
+        :type cache: Optional[Cache]
+        """
+        Client.__task_definition_cache__ = cache
+
+    def __describe_task_definition__(self, task_definition_arn, refresh_tags=False, status=None) -> TaskDefinition:
+        """
+        Describe a task definition using the task definition cache
+
+        :param task_definition_arn: ARN of the task definition to describe
+        :type task_definition_arn: str
+
+        :param refresh_tags: If TRUE the tags of a cached task definition will be refreshed from the API
+        :type refresh_tags: bool
+
+        :param status: Optional status the task definition is known to have, cached task definitions with a different status are refreshed
+        :type status: Optional[str]
+
+        :return: Task definition object
+        """
+        cached = Client.__get_cached_task_definition__(task_definition_arn, status)
+
+        if cached is None:
+            # A status observed by the caller must be re-checked against AWS, a cached response may still hold the previous status
+            with ResponseCache.bypass(status is not None):
+                result = self.__client__.describe_task_definition(
+                    taskDefinition=task_definition_arn,
+                    include=['TAGS']
+                )
+
+            cached = Client.__set_cached_task_definition__(task_definition_arn, result)
+        elif refresh_tags is True:
+            with ResponseCache.bypass():
+                tags = self.__client__.list_tags_for_resource(resourceArn=task_definition_arn).get('tags', [])
+
+            cached = {
+                'taskDefinition': cached['taskDefinition'],
+                'tags': tags
+            }
+            Client.__task_definition_cache__.set(task_definition_arn, cached)
+
+        return Client.__create_task_definition__(task_definition_arn, cached)
+
+    @staticmethod
+    def __get_cached_task_definition__(task_definition_arn, status=None) -> Optional[dict]:
+        """
+        Retrieve a task definition from the task definition cache, shared by the synchronous and asyncio clients
+
+        :param task_definition_arn: ARN of the task definition
+        :type task_definition_arn: str
+
+        :param status: Optional status the task definition is known to have, cached task definitions with a different status are ignored
+        :type status: Optional[str]
+
+        :return: Dictionary containing the "taskDefinition" values and its "tags", or None if the task definition is not cached
+        """
+        cache = Client.__task_definition_cache__
+
+        # Only fully qualified revisioned ARNs are immutable, anything else (e.g. a family name) may resolve to a different revision over time
+        if cache is None or Client.__revisioned_arn_pattern__.match(str(task_definition_arn)) is None:
+            return None
+
+        cached = cache.get(task_definition_arn)
 
+        # The status (and deregistration time) is the only part of a revision that can change
+        if cached is not None and status is not None and cached['taskDefinition'].get('status') != status:
+            return None
+
+        return cached
+
+    @staticmethod
+    def __set_cached_task_definition__(task_definition_arn, result) -> dict:
+        """
+        Store the result of a describe task definition request in the task definition cache, shared by the synchronous and asyncio clients
+
+        :param task_definition_arn: ARN of the described task definition
+        :type task_definition_arn: str
+
+        :param result: The describe task definition result
+        :type result: dict
+
+        :return: Dictionary containing the "taskDefinition" values and its "tags"
+
+        :raises Exception: if the result does not contain a task definition
+        """
         if 'taskDefinition' not in result:
             raise Exception('Unexpected result when describing task definition ({arn}), '
                             'could not find expected "taskDefinition" key'.format(arn=task_definition_arn))
 
+        cached = {
+            'taskDefinition': result['taskDefinition'],
+            'tags': result.get('tags', [])
+        }
+
+        if Client.__task_definition_cache__ is not None and 'taskDefinitionArn' in result['taskDefinition']:
+            Client.__task_definition_cache__.set(result['taskDefinition']['taskDefinitionArn'], cached)
+
+        return cached
+
+    @staticmethod
+    def __create_task_definition__(task_definition_arn, cached) -> TaskDefinition:
+        """
+        Create a task definition object from a task definition cache entry
+
+        :param task_definition_arn: ARN of the task definition
+        :type task_definition_arn: str
+
+        :param cached: Dictionary containing the "taskDefinition" values and its "tags"
+        :type cached: dict
+
+        :return: Task definition object
+        """
         task_definition = TaskDefinition(task_definition_arn)
-        task_definition.set_values(result['taskDefinition'])
+        task_definition.set_values(cached['taskDefinition'])
+        task_definition.set_values({'tags': cached['tags']}, erase=False)
 
         return task_definition
 
@@ -328,6 +828,217 @@ class Client(BaseClient):
         :param count: The number of tasks to run (defaults to 1)
         :type count: int
         """
+        arguments = self.__get_run_task_arguments__(
+            task_definition=task_definition,
+            cluster=cluster,
+            launch_type=launch_type,
+            overrides=overrides,
+            subnet_ids=subnet_ids,
+            security_group_ids=security_group_ids,
+            assign_public_ip=assign_public_ip
+        )
+        arguments['count'] = count
+
+        return self.__client__.run_task(**arguments)
+
+    def run_tasks(
+            self,
+            task_definition,
+            cluster,
+            launch_type,
+            overrides=None,
+            overrides_list=None,
+            subnet_ids=None,
+            security_group_ids=None,
+            assign_public_ip=False,
+            count=1,
+            max_workers=10,
+            max_attempts=5
+    ) -> dict:
+        """
+        Start a large number of ECS tasks using the specific task definition. Launches are split into requests of no more than 10 tasks which are
+        executed concurrently, throttled requests are retried with exponential backoff
+
+        :param task_definition: The task definition to be executed
+        :type task_definition: TaskDefinition
+
+        :param cluster: The ECS cluster in which the tasks should be started
+        :type cluster: Cluster
+
+        :param launch_type: The ECS launch type (FARGATE/EC2)
+        :type launch_type: str
+
+        :param overrides: Dictionary containing container overrides applied to all tasks (if any)
+        :type overrides: Optional[dict]
+
+        :param overrides_list: Optional list of override dictionaries, if supplied "count" tasks will be started for each set of overrides. Each
+                               set is merged over the shared "overrides", container overrides are merged by container name
+        :type overrides_list: Optional[List[dict]]
+
+        :param subnet_ids: Optional list of subnet IDs (required for task definitions that use 'awsvpc' network mode)
+        :type subnet_ids: Optional[List]
+
+        :param security_group_ids: Optional list of security group IDs (required for task definitions that use 'awsvpc' network mode)
+        :type security_group_ids: Optional[List]
+
+        :param assign_public_ip: Optional flag indicating the task should receive a public IP address (required for task definitions that use 'awsvpc' network mode)
+        :type assign_public_ip: Optional[bool]
+
+        :param count: The number of tasks to run for each set of overrides (defaults to 1)
+        :type count: int
+
+        :param max_workers: Maximum number of concurrent run task requests
+        :type max_workers: int
+
+        :param max_attempts: Maximum number of attempts for each throttled run task request
+        :type max_attempts: int
+
+        :return: Dictionary containing the started tasks ("tasks", dictionary of Task objects indexed by their ARN) and any failures ("failures",
+                 list of dictionaries containing the "reason", optional "detail" and "arn" reported by ECS, the number of tasks that were not
+                 started "count" and the "overrides" they were started with)
+        """
+        if overrides_list is None:
+            overrides_list = [None]
+
+        # Validate the launch configuration once up front rather than failing in every request
+        base_arguments = self.__get_run_task_arguments__(
+            task_definition=task_definition,
+            cluster=cluster,
+            launch_type=launch_type,
+            overrides=None,
+            subnet_ids=subnet_ids,
+            security_group_ids=security_group_ids,
+            assign_public_ip=assign_public_ip
+        )
+
+        requests = []
+
+        for request_overrides in overrides_list:
+            remaining = count
+
+            while remaining > 0:
+                arguments = dict(base_arguments)
+                arguments['overrides'] = Client.__merge_overrides__(overrides, request_overrides)
+                arguments['count'] = min(remaining, Client.__run_task_max_count__)
+                requests.append(arguments)
+                remaining = remaining - arguments['count']
+
+        Log.trace('Starting {count} ECS tasks using {requests} run task requests...'.format(count=count * len(overrides_list), requests=len(requests)))
+
+        tasks = {}
+        failures = []
+
+        if len(requests) == 0:
+            return {'tasks': tasks, 'failures': failures}
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {}
+
+            for arguments in requests:
+                future = executor.submit(Backoff.call, self.__client__.run_task, arguments, max_attempts)
+                futures[future] = arguments
+
+            for future in as_completed(futures):
+                arguments = futures[future]
+
+                try:
+                    result = future.result()
+                except Exception as run_exception:
+                    Log.error('Failed to start {count} ECS tasks: {run_exception}'.format(count=arguments['count'], run_exception=run_exception))
+                    failures.append({
+                        'reason': str(run_exception),
+                        'detail': None,
+                        'arn': None,
+                        'count': arguments['count'],
+                        'overrides': arguments['overrides']
+                    })
+                    continue
+
+                for task_values in result.get('tasks', []):
+                    task = Task(task_values['taskArn'])
+                    task.set_values(task_values)
+                    tasks[task.get_arn()] = task
+
+                # ECS reports a failure for each task it could not place
+                for failure in result.get('failures', []):
+                    failures.append({
+                        'reason': failure.get('reason'),
+                        'detail': failure.get('detail'),
+                        'arn': failure.get('arn'),
+                        'count': 1,
+                        'overrides': arguments['overrides']
+                    })
+
+        return {'tasks': tasks, 'failures': failures}
+
+    @staticmethod
+    def __merge_overrides__(overrides, request_overrides) -> dict:
+        """
+        Merge the overrides of a single run task request over the overrides shared by all requests. Values of the request overrides take
+        precedence, container overrides are merged by container name
+
+        :param overrides: Overrides shared by all requests
+        :type overrides: Optional[dict]
+
+        :param request_overrides: Overrides of the request
+        :type request_overrides: Optional[dict]
+
+        :return: Merged overrides
+        """
+        merged = dict(overrides or {})
+
+        for key, value in (request_overrides or {}).items():
+            if key != 'containerOverrides' or 'containerOverrides' not in merged:
+                merged[key] = value
+                continue
+
+            container_overrides = {container['name']: dict(container) for container in merged['containerOverrides']}
+
+            for container in value:
+                container_overrides[container['name']] = {**container_overrides.get(container['name'], {}), **container}
+
+            merged['containerOverrides'] = list(container_overrides.values())
+
+        return merged
+
+    def __get_run_task_arguments__(
+            self,
+            task_definition,
+            cluster,
+            launch_type,
+            overrides=None,
+            subnet_ids=None,
+            security_group_ids=None,
+            assign_public_ip=False
+    ) -> dict:
+        """
+        Validate the task launch configuration and build the arguments for a run task request
+
+        :param task_definition: The task definition to be executed
+        :type task_definition: TaskDefinition
+
+        :param cluster: The ECS cluster in which the task should be started
+        :type cluster: Cluster
+
+        :param launch_type: The ECS launch type (FARGATE/EC2)
+        :type launch_type: str
+
+        :param overrides: Dictionary containing container overrides (if any)
+        :type overrides: Optional[dict]
+
+        :param subnet_ids: Optional list of subnet IDs (required for task definitions that use 'awsvpc' network mode)
+        :type subnet_ids: Optional[List]
+
+        :param security_group_ids: Optional list of security group IDs (required for task definitions that use 'awsvpc' network mode)
+        :type security_group_ids: Optional[List]
+
+        :param assign_public_ip: Optional flag indicating the task should receive a public IP address (required for task definitions that use 'awsvpc' network mode)
+        :type assign_public_ip: Optional[bool]
+
+        :return: Dictionary of run task arguments (excluding the task count)
+
+        :raises EcsException: on invalid launch configuration
+        """
         if launch_type not in ('FARGATE', 'EC2'):
             raise EcsException('Unknown ECS launch type requested ({launch_type}), value must be one of "FARGATE" or "EC2"'.format(launch_type=launch_type))
 
@@ -357,12 +1068,14 @@ class Client(BaseClient):
         if overrides is None:
             overrides = {}
 
-        return self.__client__.run_task(
-            cluster=cluster.get_arn(),
-            taskDefinition = task_definition.get_arn(),
-            launchType=launch_type,
-            count=count,
-            platformVersion=platform_version,
-            networkConfiguration=network_configuration,
-            overrides=overrides
-        )
+        arguments = {
+            'cluster': cluster.get_arn(),
+            'taskDefinition': task_definition.get_arn(),
+            'launchType': launch_type,
+            'platformVersion': platform_version,
+            'networkConfiguration': network_configuration,
+            'overrides': overrides
+        }
+
+        # Boto3 rejects explicit None values, omit any optional arguments that are not required for this launch type
+        return {key: value for key, value in arguments.items() if value is not None}
@@ -0,0 +1,249 @@
+from typing import Dict
+
+from Aws.Ecs.Cluster import Cluster
+from Aws.Ecs.Service import Service
+from Aws.Ecs.Task import Task
+from Aws.Lambda.Log import Log
+from Aws.ResponseCache import ResponseCache
+
+
+class Inventory:
+    """
+    Incrementally refreshed inventory of ECS clusters, services and tasks. Each refresh describes clusters and services in batches and compares
+    them to the previous snapshot, tasks are only re-fetched for services that have changed. Standalone tasks (e.g. those started by run_task)
+    are not covered by any service, so the tasks of every cluster are listed on each refresh and those not belonging to a service are described
+    """
+    def __init__(self, client):
+        """
+        Initialize inventory
+
+        :param client: The ECS client used to retrieve the inventory
+        :type client: Client
+        """
+        self.__ecs_client__ = client
+        self.__clusters__ = {}
+        self.__services__ = {}
+        self.__service_fingerprints__ = {}
+        self.__tasks__ = {}
+
+    def refresh(self) -> dict:
+        """
+        Refresh the inventory and return the differences from the previous snapshot
+
+        :return: Dictionary of "clusters", "services" and "tasks", each containing lists of "added", "removed" and "changed" ARNs. Clusters are
+                 changed when their status, settings, capacity providers or task, service and container instance counts change
+        """
+        diff = {
+            'clusters': {'added': [], 'removed': [], 'changed': []},
+            'services': {'added': [], 'removed': [], 'changed': []},
+            'tasks': {'added': [], 'removed': [], 'changed': []}
+        }
+
+        # Every refresh must observe the current state, never cached responses
+        with ResponseCache.bypass():
+            Log.trace('Refreshing ECS clusters...')
+            clusters = self.__ecs_client__.describe_clusters(self.__ecs_client__.list_cluster_arns())
+            Inventory.__diff_keys__(self.__clusters__, clusters, diff['clusters'], Inventory.__is_cluster_changed__)
+
+            services = {}
+            service_fingerprints = {}
+            tasks = {}
+
+            for cluster_arn in clusters.keys():
+                Log.trace('Refreshing ECS services in cluster ({cluster_arn})...'.format(cluster_arn=cluster_arn))
+                cluster_services = self.__ecs_client__.describe_services(
+                    cluster_arn=cluster_arn,
+                    service_arns=self.__ecs_client__.list_service_arns(cluster_arn)
+                )
+
+                for service_arn, service in cluster_services.items():
+                    services[service_arn] = service
+                    service_fingerprints[service_arn] = Inventory.__get_service_fingerprint__(service)
+
+                    # Unchanged services keep their previous tasks without any further API calls
+                    if self.__service_fingerprints__.get(service_arn) == service_fingerprints[service_arn]:
+                        tasks[service_arn] = self.__tasks__.get(service_arn, {})
+                        continue
+
+                    if service_arn in self.__services__:
+                        diff['services']['changed'].append(service_arn)
+                    else:
+                        diff['services']['added'].append(service_arn)
+
+                    Log.trace('Refreshing ECS tasks for service ({service_arn})...'.format(service_arn=service_arn))
+                    tasks[service_arn] = self.__ecs_client__.describe_tasks(
+                        cluster_arn=cluster_arn,
+                        task_arns=self.__ecs_client__.list_task_arns(cluster_arn=cluster_arn, service_name=service.get('serviceName'))
+                    )
+
+                Log.trace('Refreshing standalone ECS tasks in cluster ({cluster_arn})...'.format(cluster_arn=cluster_arn))
+                tasks[cluster_arn] = self.__describe_standalone_tasks__(cluster_arn, {service_arn: tasks[service_arn] for service_arn in cluster_services})
+
+            diff['services']['removed'] = [service_arn for service_arn in self.__services__.keys() if service_arn not in services]
+
+            for service_arn in set(self.__tasks__.keys()) | set(tasks.keys()):
+                Inventory.__diff_keys__(self.__tasks__.get(service_arn, {}), tasks.get(service_arn, {}), diff['tasks'], Inventory.__is_task_changed__)
+
+        self.__clusters__ = clusters
+        self.__services__ = services
+        self.__service_fingerprints__ = service_fingerprints
+        self.__tasks__ = tasks
+
+        return diff
+
+    def get_clusters(self) -> Dict[str, Cluster]:
+        """
+        Return the clusters in the current snapshot
+
+        :return: Dictionary of Cluster objects indexed by their ARN
+        """
+        return self.__clusters__
+
+    def get_services(self) -> Dict[str, Service]:
+        """
+        Return the services in the current snapshot
+
+        :return: Dictionary of Service objects indexed by their ARN
+        """
+        return self.__services__
+
+    def get_tasks(self, service_arn=None) -> Dict[str, Task]:
+        """
+        Return the tasks in the current snapshot
+
+        :param service_arn: Optional service ARN, if supplied only tasks belonging to this service will be returned. Supply a cluster ARN to
+                            return only the standalone tasks of that cluster
+        :type service_arn: Optional[str]
+
+        :return: Dictionary of Task objects indexed by their ARN
+        """
+        if service_arn is not None:
+            return self.__tasks__.get(service_arn, {})
+
+        tasks = {}
+
+        for service_tasks in self.__tasks__.values():
+            tasks.update(service_tasks)
+
+        return tasks
+
+    def __describe_standalone_tasks__(self, cluster_arn, service_tasks) -> Dict[str, Task]:
+        """
+        Describe the tasks of a cluster that do not belong to any of its services
+
+        :param cluster_arn: ARN of the cluster
+        :type cluster_arn: str
+
+        :param service_tasks: Tasks of each service in the cluster indexed by service ARN
+        :type service_tasks: Dict[str, Dict[str, Task]]
+
+        :return: Dictionary of Task objects indexed by their ARN
+        """
+        service_task_arns = set()
+
+        for tasks in service_tasks.values():
+            service_task_arns.update(tasks.keys())
+
+        task_arns = [task_arn for task_arn in self.__ecs_client__.list_task_arns(cluster_arn=cluster_arn) if task_arn not in service_task_arns]
+        tasks = self.__ecs_client__.describe_tasks(cluster_arn=cluster_arn, task_arns=task_arns)
+
+        # Tasks started by a service since its tasks were last refreshed are picked up once the service itself changes
+        return {task_arn: task for task_arn, task in tasks.items() if str(task.get('group') or '').startswith('service:') is False}
+
+    @staticmethod
+    def __get_service_fingerprint__(service) -> tuple:
+        """
+        Build a value summarising the parts of a service that indicate its tasks may have changed
+
+        :param service: The service
+        :type service: Service
+
+        :return: Service fingerprint
+        """
+        deployments = []
+
+        for deployment in service.get('deployments') or []:
+            deployments.append((deployment.get('id'), deployment.get('status'), str(deployment.get('updatedAt'))))
+
+        return (
+            service.get('taskDefinition'),
+            service.get('desiredCount'),
+            service.get('runningCount'),
+            service.get('pendingCount'),
+            tuple(sorted(deployments))
+        )
+
+    @staticmethod
+    def __is_cluster_changed__(previous, current) -> bool:
+        """
+        Check if a cluster has changed between snapshots
+
+        :param previous: The cluster in the previous snapshot
+        :type previous: Cluster
+
+        :param current: The cluster in the current snapshot
+        :type current: Cluster
+
+        :return: True if the cluster has changed
+        """
+        keys = (
+            'status',
+            'registeredContainerInstancesCount',
+            'runningTasksCount',
+            'pendingTasksCount',
+            'activeServicesCount',
+            'capacityProviders',
+            'settings'
+        )
+
+        for key in keys:
+            if previous.get(key) != current.get(key):
+                return True
+
+        return False
+
+    @staticmethod
+    def __is_task_changed__(previous, current) -> bool:
+        """
+        Check if a task has changed between snapshots
+
+        :param previous: The task in the previous snapshot
+        :type previous: Task
+
+        :param current: The task in the current snapshot
+        :type current: Task
+
+        :return: True if the task has changed
+        """
+        for key in ('lastStatus', 'desiredStatus', 'healthStatus', 'taskDefinitionArn'):
+            if previous.get(key) != current.get(key):
+                return True
+
+        return False
+
+    @staticmethod
+    def __diff_keys__(previous, current, diff, is_changed=None) -> None:
+        """
+        Add the differences between two dictionaries of objects indexed by ARN to a diff
+
+        :param previous: Objects in the previous snapshot
+        :type previous: dict
+
+        :param current: Objects in the current snapshot
+        :type current: dict
+
+        :param diff: Dictionary containing lists of "added", "removed" and "changed" ARNs to be updated
+        :type diff: dict
+
+        :param is_changed: Optional function comparing an objects previous and current values, returning True if it has changed
+        :type is_changed: Optional[Callable]
+        """
+        for arn, value in current.items():
+            if arn not in previous:
+                diff['added'].append(arn)
+            elif is_changed is not None and previous[arn] is not value and is_changed(previous[arn], value) is True:
+                diff['changed'].append(arn)
+
+        for arn in previous.keys():
+            if arn not in current:
+                diff['removed'].append(arn)
@@ -0,0 +1,218 @@
+import threading
+
+from time import monotonic
+from typing import Dict
+
+from Aws.Backoff import Backoff
+from Aws.Lambda.Log import Log
+
+
+class Instrumentation:
+    """
+    Process wide per-operation API statistics: call counts, latency histograms, retries, throttles, errors and response bytes. Statistics are
+    collected from every client through botocore events and indexed by "<service>.<operation>", e.g. "ecs.DescribeServices"
+    """
+    # Upper bounds (in milliseconds) of the latency histogram buckets, slower calls are counted in a final "inf" bucket
+    __latency_buckets__ = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+    # Maximum number of metrics sent in a single Cloudwatch request
+    __put_metrics_max_count__ = 1000
+
+    __stats__ = {}
+    __stats_lock__ = threading.Lock()
+    __enabled__ = True
+
+    @staticmethod
+    def set_enabled(enabled) -> None:
+        """
+        Enable or disable collection of statistics
+
+        :param enabled: If FALSE no statistics are collected
+        :type enabled: bool
+        """
+        Instrumentation.__enabled__ = enabled
+
+    @staticmethod
+    def reset() -> None:
+        """
+        Discard all collected statistics
+        """
+        with Instrumentation.__stats_lock__:
+            Instrumentation.__stats__ = {}
+
+    @staticmethod
+    def get_stats() -> Dict[str, dict]:
+        """
+        Get a snapshot of the collected statistics
+
+        :return: Dictionary indexed by "<service>.<operation>" containing the number of "calls", "retries", "throttles", "errors" and "cache_hits",
+                 the response "bytes" and the "latency_total", "latency_average" and "latency_max" (in milliseconds) plus a "latency_histogram"
+                 indexed by bucket upper bound
+        """
+        with Instrumentation.__stats_lock__:
+            stats = {}
+
+            for operation, operation_stats in Instrumentation.__stats__.items():
+                stats[operation] = dict(operation_stats)
+                stats[operation]['latency_histogram'] = dict(operation_stats['latency_histogram'])
+                stats[operation]['latency_average'] = operation_stats['latency_total'] / max(1, operation_stats['calls'])
+
+        return stats
+
+    @staticmethod
+    def log_stats() -> None:
+        """
+        Log the collected statistics, busiest operations first
+        """
+        stats = Instrumentation.get_stats()
+
+        for operation in sorted(stats.keys(), key=lambda key: stats[key]['calls'], reverse=True):
+            Log.info(
+                '{operation}: {calls} calls ({cache_hits} cached), {retries} retries, {throttles} throttles, {errors} errors, {bytes} bytes, '
+                'latency average {latency_average:.1f}ms, max {latency_max:.1f}ms'.format(operation=operation, **stats[operation])
+            )
+
+    @staticmethod
+    def put_metrics(cloudwatch_client, namespace) -> None:
+        """
+        Send the collected statistics to Cloudwatch, with "Service" and "Operation" dimensions
+
+        :param cloudwatch_client: Cloudwatch client
+        :type cloudwatch_client: Aws.Cloudwatch.Client.Client
+
+        :param namespace: The Cloudwatch namespace
+        :type namespace: str
+        """
+        # Take the snapshot first so the Cloudwatch requests themselves are not included
+        stats = Instrumentation.get_stats()
+        metric_data = []
+
+        for operation, operation_stats in stats.items():
+            service_name, operation_name = operation.split('.', 1)
+            dimensions = [
+                {'Name': 'Service', 'Value': service_name},
+                {'Name': 'Operation', 'Value': operation_name}
+            ]
+
+            for metric_name, key, unit in (
+                    ('Calls', 'calls', 'Count'),
+                    ('Retries', 'retries', 'Count'),
+                    ('Throttles', 'throttles', 'Count'),
+                    ('Errors', 'errors', 'Count'),
+                    ('ResponseBytes', 'bytes', 'Bytes')
+            ):
+                metric_data.append({'MetricName': metric_name, 'Dimensions': dimensions, 'Unit': unit, 'Value': float(operation_stats[key])})
+
+            if operation_stats['calls'] > 0:
+                metric_data.append({
+                    'MetricName': 'Latency',
+                    'Dimensions': dimensions,
+                    'Unit': 'Milliseconds',
+                    'StatisticValues': {
+                        'SampleCount': float(operation_stats['calls']),
+                        'Sum': operation_stats['latency_total'],
+                        'Minimum': operation_stats['latency_min'],
+                        'Maximum': operation_stats['latency_max']
+                    }
+                })
+
+        for index in range(0, len(metric_data), Instrumentation.__put_metrics_max_count__):
+            cloudwatch_client.put_metrics(namespace, metric_data[index:index + Instrumentation.__put_metrics_max_count__])
+
+    @staticmethod
+    def register(client) -> None:
+        """
+        Collect statistics for a Boto3 client, this should be registered before any handler that may answer a call without a request
+
+        :param client: Boto3 client
+        :type client: Object
+        """
+        service_name = client.meta.service_model.service_name
+
+        def before_call(context, **kwargs) -> None:
+            context['instrumentation_start'] = monotonic()
+
+        def needs_retry(event_name, response=None, **kwargs) -> None:
+            if Instrumentation.__enabled__ is True and response is not None and Backoff.is_throttling_response(response) is True:
+                Instrumentation.__record__(service_name, event_name.split('.')[-1], throttles=1)
+
+        def after_call(http_response, parsed, model, context, **kwargs) -> None:
+            if Instrumentation.__enabled__ is False or 'instrumentation_start' not in context:
+                return
+
+            cache_hit = context.get('response_cache', {}).get('hit') is True
+
+            Instrumentation.__record__(
+                service_name,
+                model.name,
+                latency=(monotonic() - context['instrumentation_start']) * 1000,
+                retries=(parsed or {}).get('ResponseMetadata', {}).get('RetryAttempts', 0),
+                errors=int(http_response.status_code >= 300),
+                cache_hits=int(cache_hit),
+                # Never read the body to measure it, streaming responses (e.g. S3 objects) have not been consumed yet
+                bytes=0 if cache_hit else int(http_response.headers.get('content-length') or 0)
+            )
+
+        def after_call_error(context, event_name, **kwargs) -> None:
+            # Only the exception and context are sent with this event, the operation name is taken from the event name
+            if Instrumentation.__enabled__ is True and 'instrumentation_start' in context:
+                Instrumentation.__record__(
+                    service_name,
+                    event_name.split('.')[-1],
+                    latency=(monotonic() - context['instrumentation_start']) * 1000,
+                    errors=1
+                )
+
+        client.meta.events.register('before-call', before_call)
+        client.meta.events.register('needs-retry', needs_retry)
+        client.meta.events.register('after-call', after_call)
+        client.meta.events.register('after-call-error', after_call_error)
+
+    @staticmethod
+    def __record__(service_name, operation_name, latency=None, retries=0, throttles=0, errors=0, cache_hits=0, bytes=0) -> None:
+        """
+        Add to the statistics of an operation, a call is recorded if a latency is supplied
+
+        :param service_name: The service name
+        :type service_name: str
+
+        :param operation_name: The operation name
+        :type operation_name: str
+
+        :param latency: Optional call latency in milliseconds
+        :type latency: Optional[float]
+        """
+        operation = '{service_name}.{operation_name}'.format(service_name=service_name, operation_name=operation_name)
+
+        with Instrumentation.__stats_lock__:
+            if operation not in Instrumentation.__stats__:
+                Instrumentation.__stats__[operation] = {
+                    'calls': 0,
+                    'retries': 0,
+                    'throttles': 0,
+                    'errors': 0,
+                    'cache_hits': 0,
+                    'bytes': 0,
+                    'latency_total': 0.0,
+                    'latency_min': 0.0,
+                    'latency_max': 0.0,
+                    'latency_histogram': {bucket: 0 for bucket in Instrumentation.__latency_buckets__ + ('inf',)}
+                }
+
+            stats = Instrumentation.__stats__[operation]
+            stats['retries'] = stats['retries'] + retries
+            stats['throttles'] = stats['throttles'] + throttles
+            stats['errors'] = stats['errors'] + errors
+            stats['cache_hits'] = stats['cache_hits'] + cache_hits
+            stats['bytes'] = stats['bytes'] + bytes
+
+            if latency is None:
+                return
+
+            stats['latency_min'] = latency if stats['calls'] == 0 else min(stats['latency_min'], latency)
+            stats['latency_max'] = max(stats['latency_max'], latency)
+            stats['latency_total'] = stats['latency_total'] + latency
+            stats['calls'] = stats['calls'] + 1
+
+            bucket = next((bucket for bucket in Instrumentation.__latency_buckets__ if latency <= bucket), 'inf')
+            stats['latency_histogram'][bucket] = stats['latency_histogram'][bucket] + 1
@@ -1,9 +1,11 @@
+from typing import Any, Generator
+
 from Aws.Lambda.Log import Log
 
 
 class Iterator:
     @staticmethod
-    def iterate(client, method_name, data_key, arguments={}, token_key_next='nextToken', token_key_write='nextToken') -> list:
+    def iterate(client, method_name, data_key, arguments={}, token_key_next='nextToken', token_key_write='nextToken', token_keys=None, truncated_key=None) -> list:
         """
         Call an AWS client method and iterate to retrieve all available results
 
@@ -25,10 +27,70 @@ class Iterator:
         :param token_key_write: The key in the AWS results that contains to write back on subsequent calls
         :type token_key_write: str
 
+        :param token_keys: Optional compound pagination token, a dictionary of argument keys to write back on subsequent calls indexed by the
+                           keys in the AWS results that contain them (e.g. {'NextRecordName': 'StartRecordName', ...}). Overrides token_key_next
+                           and token_key_write
+        :type token_keys: Optional[Dict[str, str]]
+
+        :param truncated_key: Optional key in the AWS results that flags whether there are more results to retrieve (e.g. 'IsTruncated')
+        :type truncated_key: Optional[str]
+
         :return: List of results
-        
+
         :raises Exception: if the method does not return expected dictionary type
         """
+        return list(Iterator.stream(
+            client=client,
+            method_name=method_name,
+            data_key=data_key,
+            arguments=arguments,
+            token_key_next=token_key_next,
+            token_key_write=token_key_write,
+            token_keys=token_keys,
+            truncated_key=truncated_key
+        ))
+
+    @staticmethod
+    def stream(client, method_name, data_key, arguments=None, token_key_next='nextToken', token_key_write='nextToken', token_keys=None, truncated_key=None) -> Generator[Any, None, None]:
+        """
+        Call an AWS client method and iterate to retrieve all available results, yielding each result as it is retrieved so that only a single page
+        of results is held in memory
+
+        :param client: Boto3 client used to perform the action
+        :type client: Object
+
+        :param method_name: Boto3 method name to call
+        :type method_name: str
+
+        :param arguments: Dictionary of arguments to be passed to method
+        :type arguments: Optional[dict]
+
+        :param data_key: The key in the AWS results that contains the response data
+        :type data_key: str
+
+        :param token_key_next: The key in the AWS results that contains the pagination token
+        :type token_key_next: str
+
+        :param token_key_write: The key in the AWS results that contains to write back on subsequent calls
+        :type token_key_write: str
+
+        :param token_keys: Optional compound pagination token, a dictionary of argument keys to write back on subsequent calls indexed by the
+                           keys in the AWS results that contain them. Overrides token_key_next and token_key_write
+        :type token_keys: Optional[Dict[str, str]]
+
+        :param truncated_key: Optional key in the AWS results that flags whether there are more results to retrieve
+        :type truncated_key: Optional[str]
+
+        :return: Generator of results
+
+        :raises Exception: if the method does not return expected dictionary type
+        """
+        if token_keys is None:
+            token_keys = {token_key_next: token_key_write}
+
+        # Copy the arguments so pagination tokens are never written back into the callers dictionary
+        arguments = dict(arguments or {})
+
         method_to_call = getattr(client, method_name)
 
         result = method_to_call(**arguments)
@@ -36,25 +98,32 @@ class Iterator:
         if isinstance(result, dict) is False:
             raise Exception('Unexpected result received')
 
-        return_list = []
-
         if data_key not in result.keys():
-            return return_list
+            return
 
         while True:
             # If there is nothing left- get out of here
             if len(result[data_key]) == 0:
                 break
 
-            return_list.extend(result[data_key])
+            yield from result[data_key]
 
             # Check if there are any more results to retrieve
-            if token_key_next not in result.keys() or result[token_key_next] is None:
+            if truncated_key is not None and result.get(truncated_key) is not True:
                 break
 
-            # Add pagination token to next method call and get next page of results
-            arguments[token_key_write] = result[token_key_next]
-            result = method_to_call(**arguments)
+            tokens = {}
+
+            for token_key_result, token_key_argument in token_keys.items():
+                if result.get(token_key_result) is not None:
+                    tokens[token_key_argument] = result[token_key_result]
 
-        # Return the results we found
-        return return_list
+            if len(tokens) == 0:
+                break
+
+            # Replace the pagination token(s) in the next method call, parts of a compound token may be absent from later pages
+            for token_key_argument in token_keys.values():
+                arguments.pop(token_key_argument, None)
+
+            arguments.update(tokens)
+            result = method_to_call(**arguments)
@@ -0,0 +1,48 @@
+from typing import Any
+
+from Aws.AsyncBaseClient import AsyncBaseClient
+
+
+class AsyncClient(AsyncBaseClient):
+    """
+    Asyncio Lambda Client
+    """
+    __client_identifier__ = 'lambda'
+
+    def __init__(self, credential, region_name):
+        """
+        Setup an asyncio Lambda client
+
+        :param credential: The credential used to authenticate to AWS
+        :type credential: Credential
+
+        :param region_name: Region in which client will operate
+        :type region_name: str
+        """
+        super().__init__(credential, region_name)
+
+    async def invoke(self, function_name, payload) -> Any:
+        """
+        Invoke a lambda function
+
+        :param function_name: Name of the function
+        :type function_name: str
+
+        :param payload: JSON payload
+        :type payload: str
+
+        :return: Return value, the response "Payload" is read in full and returned as bytes
+        """
+        result = await self.__client__.invoke(
+            FunctionName=function_name,
+            InvocationType='RequestResponse',
+            LogType='Tail',
+            Payload=payload or '{}'
+        )
+
+        # Read the payload while the connection is held, an unread streaming body would keep the connection out of the shared pool
+        if 'Payload' in result:
+            async with result['Payload'] as stream:
+                result['Payload'] = await stream.read()
+
+        return result
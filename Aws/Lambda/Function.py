@@ -1,4 +1,8 @@
+import os
+
 from abc import abstractmethod
+from Aws.Cloudwatch.Client import Client as CloudwatchClient
+from Aws.Instrumentation import Instrumentation
 from Aws.Lambda.Log import Log
 from typing import Optional, Any
 
@@ -8,7 +12,7 @@ class Function:
     Lambda function boilerplate
     """
 
-    def __init__(self, aws_event=None, aws_context=None, credential=None):
+    def __init__(self, aws_event=None, aws_context=None, credential=None, log_api_stats=False, api_stats_namespace=None):
         """
         :param aws_event: AWS Lambda uses this parameter to pass in event data to the handler
         :type aws_event: Optional[dict]
@@ -18,12 +22,23 @@ class Function:
 
         :param credential: Optional credential to user for authentication via CLI
         :type credential: Optional[Credential]
+
+        :param log_api_stats: If TRUE AWS API call statistics collected during the invocation are logged once it completes
+        :type log_api_stats: bool
+
+        :param api_stats_namespace: Optional Cloudwatch namespace to which AWS API call statistics are sent once the invocation completes
+        :type api_stats_namespace: Optional[str]
         """
         self.__aws_event__ = aws_event
         self.__aws_context__ = aws_context
         self.__credential__ = credential
+        self.__log_api_stats__ = log_api_stats
+        self.__api_stats_namespace__ = api_stats_namespace
         self.__return__ = None
 
+        # Only report API calls made during this invocation
+        Instrumentation.reset()
+
         # Set lambda function name
         Log.set_function_name(self.get_aws_function_name())
 
@@ -57,14 +72,34 @@ class Function:
         except Exception as run_exception:
             # Something went wrong inside the users run function- log the error
             Log.error('Unhandled exception during execution of user run function:\n{run_exception}'.format(run_exception=run_exception))
+            self.__emit_api_stats__()
             raise run_exception
 
+        self.__emit_api_stats__()
+
         # Execution completed, log out the time remaining- this may be useful for tracking bloat/performance degradation over the life of the Lambda function
         time_remaining = self.get_aws_time_remaining()
 
         if time_remaining is not None:
             Log.info('Execution completed with {time_remaining} seconds remaining'.format(time_remaining=float(time_remaining) / 1000))
 
+    def __emit_api_stats__(self) -> None:
+        """
+        Log and/or send to Cloudwatch the AWS API call statistics collected during the invocation, if requested
+        """
+        if self.__log_api_stats__ is True:
+            Log.info('AWS API call statistics:')
+            Instrumentation.log_stats()
+
+        if self.__api_stats_namespace__ is None:
+            return
+
+        try:
+            Instrumentation.put_metrics(CloudwatchClient(self.__credential__, os.environ.get('AWS_REGION')), self.__api_stats_namespace__)
+        except Exception as metrics_exception:
+            # Failing to report statistics should never fail the invocation
+            Log.warning('Failed to send AWS API call statistics to Cloudwatch: {metrics_exception}'.format(metrics_exception=metrics_exception))
+
     def set_return_value(self, value) -> None:
         """
         Set lambda return value
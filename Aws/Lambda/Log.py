@@ -234,7 +234,7 @@ class Log:
             current_stack = inspect.stack()
             is_unit_test = False
             for stack_frame in current_stack:
-                for program_line in stack_frame[4]:
+                for program_line in stack_frame[4] or []:
                     if "unittest" in program_line:
                         is_unit_test = True
                         break
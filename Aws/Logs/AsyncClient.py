@@ -0,0 +1,63 @@
+from typing import Any, AsyncGenerator, List
+
+from Aws.AsyncBaseClient import AsyncBaseClient
+from Aws.AsyncIterator import AsyncIterator
+
+
+class AsyncClient(AsyncBaseClient):
+    """
+    Asyncio Logs Client
+    """
+    __client_identifier__ = 'logs'
+
+    def __init__(self, credential, region_name):
+        """
+        Setup an asyncio Cloudwatch Logs client
+
+        :param credential: The credential used to authenticate to AWS
+        :type credential: Credential
+
+        :param region_name: Region in which client will operate
+        :type region_name: str
+        """
+        super().__init__(credential, region_name)
+
+    async def get_log_events(self, log_group_name, log_stream_name) -> List[Any]:
+        """
+        Retrieve all events in a log stream
+
+        :param log_group_name: Log group name
+        :type log_group_name: str
+
+        :param log_stream_name: Log stream name
+        :type log_stream_name: str
+
+        :return: List of log events
+        """
+        return [log_event async for log_event in self.stream_log_events(log_group_name, log_stream_name)]
+
+    def stream_log_events(self, log_group_name, log_stream_name) -> AsyncGenerator[Any, None]:
+        """
+        Retrieve all events in a log stream, yielding each event as it is retrieved so that only a single page of events is held in memory
+
+        :param log_group_name: Log group name
+        :type log_group_name: str
+
+        :param log_stream_name: Log stream name
+        :type log_stream_name: str
+
+        :return: Async generator of log events
+        """
+        return AsyncIterator.stream(
+            client=self.__client__,
+            method_name='get_log_events',
+            data_key='events',
+            token_key_next='nextForwardToken',
+            token_key_write='nextToken',
+            arguments={
+                'logGroupName': log_group_name,
+                'logStreamName': log_stream_name,
+                'startFromHead': True,
+                'limit': 50
+            }
+        )
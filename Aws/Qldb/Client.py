@@ -1,10 +1,21 @@
-from typing import Optional, Dict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime
+from time import sleep, time
+from typing import Optional, Dict, List, Tuple
+
+from botocore.exceptions import ClientError
 
 from Aws.Credential import Credential
 
+from Aws.Backoff import Backoff
 from Aws.BaseClient import BaseClient
+from Aws.Cache import Cache
 from Aws.Iterator import Iterator
+from Aws.Lambda.Log import Log
 from Aws.Qldb.Ledger import Ledger
+from Aws.Qldb.LedgerState import LedgerState
+from Aws.Qldb.QldbException import QldbException
+from Aws.ResponseCache import ResponseCache
 
 
 class Client(BaseClient):
@@ -13,6 +24,9 @@ class Client(BaseClient):
     """
     __client_identifier__ = 'qldb'
 
+    # Process wide cache of ledger digests indexed by credential, region and ledger name
+    __digest_cache__ = Cache(max_size=256)
+
     def __init__(self, credential: Credential, region_name: str):
         """
         Setup a QLDB client
@@ -72,10 +86,11 @@ class Client(BaseClient):
 
         return ledger
 
-    def list_ledgers(self) -> Dict[str, Ledger]:
+    def list_ledgers(self, max_workers=10) -> Dict[str, Ledger]:
         """
         List QLDB ledgers
 
+        :param max_workers: Maximum number of ledgers described concurrently
         :return: Dictionary of ledger objects indexed by their ARN
         """
         ledgers = {}
@@ -83,11 +98,379 @@ class Client(BaseClient):
         ledger_names = Iterator.iterate(
             client=self.__client__,
             method_name='list_ledgers',
-            data_key='Ledgers'
+            data_key='Ledgers',
+            token_key_next='NextToken',
+            token_key_write='NextToken'
         )
 
-        for ledger_name in ledger_names:
-            ledger = self.describe_ledger(ledger_name['Name'])
-            ledgers[ledger.get('Arn')] = ledger
+        if len(ledger_names) == 0:
+            return ledgers
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(ledger_names))) as executor:
+            futures = [executor.submit(self.describe_ledger, ledger_name['Name']) for ledger_name in ledger_names]
+
+            for future in futures:
+                ledger = future.result()
+                ledgers[ledger.get('Arn')] = ledger
 
         return ledgers
+
+    def export_journal_to_s3(
+            self,
+            name: str,
+            bucket: str,
+            prefix: str,
+            role_arn: str,
+            start_time: datetime,
+            end_time: datetime,
+            output_format: str = 'ION_TEXT',
+            kms_key_arn: Optional[str] = None
+    ) -> str:
+        """
+        Export the journal of a ledger to S3
+
+        :param name: Name of the ledger
+        :param bucket: S3 bucket to export to
+        :param prefix: S3 key prefix of the exported objects
+        :param role_arn: IAM role QLDB assumes to write to the bucket
+        :param start_time: Inclusive start of the range of journal blocks to export
+        :param end_time: Exclusive end of the range of journal blocks to export
+        :param output_format: Output format of the exported blocks (ION_BINARY, ION_TEXT or JSON)
+        :param kms_key_arn: Optional KMS key used to encrypt exported objects, S3 managed encryption is used if not supplied
+        :return: Export ID
+        """
+        encryption_configuration = {'ObjectEncryptionType': 'SSE_S3'}
+
+        if kms_key_arn is not None:
+            encryption_configuration = {'ObjectEncryptionType': 'SSE_KMS', 'KmsKeyArn': kms_key_arn}
+
+        response = self.__client__.export_journal_to_s3(
+            Name=name,
+            InclusiveStartTime=start_time,
+            ExclusiveEndTime=end_time,
+            RoleArn=role_arn,
+            OutputFormat=output_format,
+            S3ExportConfiguration={
+                'Bucket': bucket,
+                'Prefix': prefix,
+                'EncryptionConfiguration': encryption_configuration
+            }
+        )
+
+        return response['ExportId']
+
+    def describe_journal_s3_export(self, name: str, export_id: str) -> dict:
+        """
+        Describe a journal export
+
+        :param name: Name of the ledger
+        :param export_id: Export ID
+        :return: Export description
+        """
+        return self.__client__.describe_journal_s3_export(Name=name, ExportId=export_id)['ExportDescription']
+
+    def wait_for_journal_s3_export(self, name: str, export_id: str, timeout: float = 3600, base: float = 2.0, cap: float = 60.0) -> dict:
+        """
+        Wait for a journal export to complete, polling using jittered exponential backoff
+
+        :param name: Name of the ledger
+        :param export_id: Export ID
+        :param timeout: Maximum number of seconds to wait
+        :param base: Delay in seconds after the first poll, doubling (with jitter) on each subsequent poll
+        :param cap: Maximum delay in seconds between polls
+        :return: Export description
+
+        :raises QldbException: if the export is cancelled or the timeout expires
+        """
+        deadline = time() + timeout
+        attempt = 0
+
+        while True:
+            attempt = attempt + 1
+
+            # Every poll must observe the current status, never a cached response
+            with ResponseCache.bypass():
+                export = self.describe_journal_s3_export(name=name, export_id=export_id)
+
+            if export['Status'] == 'COMPLETED':
+                return export
+
+            if export['Status'] != 'IN_PROGRESS':
+                raise QldbException('Journal export ({export_id}) did not complete, status is {status}'.format(export_id=export_id, status=export['Status']))
+
+            if time() >= deadline:
+                raise QldbException('Timed out waiting for journal export ({export_id}) to complete'.format(export_id=export_id))
+
+            sleep(min(Backoff.get_delay(attempt=attempt, base=base, cap=cap), max(0.0, deadline - time())))
+
+    def get_journal_s3_export_reader(self, name: str, export_id: str, endpoint_url: Optional[str] = None, max_workers: int = 4):
+        """
+        Create a streaming reader for a completed journal export using this clients credential
+
+        :param name: Name of the ledger
+        :param export_id: Export ID
+        :param endpoint_url: Optional S3 compatible endpoint URL
+        :param max_workers: Maximum number of files read and parsed concurrently
+        :return: JournalReader object
+        """
+        # Imported here so the control plane client does not require the optional Ion dependency
+        from Aws.Qldb.JournalReader import JournalReader
+
+        export = self.describe_journal_s3_export(name=name, export_id=export_id)
+
+        return JournalReader(
+            bucket=export['S3ExportConfiguration']['Bucket'],
+            prefix=export['S3ExportConfiguration']['Prefix'],
+            session=self.__session__,
+            endpoint_url=endpoint_url,
+            max_workers=max_workers
+        )
+
+    def get_digest(self, name: str, refresh: bool = False) -> dict:
+        """
+        Get the digest of a ledgers journal at its current tip, digests are cached so many revisions can be verified against a single digest
+
+        :param name: Name of the ledger
+        :param refresh: If TRUE a new digest will always be retrieved (and cached)
+        :return: Dictionary containing the "Digest" and "DigestTipAddress"
+        """
+        cache_key = '{identifier}:{region_name}:{name}'.format(
+            identifier=self.__credential__.get_identifier(),
+            region_name=self.get_region_name(),
+            name=name
+        )
+        digest = None
+
+        if refresh is False:
+            digest = Client.__digest_cache__.get(cache_key)
+
+        if digest is None:
+            response = self.__client__.get_digest(Name=name)
+            digest = {
+                'Digest': response['Digest'],
+                'DigestTipAddress': response['DigestTipAddress']
+            }
+            Client.__digest_cache__.set(cache_key, digest)
+
+        return digest
+
+    def verify_revisions(self, name: str, revisions: List[dict], max_workers: int = 10, use_processes: bool = True) -> List[dict]:
+        """
+        Verify document revisions against the ledger digest. Revisions and their proofs are retrieved concurrently and the proofs are checked on
+        a process pool (or inline if use_processes is False, e.g. where multiprocessing is unavailable)
+
+        :param name: Name of the ledger
+        :param revisions: List of dictionaries containing the "document_id" and "block_address" (dictionary of "strandId" and "sequenceNo")
+        :param max_workers: Maximum number of revisions retrieved concurrently
+        :param use_processes: If TRUE proofs are checked on a process pool
+        :return: List of dictionaries containing the "document_id", "block_address", whether the revision was "verified" and any "error"
+                 raised, in the same order as the requested revisions
+        """
+        # Imported here so the control plane client does not require the optional Ion dependency
+        from Aws.Qldb.Proof import Proof
+
+        results = []
+
+        if len(revisions) == 0:
+            return results
+
+        # The digest must cover every requested revision, refresh the cached digest if any revision is newer than its tip
+        digest = self.get_digest(name)
+        tip = Proof.parse_block_address(digest['DigestTipAddress']['IonText'])
+
+        for revision in revisions:
+            if revision['block_address']['strandId'] == tip['strandId'] and int(revision['block_address']['sequenceNo']) > tip['sequenceNo']:
+                digest = self.get_digest(name, refresh=True)
+                break
+
+        verify_executor = None
+
+        if use_processes is True:
+            verify_executor = ProcessPoolExecutor()
+
+        try:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(revisions))) as fetch_executor:
+                fetch_futures = [fetch_executor.submit(self.__get_revision_proof__, name, revision, digest) for revision in revisions]
+                verify_futures = []
+
+                for revision, fetch_future in zip(revisions, fetch_futures):
+                    result = {
+                        'document_id': revision['document_id'],
+                        'block_address': revision['block_address'],
+                        'verified': False,
+                        'error': None
+                    }
+                    results.append(result)
+                    verify_future = None
+
+                    try:
+                        revision_hash, proof_hashes = fetch_future.result()
+
+                        if verify_executor is None:
+                            result['verified'] = Proof.verify(revision_hash, proof_hashes, digest['Digest'])
+                        else:
+                            verify_future = verify_executor.submit(Proof.verify, revision_hash, proof_hashes, digest['Digest'])
+                    except Exception as fetch_exception:
+                        result['error'] = fetch_exception
+
+                    verify_futures.append(verify_future)
+
+            for result, verify_future in zip(results, verify_futures):
+                if verify_future is None:
+                    continue
+
+                try:
+                    result['verified'] = verify_future.result()
+                except Exception as verify_exception:
+                    result['error'] = verify_exception
+        finally:
+            if verify_executor is not None:
+                verify_executor.shutdown()
+
+        Log.trace('Verified {verified} of {count} revisions in ledger ({name})'.format(
+            verified=len([result for result in results if result['verified'] is True]),
+            count=len(results),
+            name=name
+        ))
+
+        return results
+
+    def __get_revision_proof__(self, name: str, revision: dict, digest: dict) -> Tuple[bytes, List[bytes]]:
+        """
+        Retrieve a revision and its proof
+
+        :param name: Name of the ledger
+        :param revision: Dictionary containing the "document_id" and "block_address"
+        :param digest: Ledger digest the proof should lead to
+        :return: Tuple of the revision hash and the proof hashes
+        """
+        from Aws.Qldb.Proof import Proof
+
+        response = Backoff.call(
+            function=self.__client__.get_revision,
+            arguments={
+                'Name': name,
+                'BlockAddress': {'IonText': Proof.get_block_address_ion_text(revision['block_address'])},
+                'DocumentId': revision['document_id'],
+                'DigestTipAddress': digest['DigestTipAddress']
+            }
+        )
+
+        return Proof.parse_revision_hash(response['Revision']['IonText']), Proof.parse_proof(response['Proof']['IonText'])
+
+    def get_driver(
+            self,
+            ledger_name: str,
+            max_concurrent_transactions: int = 10,
+            retry_limit: int = 4,
+            retry_base: int = 10,
+            read_ahead: int = 0
+    ):
+        """
+        Create a data plane driver for a ledger using this clients credential and region. Drivers pool their sessions, so a single driver
+        should be created per ledger and shared
+
+        :param ledger_name: Name of the ledger
+        :param max_concurrent_transactions: Maximum number of pooled sessions (and therefore concurrent transactions)
+        :param retry_limit: Maximum number of times a transaction failing due to an OCC conflict (or other retryable error) is retried
+        :param retry_base: Base delay in milliseconds used to calculate the exponential backoff between retries
+        :param read_ahead: Number of result pages to buffer ahead of the current page (0 disables read ahead)
+        :return: Driver object
+        """
+        # Imported here so the control plane client does not require the optional pyqldb dependency
+        from Aws.Qldb.Driver import Driver
+
+        return Driver(
+            session=self.__session__,
+            ledger_name=ledger_name,
+            max_concurrent_transactions=max_concurrent_transactions,
+            retry_limit=retry_limit,
+            retry_base=retry_base,
+            read_ahead=read_ahead
+        )
+
+    def wait_for_ledger(self, name: str, state: LedgerState, timeout: float = 600, base: float = 1.0, cap: float = 30.0) -> Optional[Ledger]:
+        """
+        Wait for a QLDB ledger to reach the requested state
+
+        :param name: Name of the ledger
+        :param state: The state to wait for
+        :param timeout: Maximum number of seconds to wait
+        :param base: Delay in seconds after the first poll, doubling (with jitter) on each subsequent poll
+        :param cap: Maximum delay in seconds between polls
+        :return: Ledger object, or None if waiting for the ledger to be deleted
+
+        :raises QldbException: if the ledger cannot reach the requested state or the timeout expires
+        """
+        return self.wait_for_ledgers(names=[name], state=state, timeout=timeout, base=base, cap=cap)[name]
+
+    def wait_for_ledgers(self, names: List[str], state: LedgerState, timeout: float = 600, base: float = 1.0, cap: float = 30.0) -> Dict[str, Optional[Ledger]]:
+        """
+        Wait for multiple QLDB ledgers to reach the requested state, ledgers are polled concurrently using jittered exponential backoff
+
+        :param names: Names of the ledgers
+        :param state: The state to wait for
+        :param timeout: Maximum number of seconds to wait
+        :param base: Delay in seconds after the first poll, doubling (with jitter) on each subsequent poll
+        :param cap: Maximum delay in seconds between polls
+        :return: Dictionary of ledger objects (or None for deleted ledgers) indexed by ledger name
+
+        :raises QldbException: if a ledger cannot reach the requested state or the timeout expires
+        """
+        ledgers = {}
+        pending = list(names)
+        deadline = time() + timeout
+        attempt = 0
+
+        while len(pending) > 0:
+            attempt = attempt + 1
+
+            with ThreadPoolExecutor(max_workers=min(10, len(pending))) as executor:
+                futures = {name: executor.submit(self.__describe_ledger_state__, name) for name in pending}
+
+            for name, future in futures.items():
+                ledger = future.result()
+                current_state = LedgerState.DELETED.value
+
+                if ledger is not None:
+                    current_state = ledger.get('State')
+
+                if current_state == state.value:
+                    ledgers[name] = ledger
+                    pending.remove(name)
+                    continue
+
+                # Once a ledger starts deleting it will never become active again
+                if state != LedgerState.DELETED and current_state in (LedgerState.DELETING.value, LedgerState.DELETED.value):
+                    raise QldbException('Ledger ({name}) cannot reach {state} state, current state is {current_state}'.format(
+                        name=name,
+                        state=state.value,
+                        current_state=current_state
+                    ))
+
+            if len(pending) == 0:
+                break
+
+            if time() >= deadline:
+                raise QldbException('Timed out waiting for {count} ledgers to reach {state} state'.format(count=len(pending), state=state.value))
+
+            sleep(min(Backoff.get_delay(attempt=attempt, base=base, cap=cap), max(0.0, deadline - time())))
+
+        return ledgers
+
+    def __describe_ledger_state__(self, name: str) -> Optional[Ledger]:
+        """
+        Describe QLDB ledger, treating a missing ledger as deleted
+
+        :param name: Name of the ledger to describe
+        :return: Ledger object, or None if the ledger does not exist
+        """
+        try:
+            # Waiters poll the current state, set here as their pool threads do not inherit the callers context
+            with ResponseCache.bypass():
+                return self.describe_ledger(name)
+        except ClientError as client_error:
+            if client_error.response.get('Error', {}).get('Code') == 'ResourceNotFoundException':
+                return None
+
+            raise client_error
@@ -0,0 +1,236 @@
+import re
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Iterable, List, Tuple
+
+from amazon.ion import simpleion
+from boto3 import Session
+from pyqldb.config.retry_config import RetryConfig
+from pyqldb.driver.qldb_driver import QldbDriver
+
+from Aws.Lambda.Log import Log
+from Aws.Qldb.QldbException import QldbException
+
+
+class Driver:
+    """
+    Quantum Ledger Database data plane driver. Sessions are pooled (up to the maximum number of concurrent transactions) and reused between
+    transactions, transactions that fail due to OCC conflicts or other retryable errors are retried with exponential backoff
+    """
+    # Per transaction limits on the number of documents modified and the total size of the documents
+    __transaction_max_documents__ = 40
+    __transaction_max_bytes__ = 4 * 1024 * 1024
+
+    # Valid (unquoted) table name
+    __table_name_pattern__ = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
+    def __init__(
+            self,
+            session: Session,
+            ledger_name: str,
+            max_concurrent_transactions: int = 10,
+            retry_limit: int = 4,
+            retry_base: int = 10,
+            read_ahead: int = 0
+    ):
+        """
+        Setup a QLDB driver, this is normally created using Aws.Qldb.Client.get_driver()
+
+        :param session: Boto3 session used to authenticate to AWS, also determines the region
+        :param ledger_name: Name of the ledger
+        :param max_concurrent_transactions: Maximum number of pooled sessions (and therefore concurrent transactions)
+        :param retry_limit: Maximum number of times a failed transaction is retried
+        :param retry_base: Base delay in milliseconds used to calculate the exponential backoff between retries
+        :param read_ahead: Number of result pages to buffer ahead of the current page (0 disables read ahead)
+        """
+        self.__ledger_name__ = ledger_name
+        self.__max_concurrent_transactions__ = max_concurrent_transactions
+        self.__driver__ = QldbDriver(
+            ledger_name=ledger_name,
+            boto3_session=session,
+            max_concurrent_transactions=max_concurrent_transactions,
+            retry_config=RetryConfig(retry_limit=retry_limit, base=retry_base),
+            read_ahead=read_ahead
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the driver and all pooled sessions
+        """
+        self.__driver__.close()
+
+    def get_ledger_name(self) -> str:
+        """
+        Get the name of the ledger
+
+        :return: Ledger name
+        """
+        return self.__ledger_name__
+
+    def list_tables(self) -> List[str]:
+        """
+        List the active tables in the ledger
+
+        :return: List of table names
+        """
+        return list(self.__driver__.list_tables())
+
+    def execute_lambda(self, function: Callable[[Any], Any]) -> Any:
+        """
+        Execute a function within a single transaction, the function may be called more than once if the transaction is retried. Any cursors
+        must be fully consumed within the function
+
+        :param function: Function accepting a pyqldb transaction executor
+        :return: The functions return value
+        """
+        return self.__driver__.execute_lambda(function)
+
+    def execute_statement(self, statement: str, *parameters) -> List[Any]:
+        """
+        Execute a single PartiQL statement in its own transaction
+
+        :param statement: PartiQL statement
+        :param parameters: Statement parameters
+        :return: List of result documents
+        """
+        return self.execute_statements([(statement,) + tuple(parameters)])[0]
+
+    def execute_statements(self, statements: List[Tuple]) -> List[List[Any]]:
+        """
+        Execute many PartiQL statements in a single transaction, either all statements are committed or none are
+
+        :param statements: List of tuples containing the PartiQL statement followed by its parameters, e.g. [('SELECT * FROM Foo WHERE id = ?', 1)]
+        :return: List containing the result documents of each statement
+        """
+        Log.trace('Executing {count} PartiQL statements in ledger ({ledger_name})...'.format(count=len(statements), ledger_name=self.__ledger_name__))
+
+        def execute(transaction_executor) -> List[List[Any]]:
+            results = []
+
+            for statement in statements:
+                cursor = transaction_executor.execute_statement(statement[0], *statement[1:])
+                results.append(list(cursor))
+
+            return results
+
+        return self.execute_lambda(execute)
+
+    def insert_documents(
+            self,
+            table_name: str,
+            documents: Iterable[dict],
+            max_documents: int = 40,
+            max_bytes: int = 3 * 1024 * 1024
+    ) -> dict:
+        """
+        Insert a stream of documents, packing them into transactions by document count and size and executing transactions concurrently across
+        the pooled sessions. Documents are consumed lazily so iterables of any size can be loaded with bounded memory
+
+        :param table_name: Name of the table
+        :param documents: Iterable of documents to insert
+        :param max_documents: Maximum number of documents inserted per transaction (QLDB allows at most 40)
+        :param max_bytes: Maximum total size in bytes (Ion binary encoded) of the documents inserted per transaction (QLDB allows at most 4MB)
+        :return: Dictionary containing the number of documents "inserted" and a list of "failures", each containing the "chunk" number, the
+                 "documents" in the chunk and the "error" raised, so that failed chunks can be retried
+
+        :raises QldbException: if the table name is invalid or a single document exceeds the maximum size
+        """
+        if Driver.__table_name_pattern__.match(table_name) is None:
+            raise QldbException('Invalid table name ({table_name})'.format(table_name=table_name))
+
+        max_documents = min(max_documents, Driver.__transaction_max_documents__)
+        max_bytes = min(max_bytes, Driver.__transaction_max_bytes__)
+        statement = 'INSERT INTO {table_name} ?'.format(table_name=table_name)
+
+        result = {
+            'inserted': 0,
+            'failures': []
+        }
+
+        with ThreadPoolExecutor(max_workers=self.__max_concurrent_transactions__) as executor:
+            futures = {}
+
+            for chunk_number, chunk in enumerate(Driver.__pack_documents__(documents, max_documents, max_bytes)):
+                # Limit the number of chunks held in memory waiting for a session
+                if len(futures) >= self.__max_concurrent_transactions__ * 2:
+                    done, not_done = wait(futures.keys(), return_when=FIRST_COMPLETED)
+
+                    for future in done:
+                        Driver.__collect_insert_result__(future, futures.pop(future), result)
+
+                futures[executor.submit(self.execute_statement, statement, chunk)] = (chunk_number, chunk)
+
+            for future in list(futures.keys()):
+                Driver.__collect_insert_result__(future, futures.pop(future), result)
+
+        Log.trace('Inserted {inserted} documents into table ({table_name}), {failures} chunks failed'.format(
+            inserted=result['inserted'],
+            table_name=table_name,
+            failures=len(result['failures'])
+        ))
+
+        return result
+
+    @staticmethod
+    def __pack_documents__(documents: Iterable[dict], max_documents: int, max_bytes: int) -> Iterable[List[dict]]:
+        """
+        Lazily pack documents into chunks limited by document count and total Ion binary size
+
+        :param documents: Iterable of documents
+        :param max_documents: Maximum number of documents per chunk
+        :param max_bytes: Maximum total size in bytes per chunk
+        :return: Generator of document chunks
+
+        :raises QldbException: if a single document exceeds the maximum size
+        """
+        chunk = []
+        chunk_bytes = 0
+
+        for document in documents:
+            document_bytes = len(simpleion.dumps(document, binary=True))
+
+            if document_bytes > max_bytes:
+                raise QldbException('Document size ({document_bytes} bytes) exceeds the maximum transaction size'.format(document_bytes=document_bytes))
+
+            if len(chunk) >= max_documents or chunk_bytes + document_bytes > max_bytes:
+                yield chunk
+                chunk = []
+                chunk_bytes = 0
+
+            chunk.append(document)
+            chunk_bytes = chunk_bytes + document_bytes
+
+        if len(chunk) > 0:
+            yield chunk
+
+    @staticmethod
+    def __collect_insert_result__(future, chunk_details: Tuple[int, List[dict]], result: dict) -> None:
+        """
+        Record the outcome of a chunk insert
+
+        :param future: The completed future
+        :param chunk_details: Tuple of chunk number and the documents in the chunk
+        :param result: Insert result to be updated
+        """
+        chunk_number, chunk = chunk_details
+
+        try:
+            future.result()
+            result['inserted'] = result['inserted'] + len(chunk)
+        except Exception as insert_exception:
+            Log.error('Failed to insert chunk {chunk_number} ({count} documents): {insert_exception}'.format(
+                chunk_number=chunk_number,
+                count=len(chunk),
+                insert_exception=insert_exception
+            ))
+            result['failures'].append({
+                'chunk': chunk_number,
+                'documents': chunk,
+                'error': insert_exception
+            })
@@ -0,0 +1,178 @@
+import json
+import os
+import re
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Generator, List, Optional
+
+from amazon.ion import simpleion
+from boto3 import Session
+
+from Aws.Iterator import Iterator
+from Aws.Lambda.Log import Log
+from Aws.Qldb.QldbException import QldbException
+
+
+class JournalReader:
+    """
+    Streaming reader for QLDB journal exports, reading the exported block files from a local directory or S3 (or an S3 compatible endpoint).
+    Files are downloaded and parsed in parallel while blocks and revisions are yielded in journal file order, only the files currently being
+    processed are held in memory
+    """
+    # Extensions of exported journal data files (manifests are excluded)
+    __data_file_extensions__ = ('.ion', '.json')
+
+    # Exported data files are named "{strand id}.{first sequence number}-{last sequence number}.{extension}"
+    __data_file_name_pattern__ = re.compile(r'^(?P<strand_id>[^.]+)\.(?P<start>\d+)-(?P<end>\d+)\.(ion|json)$')
+
+    def __init__(
+            self,
+            path: Optional[str] = None,
+            bucket: Optional[str] = None,
+            prefix: str = '',
+            session: Optional[Session] = None,
+            endpoint_url: Optional[str] = None,
+            max_workers: int = 4
+    ):
+        """
+        Setup a journal reader for either a local directory or an S3 bucket
+
+        :param path: Local directory containing the exported journal
+        :param bucket: S3 bucket containing the exported journal
+        :param prefix: S3 key prefix of the exported journal
+        :param session: Boto3 session used to access S3, defaults to a new session using the default credentials
+        :param endpoint_url: Optional S3 compatible endpoint URL
+        :param max_workers: Maximum number of files read and parsed concurrently
+
+        :raises QldbException: if neither or both of a local path and S3 bucket are supplied
+        """
+        if (path is None) == (bucket is None):
+            raise QldbException('Journal reader requires either a local path or an S3 bucket')
+
+        self.__path__ = path
+        self.__bucket__ = bucket
+        self.__prefix__ = prefix
+        self.__max_workers__ = max_workers
+        self.__s3_client__ = None
+
+        if bucket is not None:
+            self.__s3_client__ = (session or Session()).client('s3', endpoint_url=endpoint_url)
+
+    def list_files(self) -> List[str]:
+        """
+        List the exported journal data files in journal order
+
+        :return: List of local file paths or S3 keys
+        """
+        if self.__path__ is not None:
+            files = []
+
+            for directory, directory_names, file_names in os.walk(self.__path__):
+                files.extend([os.path.join(directory, file_name) for file_name in file_names])
+        else:
+            objects = Iterator.iterate(
+                client=self.__s3_client__,
+                method_name='list_objects_v2',
+                data_key='Contents',
+                arguments={
+                    'Bucket': self.__bucket__,
+                    'Prefix': self.__prefix__
+                },
+                token_key_next='NextContinuationToken',
+                token_key_write='ContinuationToken'
+            )
+            files = [s3_object['Key'] for s3_object in objects]
+
+        return sorted(
+            [file for file in files if file.endswith(JournalReader.__data_file_extensions__)],
+            key=JournalReader.__get_file_sort_key__
+        )
+
+    def read_blocks(self) -> Generator[Any, None, None]:
+        """
+        Iterate all journal blocks in the export
+
+        :return: Generator of journal blocks
+        """
+        files = self.list_files()
+        Log.trace('Reading {count} exported journal files...'.format(count=len(files)))
+
+        with ThreadPoolExecutor(max_workers=self.__max_workers__) as executor:
+            futures = []
+
+            for file in files:
+                futures.append(executor.submit(self.__read_file__, file))
+
+                # Keep a bounded window of files in flight, yielding the oldest as soon as it has been parsed
+                if len(futures) > self.__max_workers__:
+                    yield from futures.pop(0).result()
+
+            for future in futures:
+                yield from future.result()
+
+    def read_revisions(self) -> Generator[Any, None, None]:
+        """
+        Iterate all document revisions in the export, in journal order
+
+        :return: Generator of document revisions
+        """
+        for block in self.read_blocks():
+            for revision in block.get('revisions') or []:
+                yield revision
+
+    def __read_file__(self, file: str) -> List[Any]:
+        """
+        Read and parse a single exported journal file
+
+        :param file: Local file path or S3 key
+        :return: List of journal blocks
+        """
+        if self.__path__ is not None:
+            with open(file, 'rb') as context:
+                data = context.read()
+        else:
+            data = self.__s3_client__.get_object(Bucket=self.__bucket__, Key=file)['Body'].read()
+
+        if file.endswith('.json'):
+            return JournalReader.__parse_json__(data.decode('utf-8'))
+
+        return simpleion.loads(data, single_value=False)
+
+    @staticmethod
+    def __get_file_sort_key__(file: str) -> tuple:
+        """
+        Get the key used to sort a data file into journal order. Sequence numbers are compared numerically, a plain string sort would read
+        "strand.11-15.ion" before "strand.6-10.ion". Files not following the export naming scheme are sorted after them by path
+
+        :param file: Local file path or S3 key
+        :return: Sort key
+        """
+        match = JournalReader.__data_file_name_pattern__.match(file.replace('\\', '/').split('/')[-1])
+
+        if match is None:
+            return 1, '', 0, file
+
+        return 0, match.group('strand_id'), int(match.group('start')), file
+
+    @staticmethod
+    def __parse_json__(data: str) -> List[Any]:
+        """
+        Parse a file containing a sequence of JSON documents
+
+        :param data: File content
+        :return: List of parsed documents
+        """
+        decoder = json.JSONDecoder()
+        documents = []
+        position = 0
+
+        while True:
+            # Skip whitespace (including newlines) between documents
+            while position < len(data) and data[position].isspace():
+                position = position + 1
+
+            if position >= len(data):
+                return documents
+
+            document, position = decoder.raw_decode(data, position)
+            documents.append(document)
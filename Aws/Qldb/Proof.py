@@ -0,0 +1,120 @@
+import hashlib
+
+from typing import List
+
+from amazon.ion import simpleion
+
+
+class Proof:
+    """
+    QLDB Merkle proof helpers used to verify document revisions against a ledger digest
+    """
+    @staticmethod
+    def get_block_address_ion_text(block_address: dict) -> str:
+        """
+        Convert a block address to the Ion text representation expected by the QLDB API
+
+        :param block_address: Dictionary containing the "strandId" and "sequenceNo"
+        :return: Ion text
+        """
+        return '{{strandId: "{strand_id}", sequenceNo: {sequence_number}}}'.format(
+            strand_id=block_address['strandId'],
+            sequence_number=int(block_address['sequenceNo'])
+        )
+
+    @staticmethod
+    def parse_block_address(ion_text: str) -> dict:
+        """
+        Parse the Ion text representation of a block address
+
+        :param ion_text: Ion text
+        :return: Dictionary containing the "strandId" and "sequenceNo"
+        """
+        block_address = simpleion.loads(ion_text)
+
+        return {
+            'strandId': str(block_address['strandId']),
+            'sequenceNo': int(block_address['sequenceNo'])
+        }
+
+    @staticmethod
+    def parse_proof(ion_text: str) -> List[bytes]:
+        """
+        Parse the Ion text representation of a proof
+
+        :param ion_text: Ion text
+        :return: List of proof hashes
+        """
+        return [bytes(proof_hash) for proof_hash in simpleion.loads(ion_text)]
+
+    @staticmethod
+    def parse_revision_hash(ion_text: str) -> bytes:
+        """
+        Parse the hash from the Ion text representation of a revision
+
+        :param ion_text: Ion text
+        :return: Revision hash
+        """
+        return bytes(simpleion.loads(ion_text)['hash'])
+
+    @staticmethod
+    def verify(revision_hash: bytes, proof_hashes: List[bytes], digest: bytes) -> bool:
+        """
+        Verify a revision hash against a digest by recomputing the Merkle tree root from the proof
+
+        :param revision_hash: Hash of the document revision
+        :param proof_hashes: Proof hashes returned with the revision
+        :param digest: Ledger digest
+        :return: True if the recomputed root matches the digest
+        """
+        candidate = revision_hash
+
+        for proof_hash in proof_hashes:
+            candidate = Proof.join_hashes(candidate, proof_hash)
+
+        return candidate == digest
+
+    @staticmethod
+    def join_hashes(first: bytes, second: bytes) -> bytes:
+        """
+        Combine two hashes into their parent hash, the hashes are concatenated in sorted order before hashing
+
+        :param first: First hash
+        :param second: Second hash
+        :return: Parent hash
+        """
+        if len(first) == 0:
+            return second
+
+        if len(second) == 0:
+            return first
+
+        if Proof.compare_hashes(first, second) < 0:
+            concatenated = first + second
+        else:
+            concatenated = second + first
+
+        return hashlib.sha256(concatenated).digest()
+
+    @staticmethod
+    def compare_hashes(first: bytes, second: bytes) -> int:
+        """
+        Compare two hashes as QLDB does, byte by byte from the last byte treating each byte as signed
+
+        :param first: First hash
+        :param second: Second hash
+        :return: Negative if the first hash sorts before the second, positive if after and zero if equal
+
+        :raises ValueError: if the hashes are of different lengths
+        """
+        if len(first) != len(second):
+            raise ValueError('Hashes must be the same length')
+
+        for index in range(len(first) - 1, -1, -1):
+            difference = int.from_bytes(first[index:index + 1], byteorder='big', signed=True) - \
+                int.from_bytes(second[index:index + 1], byteorder='big', signed=True)
+
+            if difference != 0:
+                return difference
+
+        return 0
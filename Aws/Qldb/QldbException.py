@@ -0,0 +1,2 @@
+class QldbException(Exception):
+    pass
\ No newline at end of file
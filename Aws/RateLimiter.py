@@ -0,0 +1,314 @@
+import asyncio
+import threading
+
+from time import monotonic, sleep
+from typing import Optional
+
+from Aws.Backoff import Backoff
+from Aws.Lambda.Log import Log
+
+
+class RateLimiter:
+    """
+    Process wide adaptive token bucket rate limiter. A bucket is shared by every client using the same service, region and account (and
+    optionally operation), its rate is reduced multiplicatively whenever a request is throttled and increased additively while requests succeed so
+    throughput settles just below the service limit rather than oscillating between throttling storms and idle retries. Buckets of services
+    without a configured rate do not limit requests until the first throttle, their rate then starts from the observed request rate
+    """
+
+    # Lowest rate a throttled bucket is reduced to
+    __min_rate__ = 0.5
+
+    # Factor applied to the rate when a request is throttled, and the number of seconds in which further throttles are ignored
+    __decrease_factor__ = 0.7
+    __decrease_cooldown__ = 1.0
+
+    # Approximate increase in rate per second of successful requests
+    __increase__ = 1.0
+
+    # Services whose request limits apply across all regions
+    __global_services__ = ('route53', 'iam', 'organizations', 'cloudfront')
+
+    # Configured rates indexed by service name, or by service name and operation name
+    __rates__ = {
+        'route53': {'rate': 5.0, 'max_rate': 5.0, 'burst': 5.0}
+    }
+
+    # Shared buckets indexed by service, region, account and (for overridden operations) operation name
+    __limiters__ = {}
+    __limiters_lock__ = threading.Lock()
+
+    __enabled__ = True
+
+    def __init__(self, rate=None, max_rate=None, burst=None):
+        """
+        Initialize a token bucket
+
+        :param rate: Initial number of requests permitted per second, if not set requests are not limited until the first throttle
+        :type rate: Optional[float]
+
+        :param max_rate: Maximum rate the bucket may grow to while requests succeed, defaults to the initial rate (or no maximum if no initial
+                         rate is set)
+        :type max_rate: Optional[float]
+
+        :param burst: Maximum number of requests that may be sent at once, defaults to one second of requests
+        :type burst: Optional[float]
+        """
+        self.__rate__ = None if rate is None else float(rate)
+        self.__max_rate__ = float(max_rate or rate or 'inf')
+        self.__burst__ = None if rate is None else float(burst or max(1.0, rate))
+        self.__tokens__ = self.__burst__
+        self.__updated__ = monotonic()
+        self.__decreased__ = 0.0
+        self.__lock__ = threading.Lock()
+
+        # Requests sent while unlimited, counted per second so the rate can start from the observed throughput once throttled
+        self.__window_started__ = self.__updated__
+        self.__window_requests__ = 0
+        self.__observed_rate__ = 0.0
+
+    def get_rate(self) -> Optional[float]:
+        """
+        Get the current number of requests permitted per second
+
+        :return: Request rate, or None if requests are not limited
+        """
+        return self.__rate__
+
+    def acquire(self) -> float:
+        """
+        Take a token from the bucket, waiting until one is available
+
+        :return: Number of seconds waited
+        """
+        delay = self.reserve()
+
+        if delay > 0:
+            sleep(delay)
+
+        return delay
+
+    async def acquire_async(self) -> float:
+        """
+        Take a token from the bucket, waiting without blocking the event loop until one is available
+
+        :return: Number of seconds waited
+        """
+        delay = self.reserve()
+
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        return delay
+
+    def reserve(self) -> float:
+        """
+        Take a token from the bucket without waiting, the caller must wait the returned delay before sending its request
+
+        :return: Number of seconds until the token is available
+        """
+        with self.__lock__:
+            if self.__rate__ is None:
+                self.__count_request__()
+                return 0.0
+
+            self.__refill__()
+            self.__tokens__ = self.__tokens__ - 1
+
+            # Tokens are reserved before waiting so concurrent callers queue behind each other rather than all waking at once
+            return 0.0 if self.__tokens__ >= 0 else -self.__tokens__ / self.__rate__
+
+    def on_success(self) -> None:
+        """
+        Record a successful request, increasing the rate towards the maximum
+        """
+        with self.__lock__:
+            if self.__rate__ is not None and self.__rate__ < self.__max_rate__:
+                self.__refill__()
+                self.__rate__ = min(self.__max_rate__, self.__rate__ + RateLimiter.__increase__ / self.__rate__)
+
+    def on_throttle(self) -> None:
+        """
+        Record a throttled request, reducing the rate and discarding any accumulated burst
+        """
+        with self.__lock__:
+            now = monotonic()
+
+            # Requests already in flight when the limit was hit are throttled together, only reduce the rate once for them
+            if now - self.__decreased__ < RateLimiter.__decrease_cooldown__:
+                return
+
+            if self.__rate__ is None:
+                # First throttle of an unlimited bucket, start limiting from the rate at which requests were being sent
+                self.__count_request__()
+                self.__rate__ = max(self.__observed_rate__, self.__window_requests__ / max(1.0, now - self.__window_started__))
+                self.__burst__ = max(1.0, self.__rate__)
+                self.__tokens__ = 0.0
+
+            self.__refill__()
+            self.__rate__ = max(RateLimiter.__min_rate__, self.__rate__ * RateLimiter.__decrease_factor__)
+            self.__tokens__ = min(self.__tokens__, 0.0)
+            self.__decreased__ = now
+
+        Log.debug('Request throttled, reduced rate to {rate:.2f} requests per second'.format(rate=self.__rate__))
+
+    def __count_request__(self) -> None:
+        """
+        Count a request sent while the bucket is unlimited, must be called while holding the lock
+        """
+        now = monotonic()
+        elapsed = now - self.__window_started__
+
+        if elapsed >= 1.0:
+            self.__observed_rate__ = self.__window_requests__ / elapsed
+            self.__window_started__ = now
+            self.__window_requests__ = 0
+
+        self.__window_requests__ = self.__window_requests__ + 1
+
+    def __refill__(self) -> None:
+        """
+        Add the tokens accumulated since the bucket was last updated, must be called while holding the lock
+        """
+        now = monotonic()
+        self.__tokens__ = min(self.__burst__, self.__tokens__ + (now - self.__updated__) * self.__rate__)
+        self.__updated__ = now
+
+    @staticmethod
+    def set_enabled(enabled) -> None:
+        """
+        Enable or disable rate limiting for all clients
+
+        :param enabled: If FALSE requests are sent without waiting for a token
+        :type enabled: bool
+        """
+        RateLimiter.__enabled__ = enabled
+
+    @staticmethod
+    def set_rate(service_name, rate, max_rate=None, burst=None, operation_name=None) -> None:
+        """
+        Configure the rate of a service, or of a single operation which is then limited by its own bucket. Buckets already in use are replaced
+
+        :param service_name: The service name (e.g. 'ecs')
+        :type service_name: str
+
+        :param rate: Initial number of requests permitted per second
+        :type rate: float
+
+        :param max_rate: Maximum rate the bucket may grow to while requests succeed, defaults to the initial rate
+        :type max_rate: Optional[float]
+
+        :param burst: Maximum number of requests that may be sent at once, defaults to one second of requests
+        :type burst: Optional[float]
+
+        :param operation_name: Optional operation name (e.g. 'RunTask')
+        :type operation_name: Optional[str]
+        """
+        with RateLimiter.__limiters_lock__:
+            RateLimiter.__rates__[RateLimiter.__get_rate_key__(service_name, operation_name)] = {
+                'rate': rate,
+                'max_rate': max_rate,
+                'burst': burst
+            }
+
+            for key in list(RateLimiter.__limiters__.keys()):
+                if key[0] == service_name and (operation_name is None or key[3] == operation_name):
+                    del RateLimiter.__limiters__[key]
+
+    @staticmethod
+    def get_limiter(service_name, region_name, account, operation_name) -> 'RateLimiter':
+        """
+        Get the shared bucket limiting an operation, creating it on first use
+
+        :param service_name: The service name
+        :type service_name: str
+
+        :param region_name: The region name
+        :type region_name: Optional[str]
+
+        :param account: Identifier of the account, e.g. a credential identifier
+        :type account: str
+
+        :param operation_name: The operation name
+        :type operation_name: str
+
+        :return: Rate limiter
+        """
+        if service_name in RateLimiter.__global_services__:
+            region_name = None
+
+        operation_key = RateLimiter.__get_rate_key__(service_name, operation_name)
+
+        if operation_key not in RateLimiter.__rates__:
+            operation_name = None
+
+        key = (service_name, region_name, account, operation_name)
+
+        with RateLimiter.__limiters_lock__:
+            if key not in RateLimiter.__limiters__:
+                settings = RateLimiter.__rates__.get(RateLimiter.__get_rate_key__(service_name, operation_name)) or {}
+                RateLimiter.__limiters__[key] = RateLimiter(
+                    rate=settings.get('rate'),
+                    max_rate=settings.get('max_rate'),
+                    burst=settings.get('burst')
+                )
+
+            return RateLimiter.__limiters__[key]
+
+    @staticmethod
+    def register(client, account, asynchronous=False) -> None:
+        """
+        Limit the requests sent by a Boto3 client. A token is taken before every request (including retries) is sent, and the response of every
+        attempt is used to adapt the rate
+
+        :param client: Boto3 client
+        :type client: Object
+
+        :param account: Identifier of the account the client sends requests to, e.g. a credential identifier
+        :type account: str
+
+        :param asynchronous: If TRUE the client is an aiobotocore client, requests wait for a token without blocking the event loop
+        :type asynchronous: bool
+        """
+        service_name = client.meta.service_model.service_name
+        region_name = client.meta.region_name
+
+        def before_send(event_name, **kwargs) -> None:
+            if RateLimiter.__enabled__ is True:
+                RateLimiter.get_limiter(service_name, region_name, account, event_name.split('.')[-1]).acquire()
+
+        def needs_retry(event_name, response=None, **kwargs) -> None:
+            if RateLimiter.__enabled__ is False or response is None:
+                return
+
+            limiter = RateLimiter.get_limiter(service_name, region_name, account, event_name.split('.')[-1])
+
+            if Backoff.is_throttling_response(response) is True:
+                limiter.on_throttle()
+            elif response[0].status_code < 400:
+                limiter.on_success()
+
+        async def before_send_async(event_name, **kwargs) -> None:
+            if RateLimiter.__enabled__ is True:
+                await RateLimiter.get_limiter(service_name, region_name, account, event_name.split('.')[-1]).acquire_async()
+
+        client.meta.events.register('before-send', before_send_async if asynchronous is True else before_send)
+        client.meta.events.register('needs-retry', needs_retry)
+
+    @staticmethod
+    def __get_rate_key__(service_name, operation_name=None) -> str:
+        """
+        Get the key of a configured rate
+
+        :param service_name: The service name
+        :type service_name: str
+
+        :param operation_name: Optional operation name
+        :type operation_name: Optional[str]
+
+        :return: Rate key
+        """
+        if operation_name is None:
+            return service_name
+
+        return '{service_name}.{operation_name}'.format(service_name=service_name, operation_name=operation_name)
@@ -0,0 +1,139 @@
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+from Aws.Credential import Credential
+from Aws.Ec2.Client import Client as Ec2Client
+from Aws.Lambda.Log import Log
+
+
+class RegionExecutor:
+    """
+    Execute a client method in multiple regions concurrently
+    """
+    def __init__(self, credential, region_name, max_workers=16):
+        """
+        Initialize the region executor
+
+        :param credential: The credential used to authenticate to AWS
+        :type credential: Optional[Credential]
+
+        :param region_name: Region used to discover the enabled regions
+        :type region_name: str
+
+        :param max_workers: Maximum number of regions processed concurrently
+        :type max_workers: int
+        """
+        # If no credential is supplied- use default system permission, shared by all regions
+        if credential is None:
+            credential = Credential()
+
+        self.__credential__ = credential
+        self.__region_name__ = region_name
+        self.__max_workers__ = max_workers
+        self.__clients__ = {}
+        self.__clients_lock__ = threading.Lock()
+
+    def get_region_names(self) -> List[str]:
+        """
+        List the names of all regions enabled for the account
+
+        :return: List of region names
+        """
+        ec2_client = self.get_client(Ec2Client, self.__region_name__)
+
+        return sorted(ec2_client.describe_regions().keys())
+
+    def get_client(self, client_class, region_name):
+        """
+        Return a client for the requested region, clients are created once and reused for subsequent executions
+
+        :param client_class: The client class (e.g. Aws.Ecs.Client.Client)
+        :type client_class: type
+
+        :param region_name: Region in which the client will operate
+        :type region_name: str
+
+        :return: Client instance
+        """
+        key = (client_class, region_name)
+
+        with self.__clients_lock__:
+            if key not in self.__clients__:
+                self.__clients__[key] = client_class(self.__credential__, region_name)
+
+            return self.__clients__[key]
+
+    def execute(self, client_class, method_name, arguments=None, region_names=None) -> dict:
+        """
+        Call a client method in every enabled region (or the requested subset of regions) concurrently
+
+        :param client_class: The client class (e.g. Aws.Ecs.Client.Client)
+        :type client_class: type
+
+        :param method_name: Name of the client method to call
+        :type method_name: str
+
+        :param arguments: Dictionary of arguments to be passed to the method
+        :type arguments: Optional[dict]
+
+        :param region_names: Optional list of region names, defaults to all enabled regions
+        :type region_names: Optional[List[str]]
+
+        :return: Dictionary containing method return values ("results") and raised exceptions ("errors"), each indexed by region name
+        """
+        if arguments is None:
+            arguments = {}
+
+        if region_names is None:
+            region_names = self.get_region_names()
+
+        results = {}
+        errors = {}
+
+        if len(region_names) == 0:
+            return {'results': results, 'errors': errors}
+
+        Log.trace('Executing {method_name} in {count} regions...'.format(method_name=method_name, count=len(region_names)))
+
+        with ThreadPoolExecutor(max_workers=min(self.__max_workers__, len(region_names))) as executor:
+            futures = {}
+
+            for region_name in region_names:
+                futures[region_name] = executor.submit(self.__execute_region__, client_class, method_name, arguments, region_name)
+
+            for region_name, future in futures.items():
+                try:
+                    results[region_name] = future.result()
+                except Exception as region_exception:
+                    Log.warning('Failed to execute {method_name} in region ({region_name}): {region_exception}'.format(
+                        method_name=method_name,
+                        region_name=region_name,
+                        region_exception=region_exception
+                    ))
+                    errors[region_name] = region_exception
+
+        return {'results': results, 'errors': errors}
+
+    def __execute_region__(self, client_class, method_name, arguments, region_name):
+        """
+        Call a client method in a single region
+
+        :param client_class: The client class
+        :type client_class: type
+
+        :param method_name: Name of the client method to call
+        :type method_name: str
+
+        :param arguments: Dictionary of arguments to be passed to the method
+        :type arguments: dict
+
+        :param region_name: The region name
+        :type region_name: str
+
+        :return: The methods return value
+        """
+        client = self.get_client(client_class, region_name)
+
+        return getattr(client, method_name)(**arguments)
@@ -0,0 +1,188 @@
+import copy
+import hashlib
+import json
+
+from botocore.awsrequest import AWSResponse
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from Aws.Cache import Cache
+from Aws.Lambda.Log import Log
+
+
+class ResponseCache:
+    """
+    Opt-in process wide cache of read only API responses (describe, list and get operations). Responses are cached by service, region, account,
+    operation and arguments for a configurable time, any other operation invalidates every cached response of its service in the same region and
+    account so callers never read their own writes stale
+    """
+    # Operation name prefixes of read only operations whose responses may be cached
+    __read_operation_prefixes__ = ('Describe', 'List', 'Get')
+
+    # Default number of seconds a response remains valid
+    __default_ttl__ = 30
+
+    # Number of seconds responses remain valid indexed by service name, or by service name and operation name (zero disables caching)
+    __ttls__ = {}
+
+    __cache__ = Cache(max_size=1024)
+    __enabled__ = False
+
+    # Set while requests in the current thread (or asyncio task) must not be served from the cache
+    __bypass__ = ContextVar('response_cache_bypass', default=False)
+
+    @staticmethod
+    def set_enabled(enabled, ttl=None, max_size=None) -> None:
+        """
+        Enable or disable response caching for all clients, cached responses are discarded
+
+        :param enabled: If TRUE read only responses are cached
+        :type enabled: bool
+
+        :param ttl: Optional default number of seconds a response remains valid
+        :type ttl: Optional[float]
+
+        :param max_size: Optional maximum number of responses held before the least recently used response is evicted
+        :type max_size: Optional[int]
+        """
+        if ttl is not None:
+            ResponseCache.__default_ttl__ = ttl
+
+        if max_size is not None:
+            ResponseCache.__cache__ = Cache(max_size=max_size)
+
+        ResponseCache.__cache__.clear()
+        ResponseCache.__enabled__ = enabled
+
+    @staticmethod
+    def set_ttl(service_name, ttl, operation_name=None) -> None:
+        """
+        Set the number of seconds responses of a service, or of a single operation, remain valid
+
+        :param service_name: The service name (e.g. 'ecs')
+        :type service_name: str
+
+        :param ttl: Number of seconds responses remain valid, zero disables caching
+        :type ttl: float
+
+        :param operation_name: Optional operation name (e.g. 'DescribeClusters')
+        :type operation_name: Optional[str]
+        """
+        if operation_name is not None:
+            service_name = '{service_name}.{operation_name}'.format(service_name=service_name, operation_name=operation_name)
+
+        ResponseCache.__ttls__[service_name] = ttl
+
+    @staticmethod
+    def clear() -> None:
+        """
+        Discard all cached responses
+        """
+        ResponseCache.__cache__.clear()
+
+    @staticmethod
+    @contextmanager
+    def bypass(enabled=True):
+        """
+        Send every request made within the context to AWS rather than serving it from the cache, e.g. while polling for a status change. Fresh
+        responses still replace the cached responses. Requests made by other threads started within the context are not bypassed
+
+        :param enabled: If FALSE the context has no effect, allowing callers to bypass the cache conditionally
+        :type enabled: bool
+        """
+        token = ResponseCache.__bypass__.set(enabled is True or ResponseCache.__bypass__.get())
+
+        try:
+            yield
+        finally:
+            ResponseCache.__bypass__.reset(token)
+
+    @staticmethod
+    def register(client, account) -> None:
+        """
+        Cache the responses of a Boto3 client
+
+        :param client: Boto3 client
+        :type client: Object
+
+        :param account: Identifier of the account the client sends requests to, e.g. a credential identifier
+        :type account: str
+        """
+        service_name = client.meta.service_model.service_name
+        namespace = '{service_name}:{region_name}:{account}:'.format(service_name=service_name, region_name=client.meta.region_name, account=account)
+
+        def before_parameter_build(params, model, context, **kwargs) -> None:
+            if ResponseCache.__enabled__ is False or ResponseCache.__is_read_operation__(model.name) is False:
+                return
+
+            ttl = ResponseCache.__get_ttl__(service_name, model.name)
+
+            if ttl > 0:
+                arguments = hashlib.md5(json.dumps(params, sort_keys=True, default=str).encode()).hexdigest()
+                context['response_cache'] = {'key': namespace + model.name + ':' + arguments, 'ttl': ttl}
+
+        def before_call(context, **kwargs):
+            if ResponseCache.__enabled__ is False or 'response_cache' not in context or ResponseCache.__bypass__.get() is True:
+                return None
+
+            parsed = ResponseCache.__cache__.get(context['response_cache']['key'])
+
+            if parsed is None:
+                return None
+
+            # Skip the request, a successful response must be returned alongside the parsed response
+            context['response_cache']['hit'] = True
+            return AWSResponse(url='', status_code=200, headers={}, raw=None), copy.deepcopy(parsed)
+
+        def after_call(http_response, parsed, model, context, **kwargs) -> None:
+            if ResponseCache.__enabled__ is False:
+                return
+
+            if ResponseCache.__is_read_operation__(model.name) is False:
+                Log.trace('Invalidating cached {service_name} responses after {operation_name}'.format(
+                    service_name=service_name,
+                    operation_name=model.name
+                ))
+                ResponseCache.__cache__.delete_matching(lambda key: key.startswith(namespace))
+                return
+
+            cache = context.get('response_cache')
+
+            if cache is not None and cache.get('hit') is not True and http_response.status_code < 300:
+                ResponseCache.__cache__.set(cache['key'], copy.deepcopy(parsed), ttl=cache['ttl'])
+
+        client.meta.events.register('before-parameter-build', before_parameter_build)
+        client.meta.events.register('before-call', before_call)
+        client.meta.events.register('after-call', after_call)
+
+    @staticmethod
+    def __is_read_operation__(operation_name) -> bool:
+        """
+        Check if an operation only reads data
+
+        :param operation_name: The operation name
+        :type operation_name: str
+
+        :return: True if responses of the operation may be cached
+        """
+        return operation_name.startswith(ResponseCache.__read_operation_prefixes__)
+
+    @staticmethod
+    def __get_ttl__(service_name, operation_name) -> float:
+        """
+        Get the number of seconds responses of an operation remain valid
+
+        :param service_name: The service name
+        :type service_name: str
+
+        :param operation_name: The operation name
+        :type operation_name: str
+
+        :return: Number of seconds
+        """
+        operation_key = '{service_name}.{operation_name}'.format(service_name=service_name, operation_name=operation_name)
+
+        if operation_key in ResponseCache.__ttls__:
+            return ResponseCache.__ttls__[operation_key]
+
+        return ResponseCache.__ttls__.get(service_name, ResponseCache.__default_ttl__)
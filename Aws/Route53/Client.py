@@ -1,6 +1,15 @@
+import hashlib
+import json
+
+from concurrent.futures import ThreadPoolExecutor
+
+from botocore.exceptions import ClientError
+
+from Aws.Backoff import Backoff
 from Aws.BaseClient import BaseClient
+from Aws.Cache import Cache
 from Aws.Iterator import Iterator
-from typing import Optional
+from typing import Generator, List, Optional
 
 from Aws.Lambda.Log import Log
 
@@ -11,6 +20,14 @@ class Client(BaseClient):
     """
     __client_identifier__ = 'route53'
 
+    # Per request limits of change resource record set requests, UPSERT changes count double towards the record and character limits
+    __change_batch_max_changes__ = 1000
+    __change_batch_max_records__ = 1000
+    __change_batch_max_characters__ = 32000
+
+    # Process wide index of hosted zone IDs indexed by credential and hosted zone name
+    __hosted_zone_id_cache__ = Cache(max_size=4096, ttl=300)
+
     def __init__(self, credential, region_name):
         """
         Setup an ECS client
@@ -34,7 +51,10 @@ class Client(BaseClient):
         hosted_zone_ids = Iterator.iterate(
             client=self.__client__,
             method_name='list_hosted_zones',
-            data_key='HostedZones'
+            data_key='HostedZones',
+            token_key_next='NextMarker',
+            token_key_write='Marker',
+            truncated_key='IsTruncated'
         )
 
         for hosted_zone in hosted_zone_ids:
@@ -53,14 +73,91 @@ class Client(BaseClient):
         hosted_zone_ids = Iterator.iterate(
             client=self.__client__,
             method_name='list_hosted_zones',
-            data_key='HostedZones'
+            data_key='HostedZones',
+            token_key_next='NextMarker',
+            token_key_write='Marker',
+            truncated_key='IsTruncated'
         )
 
         for hosted_zone in hosted_zone_ids:
             hosted_zones[hosted_zone['Name']] = hosted_zone
+            Client.__hosted_zone_id_cache__.set(self.__get_hosted_zone_id_cache_key__(hosted_zone['Name']), hosted_zone['Id'])
 
         return hosted_zones
 
+    def stream_resource_record_sets(self, hosted_zone_id, start_record_name=None, start_record_type=None) -> Generator[dict, None, None]:
+        """
+        Iterate all record sets in a hosted zone, record sets are yielded a page at a time so zones of any size can be walked with bounded memory
+
+        :param hosted_zone_id: Hosted zone ID
+        :type hosted_zone_id: str
+
+        :param start_record_name: Optional record name to start listing from
+        :type start_record_name: Optional[str]
+
+        :param start_record_type: Optional record type to start listing from (requires start_record_name)
+        :type start_record_type: Optional[str]
+
+        :return: Generator of record set dictionaries
+        """
+        arguments = {
+            'HostedZoneId': hosted_zone_id
+        }
+
+        if start_record_name is not None:
+            arguments['StartRecordName'] = start_record_name
+
+        if start_record_type is not None:
+            arguments['StartRecordType'] = start_record_type
+
+        return Iterator.stream(
+            client=self.__client__,
+            method_name='list_resource_record_sets',
+            data_key='ResourceRecordSets',
+            arguments=arguments,
+            token_keys={
+                'NextRecordName': 'StartRecordName',
+                'NextRecordType': 'StartRecordType',
+                'NextRecordIdentifier': 'StartRecordIdentifier'
+            },
+            truncated_key='IsTruncated'
+        )
+
+    def get_hosted_zone_id(self, hosted_zone_name) -> Optional[str]:
+        """
+        Get the ID of a hosted zone, using a cached index of hosted zone names where possible
+
+        :param hosted_zone_name: Hosted zone name
+        :type hosted_zone_name: str
+
+        :return: Hosted zone ID, or None if the hosted zone could not be found
+        """
+        cache_key = self.__get_hosted_zone_id_cache_key__(hosted_zone_name)
+        hosted_zone_id = Client.__hosted_zone_id_cache__.get(cache_key)
+
+        if hosted_zone_id is not None:
+            return hosted_zone_id
+
+        # Hosted zones are listed in order of name, so starting the listing at the requested name finds it in a single call
+        result = self.__client__.list_hosted_zones_by_name(
+            DNSName=Client.__normalize_name__(hosted_zone_name),
+            MaxItems='1'
+        )
+
+        for hosted_zone in result.get('HostedZones', []):
+            if Client.__normalize_name__(hosted_zone['Name']) == Client.__normalize_name__(hosted_zone_name):
+                Client.__hosted_zone_id_cache__.set(cache_key, hosted_zone['Id'])
+                return hosted_zone['Id']
+
+        return None
+
+    @staticmethod
+    def invalidate_hosted_zone_id_cache() -> None:
+        """
+        Remove all cached hosted zone IDs
+        """
+        Client.__hosted_zone_id_cache__.clear()
+
     def create_name_server_record(self, hosted_zone_name, domain_name, name_servers) -> dict:
         """
         List all available hosted zones indexed by name
@@ -76,32 +173,353 @@ class Client(BaseClient):
 
         :return: Dictionary of ECS clusters indexed by their ARN
         """
-        hosted_zones = self.list_hosted_zones_by_name()
+        hosted_zone_id = self.get_hosted_zone_id(hosted_zone_name)
 
-        if hosted_zone_name not in hosted_zones:
+        if hosted_zone_id is None:
             raise Exception('Could not locate requested hosted zone ({hosted_zone_name})'.format(hosted_zone_name=hosted_zone_name))
 
         resource_records = []
         for value in name_servers:
             resource_records.append({'Value': value})
 
-        try:
-            self.__client__.change_resource_record_sets(
-                HostedZoneId = hosted_zones[hosted_zone_name]['Id'],
-                ChangeBatch={
-                    'Comment': 'Delegate domain to project/environment account',
-                    'Changes': [
-                        {
-                            'Action': 'UPSERT',
-                            'ResourceRecordSet': {
-                                'Name': domain_name,
-                                'Type': 'NS',
-                                'TTL': 60,
-                                'ResourceRecords': resource_records
-                            }
-                        }
-                    ]
+        change_batch = {
+            'Comment': 'Delegate domain to project/environment account',
+            'Changes': [
+                {
+                    'Action': 'UPSERT',
+                    'ResourceRecordSet': {
+                        'Name': domain_name,
+                        'Type': 'NS',
+                        'TTL': 60,
+                        'ResourceRecords': resource_records
+                    }
                 }
-            )
+            ]
+        }
+
+        try:
+            try:
+                self.__client__.change_resource_record_sets(HostedZoneId=hosted_zone_id, ChangeBatch=change_batch)
+            except ClientError as client_error:
+                if client_error.response.get('Error', {}).get('Code') != 'NoSuchHostedZone':
+                    raise client_error
+
+                # The cached hosted zone ID is stale (e.g. the zone was recreated), look it up again and retry
+                Client.__hosted_zone_id_cache__.delete(self.__get_hosted_zone_id_cache_key__(hosted_zone_name))
+                hosted_zone_id = self.get_hosted_zone_id(hosted_zone_name)
+
+                if hosted_zone_id is None:
+                    raise client_error
+
+                self.__client__.change_resource_record_sets(HostedZoneId=hosted_zone_id, ChangeBatch=change_batch)
         except Exception as e:
-            raise Exception('Could not delegate domain name ({domain_name})'.format(domain_name=domain_name))
\ No newline at end of file
+            raise Exception('Could not delegate domain name ({domain_name})'.format(domain_name=domain_name))
+
+    def change_resource_record_sets(self, changes, comment=None, max_workers=8, max_attempts=5) -> dict:
+        """
+        Apply a large number of record set changes. Changes are packed into as few requests as the per request change, record and character
+        limits allow, requests for each hosted zone are submitted in order while different hosted zones are updated concurrently
+
+        :param changes: Dictionary of changes (e.g. {'Action': 'UPSERT', 'ResourceRecordSet': {...}}) indexed by hosted zone ID
+        :type changes: Dict[str, List[dict]]
+
+        :param comment: Optional comment attached to each change batch
+        :type comment: Optional[str]
+
+        :param max_workers: Maximum number of hosted zones updated concurrently
+        :type max_workers: int
+
+        :param max_attempts: Maximum number of attempts for each throttled request
+        :type max_attempts: int
+
+        :return: Dictionary containing the submitted change IDs ("change_ids") and any raised exceptions ("errors"), each indexed by hosted zone ID
+
+        :raises Exception: if a single change exceeds the per request limits
+        """
+        batches = {}
+
+        for hosted_zone_id, hosted_zone_changes in changes.items():
+            batches[hosted_zone_id] = Client.__pack_changes__(hosted_zone_changes)
+
+        change_ids = {}
+        errors = {}
+
+        if len(batches) == 0:
+            return {'change_ids': change_ids, 'errors': errors}
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(batches))) as executor:
+            futures = {}
+
+            for hosted_zone_id, hosted_zone_batches in batches.items():
+                futures[hosted_zone_id] = executor.submit(self.__submit_change_batches__, hosted_zone_id, hosted_zone_batches, comment, max_attempts)
+
+            for hosted_zone_id, future in futures.items():
+                try:
+                    change_ids[hosted_zone_id] = future.result()
+                except Exception as change_exception:
+                    Log.error('Failed to change record sets in hosted zone ({hosted_zone_id}): {change_exception}'.format(
+                        hosted_zone_id=hosted_zone_id,
+                        change_exception=change_exception
+                    ))
+                    errors[hosted_zone_id] = change_exception
+
+        return {'change_ids': change_ids, 'errors': errors}
+
+    def sync_resource_record_sets(self, hosted_zone_id, record_sets, delete_unmanaged=False, dry_run=False, comment=None) -> dict:
+        """
+        Reconcile a hosted zone with a desired list of record sets, submitting only the changes required. The current record sets are streamed and
+        compared against a hashed index of the desired record sets, so reconciling an unchanged zone only costs read requests
+
+        :param hosted_zone_id: Hosted zone ID
+        :type hosted_zone_id: str
+
+        :param record_sets: The desired record sets (in the format accepted by change_resource_record_sets)
+        :type record_sets: List[dict]
+
+        :param delete_unmanaged: If TRUE record sets that are not in the desired list will be deleted (the zone apex SOA and NS records are never
+                                 deleted)
+        :type delete_unmanaged: bool
+
+        :param dry_run: If TRUE the planned changes are returned without being submitted
+        :type dry_run: bool
+
+        :param comment: Optional comment attached to each change batch
+        :type comment: Optional[str]
+
+        :return: Dictionary containing lists of record sets to "create", "update" and "delete", the number of "unchanged" record sets and the
+                 submitted "change_ids" (empty if this was a dry run or there were no changes)
+
+        :raises Exception: on failure to apply the changes
+        """
+        desired = {}
+
+        for record_set in record_sets:
+            desired[Client.__get_record_set_key__(record_set)] = (Client.__get_record_set_hash__(record_set), record_set)
+
+        plan = {
+            'create': [],
+            'update': [],
+            'delete': [],
+            'unchanged': 0,
+            'change_ids': []
+        }
+
+        zone_name = None
+
+        if delete_unmanaged is True:
+            zone_name = Client.__normalize_name__(self.__client__.get_hosted_zone(Id=hosted_zone_id)['HostedZone']['Name'])
+
+        seen = set()
+
+        for record_set in self.stream_resource_record_sets(hosted_zone_id):
+            key = Client.__get_record_set_key__(record_set)
+
+            if key in desired:
+                seen.add(key)
+
+                if desired[key][0] == Client.__get_record_set_hash__(record_set):
+                    plan['unchanged'] = plan['unchanged'] + 1
+                else:
+                    plan['update'].append(desired[key][1])
+
+                continue
+
+            if delete_unmanaged is False:
+                continue
+
+            # Never remove the records Route53 manages for the zone itself
+            if record_set['Type'] in ('SOA', 'NS') and key[0] == zone_name:
+                continue
+
+            plan['delete'].append(record_set)
+
+        for key, (record_set_hash, record_set) in desired.items():
+            if key not in seen:
+                plan['create'].append(record_set)
+
+        Log.info('Hosted zone ({hosted_zone_id}) sync plan: {create} to create, {update} to update, {delete} to delete, {unchanged} unchanged'.format(
+            hosted_zone_id=hosted_zone_id,
+            create=len(plan['create']),
+            update=len(plan['update']),
+            delete=len(plan['delete']),
+            unchanged=plan['unchanged']
+        ))
+
+        changes = []
+        changes.extend([{'Action': 'DELETE', 'ResourceRecordSet': record_set} for record_set in plan['delete']])
+        changes.extend([{'Action': 'UPSERT', 'ResourceRecordSet': record_set} for record_set in plan['update']])
+        changes.extend([{'Action': 'CREATE', 'ResourceRecordSet': record_set} for record_set in plan['create']])
+
+        if dry_run is True or len(changes) == 0:
+            return plan
+
+        result = self.change_resource_record_sets(changes={hosted_zone_id: changes}, comment=comment)
+
+        if hosted_zone_id in result['errors']:
+            raise Exception('Could not sync hosted zone ({hosted_zone_id}): {error}'.format(
+                hosted_zone_id=hosted_zone_id,
+                error=result['errors'][hosted_zone_id]
+            ))
+
+        plan['change_ids'] = result['change_ids'][hosted_zone_id]
+
+        return plan
+
+    def __submit_change_batches__(self, hosted_zone_id, batches, comment, max_attempts) -> List[str]:
+        """
+        Submit change batches to a hosted zone in order
+
+        :param hosted_zone_id: Hosted zone ID
+        :type hosted_zone_id: str
+
+        :param batches: List of change batches
+        :type batches: List[List[dict]]
+
+        :param comment: Optional comment attached to each change batch
+        :type comment: Optional[str]
+
+        :param max_attempts: Maximum number of attempts for each throttled request
+        :type max_attempts: int
+
+        :return: List of change IDs
+        """
+        change_ids = []
+
+        for batch in batches:
+            change_batch = {'Changes': batch}
+
+            if comment is not None:
+                change_batch['Comment'] = comment
+
+            Log.trace('Submitting {count} record set changes to hosted zone ({hosted_zone_id})...'.format(count=len(batch), hosted_zone_id=hosted_zone_id))
+            result = Backoff.call(
+                function=self.__client__.change_resource_record_sets,
+                arguments={
+                    'HostedZoneId': hosted_zone_id,
+                    'ChangeBatch': change_batch
+                },
+                max_attempts=max_attempts
+            )
+            change_ids.append(result['ChangeInfo']['Id'])
+
+        return change_ids
+
+    @staticmethod
+    def __pack_changes__(changes) -> List[List[dict]]:
+        """
+        Pack changes into batches that fit within the per request limits, preserving their order
+
+        :param changes: List of changes
+        :type changes: List[dict]
+
+        :return: List of change batches
+
+        :raises Exception: if a single change exceeds the per request limits
+        """
+        batches = []
+        batch = []
+        batch_records = 0
+        batch_characters = 0
+
+        for change in changes:
+            resource_records = change['ResourceRecordSet'].get('ResourceRecords', [])
+
+            # Alias records have no resource records but still count as a record
+            records = max(1, len(resource_records))
+            characters = sum(len(str(resource_record.get('Value', ''))) for resource_record in resource_records)
+
+            if change['Action'] == 'UPSERT':
+                records = records * 2
+                characters = characters * 2
+
+            if records > Client.__change_batch_max_records__ or characters > Client.__change_batch_max_characters__:
+                raise Exception('Record set change ({name} {type}) exceeds the maximum size of a change batch'.format(
+                    name=change['ResourceRecordSet'].get('Name'),
+                    type=change['ResourceRecordSet'].get('Type')
+                ))
+
+            if len(batch) > 0 and (
+                    len(batch) + 1 > Client.__change_batch_max_changes__ or
+                    batch_records + records > Client.__change_batch_max_records__ or
+                    batch_characters + characters > Client.__change_batch_max_characters__
+            ):
+                batches.append(batch)
+                batch = []
+                batch_records = 0
+                batch_characters = 0
+
+            batch.append(change)
+            batch_records = batch_records + records
+            batch_characters = batch_characters + characters
+
+        if len(batch) > 0:
+            batches.append(batch)
+
+        return batches
+
+    def __get_hosted_zone_id_cache_key__(self, hosted_zone_name) -> str:
+        """
+        Get the hosted zone ID cache key for a hosted zone name
+
+        :param hosted_zone_name: Hosted zone name
+        :type hosted_zone_name: str
+
+        :return: Cache key
+        """
+        return '{identifier}:{name}'.format(identifier=self.__credential__.get_identifier(), name=Client.__normalize_name__(hosted_zone_name))
+
+    @staticmethod
+    def __get_record_set_key__(record_set) -> tuple:
+        """
+        Get the key that uniquely identifies a record set within a hosted zone
+
+        :param record_set: The record set
+        :type record_set: dict
+
+        :return: Tuple of normalized name, type and set identifier
+        """
+        return (
+            Client.__normalize_name__(record_set['Name']),
+            record_set['Type'],
+            record_set.get('SetIdentifier')
+        )
+
+    @staticmethod
+    def __get_record_set_hash__(record_set) -> str:
+        """
+        Hash the content of a record set, ignoring differences Route53 does not consider significant (name case/escaping and value order)
+
+        :param record_set: The record set
+        :type record_set: dict
+
+        :return: Record set hash
+        """
+        canonical = dict(record_set)
+        canonical['Name'] = Client.__normalize_name__(record_set['Name'])
+
+        if 'ResourceRecords' in canonical:
+            canonical['ResourceRecords'] = sorted(str(resource_record['Value']) for resource_record in canonical['ResourceRecords'])
+
+        if 'AliasTarget' in canonical:
+            canonical['AliasTarget'] = dict(canonical['AliasTarget'])
+            canonical['AliasTarget']['DNSName'] = Client.__normalize_name__(canonical['AliasTarget']['DNSName'])
+
+        return hashlib.sha256(json.dumps(canonical, sort_keys=True, default=str).encode()).hexdigest()
+
+    @staticmethod
+    def __normalize_name__(name) -> str:
+        """
+        Normalize a DNS name to lowercase with a trailing dot
+
+        :param name: DNS name
+        :type name: str
+
+        :return: Normalized DNS name
+        """
+        # Route53 returns wildcards (and other special characters) as octal escape sequences
+        name = str(name).lower().replace('\\052', '*')
+
+        if name.endswith('.') is False:
+            name = name + '.'
+
+        return name
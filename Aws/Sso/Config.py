@@ -1,14 +1,27 @@
 import boto3
 import json
 import os
+import tempfile
 
+from concurrent.futures import ThreadPoolExecutor
 from configparser import ConfigParser
-from datetime import datetime
+from contextlib import contextmanager
+from datetime import datetime, timedelta
 from pathlib import Path
+from time import sleep
 from typing import Optional, List
 
+from botocore.exceptions import BotoCoreError, ClientError
+
+from Aws.Lambda.Log import Log
 from Aws.Sso.ConfigException import ConfigException
 
+try:
+    import fcntl
+except ImportError:
+    # File locking is not available on Windows
+    fcntl = None
+
 
 class Config:
     """
@@ -20,56 +33,276 @@ class Config:
     __aws_sso_cache_path__ = f'{Path.home()}/.aws/sso/cache'
     __aws_default_region__ = 'ap-southeast-2'
 
+    # Credentials file key used to record when a profiles credentials expire
+    __expiration_key__ = 'aws_session_expiration'
+
+    # Default number of seconds before expiration at which credentials are refreshed
+    __refresh_margin__ = 900
+
     @staticmethod
-    def set_profile_credentials(profile_name) -> None:
+    def set_profile_credentials(profile_name, refresh_margin=None, force=False) -> None:
         """
-        Update AWS configuration with credentials for the specified SSO profile
+        Update AWS configuration with credentials for the specified SSO profile, unless its current credentials are still valid
 
         :param profile_name: The AWS profile name
         :type profile_name: str
 
+        :param refresh_margin: Number of seconds before expiration at which credentials are refreshed, defaults to 15 minutes
+        :type refresh_margin: Optional[float]
+
+        :param force: If TRUE credentials are refreshed even if they are still valid
+        :type force: bool
+
         :raises ConfigException: on error during profile setup
         """
-        profile = Config.__get_aws_profile__(profile_name)
-        cached_login = Config.__get_sso_cached_login__(profile)
-        credentials = Config.__get_sso_role_credentials__(profile, cached_login)
-        Config.__update_aws_credentials__(profile_name, profile, credentials)
+        Config.set_profiles_credentials([profile_name], refresh_margin=refresh_margin, force=force)
 
     @staticmethod
-    def __get_sso_cached_login__(profile) -> dict:
+    def set_profiles_credentials(profile_names, max_workers=10, refresh_margin=None, force=False) -> List[str]:
         """
-        Get SSO cached login details for profile
+        Update AWS configuration with credentials for multiple SSO profiles, skipping profiles whose current credentials are still valid. The AWS
+        config and SSO cache are read once, role credentials are retrieved concurrently and the credentials file is written once. The credentials
+        file is locked for the duration of the update so concurrent processes do not overwrite each other or make redundant SSO requests
 
-        :param profile: The configuration profile
-        :type profile: dict
+        :param profile_names: The AWS profile names
+        :type profile_names: List[str]
 
-        :raises ConfigException: if SSO credentials have expired or are invalid
+        :param max_workers: Maximum number of role credentials retrieved concurrently
+        :type max_workers: int
+
+        :param refresh_margin: Number of seconds before expiration at which credentials are refreshed, defaults to 15 minutes
+        :type refresh_margin: Optional[float]
+
+        :param force: If TRUE credentials are refreshed even if they are still valid
+        :type force: bool
+
+        :return: List of profile names whose credentials were refreshed
+
+        :raises ConfigException: on error during profile setup
+        """
+        if refresh_margin is None:
+            refresh_margin = Config.__refresh_margin__
+
+        with Config.__lock_credentials__():
+            credentials_config = Config.__read_config__(Config.__aws_credential_path__)
+
+            if force is False:
+                profile_names = [
+                    profile_name for profile_name in profile_names if Config.__is_expiring__(credentials_config, profile_name, refresh_margin)
+                ]
+
+            if len(profile_names) == 0:
+                return []
+
+            config = Config.__read_config__(Config.__aws_config_path__)
+            profiles = {profile_name: Config.__get_aws_profile__(config, profile_name) for profile_name in profile_names}
+            cached_logins = Config.__get_sso_cached_logins__([Config.__get_sso_login_key__(profile) for profile in profiles.values()])
+            logins = {}
+
+            for profile_name in profile_names:
+                logins[profile_name] = Config.__get_sso_cached_login__(profiles[profile_name], cached_logins)
+
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(profile_names))) as executor:
+                futures = {}
+
+                for profile_name in profile_names:
+                    futures[profile_name] = executor.submit(Config.__get_sso_role_credentials__, profiles[profile_name], logins[profile_name])
+
+                credentials = {profile_name: future.result() for profile_name, future in futures.items()}
+
+            for profile_name in profile_names:
+                Config.__update_aws_credentials__(credentials_config, profile_name, profiles[profile_name], credentials[profile_name])
+
+            Config.__write_config__(Config.__aws_credential_path__, credentials_config)
+
+        return profile_names
+
+    @staticmethod
+    def get_role_credentials(profile_name) -> dict:
         """
-        file_paths = Config.__list_directory__(Config.__aws_sso_cache_path__)
+        Retrieve role credentials for an SSO profile directly from the SSO cache, without writing them to the AWS credentials file
+
+        :param profile_name: The AWS profile name
+        :type profile_name: str
+
+        :return: Dictionary containing the "accessKeyId", "secretAccessKey", "sessionToken", "expiration" (epoch milliseconds) and the profiles
+                 "region"
+
+        :raises ConfigException: if the profile does not exist or its SSO login has expired
+        """
+        config = Config.__read_config__(Config.__aws_config_path__)
+        profile = Config.__get_aws_profile__(config, profile_name)
+        login = Config.__get_sso_cached_login__(profile, Config.__get_sso_cached_logins__([Config.__get_sso_login_key__(profile)]))
+
+        credentials = dict(Config.__get_sso_role_credentials__(profile, login))
+        credentials['region'] = profile.get('region', Config.__aws_default_region__)
+
+        return credentials
+
+    @staticmethod
+    def watch_profiles_credentials(profile_names, interval=60, refresh_margin=None, iterations=None) -> None:
+        """
+        Keep SSO profile credentials refreshed, checking them on a schedule and refreshing any that are about to expire
+
+        :param profile_names: The AWS profile names
+        :type profile_names: List[str]
+
+        :param interval: Number of seconds between checks
+        :type interval: float
+
+        :param refresh_margin: Number of seconds before expiration at which credentials are refreshed, defaults to 15 minutes
+        :type refresh_margin: Optional[float]
+
+        :param iterations: Optional number of checks to perform, runs until interrupted if not set
+        :type iterations: Optional[int]
+        """
+        iteration = 0
+
+        while iterations is None or iteration < iterations:
+            iteration = iteration + 1
+
+            try:
+                refreshed = Config.set_profiles_credentials(profile_names, refresh_margin=refresh_margin)
+
+                if len(refreshed) > 0:
+                    Log.info('Refreshed SSO credentials for profiles: {profile_names}'.format(profile_names=', '.join(refreshed)))
+            except ConfigException as config_exception:
+                # Most likely the SSO login itself has expired, keep watching so credentials are refreshed once the user logs in again
+                Log.error('Failed to refresh SSO credentials: {config_exception}'.format(config_exception=config_exception))
+            except (ClientError, BotoCoreError) as aws_exception:
+                # Transient AWS failures (e.g. throttling or a dropped connection) are retried on the next check
+                Log.trace('Failed to retrieve SSO credentials, retrying in {interval} seconds: {aws_exception}'.format(
+                    interval=interval,
+                    aws_exception=aws_exception
+                ))
+
+            if iterations is None or iteration < iterations:
+                sleep(interval)
+
+    @staticmethod
+    def __is_expiring__(config, profile_name, refresh_margin) -> bool:
+        """
+        Check if the credentials stored for a profile are missing or will expire within the refresh margin
+
+        :param config: The AWS credentials configuration
+        :type config: ConfigParser
+
+        :param profile_name: Profile name
+        :type profile_name: str
 
-        for file_path in file_paths:
+        :param refresh_margin: Number of seconds before expiration at which credentials are refreshed
+        :type refresh_margin: float
+
+        :return: True if the credentials should be refreshed
+        """
+        if config.has_option(profile_name, Config.__expiration_key__) is False:
+            return True
+
+        try:
+            expiration = datetime.strptime(config.get(profile_name, Config.__expiration_key__), '%Y-%m-%dT%H:%M:%SZ')
+        except ValueError:
+            return True
+
+        return datetime.utcnow() + timedelta(seconds=refresh_margin) >= expiration
+
+    @staticmethod
+    @contextmanager
+    def __lock_credentials__():
+        """
+        Hold an exclusive lock on the AWS credentials file (where file locking is supported)
+        """
+        if fcntl is None:
+            yield
+            return
+
+        os.makedirs(os.path.dirname(Config.__aws_credential_path__), exist_ok=True)
+
+        with open(Config.__aws_credential_path__ + '.lock', 'w') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    @staticmethod
+    def __get_sso_cached_logins__(keys) -> dict:
+        """
+        Read the cached SSO logins of the requested start URLs and regions once, files belonging to any other login are never parsed
+
+        :param keys: Tuples of start URL and region of the logins required
+        :type keys: List[tuple]
+
+        :return: Dictionary containing the most recent unexpired logins ("logins") and the keys of expired logins ("expired"), both indexed by
+                 a tuple of start URL and region
+        """
+        keys = set(keys)
+        logins = {}
+        expired = set()
+
+        # Files are sorted by most recently updated, so the first unexpired login found for each start URL and region is the newest
+        for file_path in Config.__list_directory__(Config.__aws_sso_cache_path__):
             data = Config.__load_json__(file_path)
 
-            if data.get('startUrl') != profile['sso_start_url']:
+            if isinstance(data, dict) is False or 'startUrl' not in data or 'expiresAt' not in data:
                 continue
 
-            if data.get('region') != profile['sso_region']:
+            key = (data['startUrl'], data.get('region'))
+
+            if key not in keys:
                 continue
 
-            found = True
+            try:
+                expires_at = Config.__parse_timestamp__(data['expiresAt'])
+            except ValueError:
+                Log.trace('Skipping SSO cache file with unrecognised expiry ({file_path})'.format(file_path=file_path))
+                continue
 
             # Make sure it hasn't expired
-            if datetime.utcnow() > Config.__parse_timestamp__(data['expiresAt']):
+            if datetime.utcnow() > expires_at:
+                expired.add(key)
                 continue
 
-            # Return the cached login details
-            return data
+            if key not in logins:
+                logins[key] = data
 
-        if found is True:
+        return {'logins': logins, 'expired': expired}
+
+    @staticmethod
+    def __get_sso_cached_login__(profile, cached_logins) -> dict:
+        """
+        Get SSO cached login details for profile
+
+        :param profile: The configuration profile
+        :type profile: dict
+
+        :param cached_logins: Cached logins returned by __get_sso_cached_logins__
+        :type cached_logins: dict
+
+        :raises ConfigException: if SSO credentials have expired or are invalid
+        """
+        key = Config.__get_sso_login_key__(profile)
+
+        if key in cached_logins['logins']:
+            return cached_logins['logins'][key]
+
+        if key in cached_logins['expired']:
             raise ConfigException('The requested SSO login profile has an expired token')
 
         raise ConfigException('The requested SSO login profile was not found')
 
+    @staticmethod
+    def __get_sso_login_key__(profile) -> tuple:
+        """
+        Get the key of the cached SSO login used by a profile
+
+        :param profile: The configuration profile
+        :type profile: dict
+
+        :return: Tuple of start URL and region
+        """
+        return profile.get('sso_start_url'), profile.get('sso_region')
+
     @staticmethod
     def __get_sso_role_credentials__(profile, login) -> dict:
         """
@@ -83,7 +316,8 @@ class Config:
 
         :return: dict
         """
-        client = boto3.client('sso', region_name=profile['sso_region'])
+        # Use a dedicated session, the default boto3 session is not safe to create clients from concurrently
+        client = boto3.session.Session().client('sso', region_name=profile['sso_region'])
         response = client.get_role_credentials(
             roleName=profile['sso_role_name'],
             accountId=profile['sso_account_id'],
@@ -92,25 +326,35 @@ class Config:
         return response['roleCredentials']
 
     @staticmethod
-    def __get_aws_profile__(profile_name) -> dict:
+    def __get_aws_profile__(config, profile_name) -> dict:
         """
         Retrieve AWS profile from config
 
+        :param config: The AWS configuration
+        :type config: ConfigParser
+
         :param profile_name: The profile name to retrieve
         :type profile_name: str
 
         :return: The profiles configuration in a dictionary
+
+        :raises ConfigException: if the profile does not exist
         """
-        config = Config.__read_config__(Config.__aws_config_path__)
-        profile_opts = config.items(f'profile {profile_name}')
+        section = f'profile {profile_name}'
 
-        return dict(profile_opts)
+        if config.has_section(section) is False:
+            raise ConfigException(f'The requested AWS profile ({profile_name}) was not found')
+
+        return dict(config.items(section))
 
     @staticmethod
-    def __update_aws_credentials__(profile_name, profile, credentials) -> None:
+    def __update_aws_credentials__(config, profile_name, profile, credentials) -> None:
         """
         Update AWS credentials in config
 
+        :param config: The AWS credentials configuration
+        :type config: ConfigParser
+
         :param profile_name: Profile name
         :type profile_name: str
 
@@ -121,7 +365,6 @@ class Config:
         :type credentials: dict
         """
         region = profile.get('region', Config.__aws_default_region__)
-        config = Config.__read_config__(Config.__aws_credential_path__)
         if config.has_section(profile_name):
             config.remove_section(profile_name)
         config.add_section(profile_name)
@@ -129,7 +372,10 @@ class Config:
         config.set(profile_name, 'aws_access_key_id', credentials['accessKeyId'])
         config.set(profile_name, 'aws_secret_access_key ', credentials['secretAccessKey'])
         config.set(profile_name, 'aws_session_token', credentials['sessionToken'])
-        Config.__write_config__(Config.__aws_credential_path__, config)
+
+        if credentials.get('expiration') is not None:
+            expiration = datetime.utcfromtimestamp(int(credentials['expiration']) / 1000)
+            config.set(profile_name, Config.__expiration_key__, expiration.strftime('%Y-%m-%dT%H:%M:%SZ'))
 
     @staticmethod
     def __list_directory__(path) -> List[str]:
@@ -177,9 +423,18 @@ class Config:
         :type value: str
 
         :return: Datetime object
+
+        :raises ValueError: if the timestamp is not in a recognised format
         """
+        # Older AWS CLI versions write a "UTC" suffix, current versions write ISO 8601 with a "Z" suffix (optionally with fractional seconds)
         # noinspection SpellCheckingInspection
-        return datetime.strptime(value, '%Y-%m-%dT%H:%M:%SUTC')
+        for timestamp_format in ('%Y-%m-%dT%H:%M:%SUTC', '%Y-%m-%dT%H:%M:%SZ', '%Y-%m-%dT%H:%M:%S.%fZ'):
+            try:
+                return datetime.strptime(value, timestamp_format)
+            except ValueError:
+                continue
+
+        raise ValueError('Unrecognised timestamp ({value})'.format(value=value))
 
     @staticmethod
     def __read_config__(path) -> ConfigParser:
@@ -206,5 +461,14 @@ class Config:
         :param config: Configuration to write
         :type config: ConfigParser
         """
-        with open(path, 'w') as destination:
-            config.write(destination)
+        # Write to a temporary file and replace the original so readers never see a partially written file
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.', suffix='.tmp')
+
+        try:
+            with os.fdopen(file_descriptor, 'w') as destination:
+                config.write(destination)
+
+            os.replace(temporary_path, path)
+        except Exception as write_exception:
+            os.remove(temporary_path)
+            raise write_exception
@@ -0,0 +1,100 @@
+import threading
+
+from datetime import datetime, timezone
+
+from botocore.credentials import CredentialProvider as BotocoreCredentialProvider, RefreshableCredentials
+
+from Aws.Lambda.Log import Log
+from Aws.Sso.Config import Config
+
+
+class CredentialProvider(BotocoreCredentialProvider):
+    """
+    Botocore credential provider that resolves SSO role credentials directly from the SSO cache and holds them in memory. Credentials are shared
+    by every session in the process using the same profile and are refreshed automatically before they expire, nothing is written to the AWS
+    credentials file
+    """
+    METHOD = 'sso-cache'
+    CANONICAL_NAME = 'custom-sso-cache'
+
+    # Shared refreshable credentials indexed by profile name
+    __credentials__ = {}
+    __credentials_lock__ = threading.Lock()
+
+    def __init__(self, profile_name):
+        """
+        Setup a credential provider for an SSO profile
+
+        :param profile_name: The AWS profile name
+        :type profile_name: str
+        """
+        super().__init__()
+        self.__profile_name__ = profile_name
+
+    def load(self) -> RefreshableCredentials:
+        """
+        Load the shared credentials for the profile, called by botocore when a session first requires credentials
+
+        :return: Refreshable credentials
+
+        :raises ConfigException: if the profile does not exist or its SSO login has expired
+        """
+        return CredentialProvider.get_credentials(self.__profile_name__)
+
+    @staticmethod
+    def get_credentials(profile_name) -> RefreshableCredentials:
+        """
+        Get the shared credentials for an SSO profile, retrieving them on first use
+
+        :param profile_name: The AWS profile name
+        :type profile_name: str
+
+        :return: Refreshable credentials
+
+        :raises ConfigException: if the profile does not exist or its SSO login has expired
+        """
+        with CredentialProvider.__credentials_lock__:
+            if profile_name not in CredentialProvider.__credentials__:
+                CredentialProvider.__credentials__[profile_name] = RefreshableCredentials.create_from_metadata(
+                    metadata=CredentialProvider.__get_metadata__(profile_name),
+                    refresh_using=lambda: CredentialProvider.__get_metadata__(profile_name),
+                    method=CredentialProvider.METHOD
+                )
+
+            return CredentialProvider.__credentials__[profile_name]
+
+    @staticmethod
+    def clear_credentials(profile_name=None) -> None:
+        """
+        Discard shared credentials so they are retrieved again on next use, e.g. after logging in to SSO again
+
+        :param profile_name: Optional profile name, all profiles are cleared if not set
+        :type profile_name: Optional[str]
+        """
+        with CredentialProvider.__credentials_lock__:
+            if profile_name is None:
+                CredentialProvider.__credentials__ = {}
+                return
+
+            CredentialProvider.__credentials__.pop(profile_name, None)
+
+    @staticmethod
+    def __get_metadata__(profile_name) -> dict:
+        """
+        Retrieve role credentials in the format expected by botocore refreshable credentials
+
+        :param profile_name: The AWS profile name
+        :type profile_name: str
+
+        :return: Credential metadata
+        """
+        Log.trace('Retrieving SSO role credentials for profile ({profile_name})...'.format(profile_name=profile_name))
+        credentials = Config.get_role_credentials(profile_name)
+        expiration = datetime.fromtimestamp(int(credentials['expiration']) / 1000, tz=timezone.utc)
+
+        return {
+            'access_key': credentials['accessKeyId'],
+            'secret_key': credentials['secretAccessKey'],
+            'token': credentials['sessionToken'],
+            'expiry_time': expiration.isoformat()
+        }
@@ -0,0 +1,42 @@
+from Aws.Ecs.Service import Service
+from Benchmarks.Benchmark import Benchmark
+
+
+class BenchBaseObject(Benchmark):
+    """
+    Construction of objects from API responses, each scale is the number of objects created
+    """
+    __scales__ = (100, 1000, 10000)
+
+    __values__ = {
+        'serviceArn': 'arn:aws:ecs:ap-southeast-2:123456789012:service/benchmark/service',
+        'serviceName': 'service',
+        'status': 'ACTIVE',
+        'desiredCount': 2,
+        'runningCount': 2,
+        'loadBalancers': [{'targetGroupArn': 'arn:aws:elasticloadbalancing:ap-southeast-2:123456789012:targetgroup/benchmark/0', 'containerPort': 80}],
+        'deployments': [{'id': 'ecs-svc/0', 'status': 'PRIMARY', 'desiredCount': 2, 'runningCount': 2}],
+        'tags': [{'key': 'Environment', 'value': 'benchmark'}]
+    }
+
+    def bench_set_values(self, scale):
+        def run() -> int:
+            for index in range(scale):
+                service = Service(BenchBaseObject.__values__['serviceArn'])
+                service.set_values(BenchBaseObject.__values__)
+
+            return scale
+
+        return run
+
+    def bench_get(self, scale):
+        service = Service(BenchBaseObject.__values__['serviceArn'])
+        service.set_values(BenchBaseObject.__values__)
+
+        def run() -> int:
+            for index in range(scale):
+                service.get('deployments')
+
+            return scale
+
+        return run
@@ -0,0 +1,40 @@
+from Aws.Cloudwatch.Client import Client
+from Benchmarks.Benchmark import Benchmark
+
+
+class BenchCloudwatchClient(Benchmark):
+    """
+    Publishing metrics, each scale is the number of metric values published
+    """
+    __scales__ = (10, 100, 1000)
+
+    def bench_put_metric(self, scale):
+        client = self.create_client(Client)
+        stubber = self.get_stubber(client)
+
+        for index in range(scale):
+            stubber.add_response('put_metric_data', {})
+
+        def run() -> int:
+            for index in range(scale):
+                client.put_metric('Benchmark', 'Metric', float(index), Client.UNIT_COUNT)
+
+            return scale
+
+        return run
+
+    def bench_put_metrics(self, scale):
+        client = self.create_client(Client)
+        stubber = self.get_stubber(client)
+        metric_data = [{'MetricName': 'Metric', 'Unit': Client.UNIT_COUNT, 'Value': float(index)} for index in range(scale)]
+
+        for offset in range(0, scale, 1000):
+            stubber.add_response('put_metric_data', {})
+
+        def run() -> int:
+            for offset in range(0, scale, 1000):
+                client.put_metrics('Benchmark', metric_data[offset:offset + 1000])
+
+            return scale
+
+        return run
@@ -0,0 +1,158 @@
+from Aws.Ecs.Client import Client
+from Benchmarks.Benchmark import Benchmark
+
+
+class BenchEcsClient(Benchmark):
+    """
+    ECS list and describe fan-out, each scale is the number of clusters or services. The one request per resource benchmarks are kept alongside
+    their batched equivalents so the cost of N+1 call patterns is visible
+    """
+    __cluster_arn__ = 'arn:aws:ecs:ap-southeast-2:123456789012:cluster/benchmark'
+
+    def bench_list_clusters(self, scale):
+        client = self.create_client(Client)
+        stubber = self.get_stubber(client)
+        cluster_arns = BenchEcsClient.__get_cluster_arns__(scale)
+        BenchEcsClient.__add_list_pages__(stubber, 'list_clusters', 'clusterArns', cluster_arns)
+
+        for cluster_arn in cluster_arns:
+            stubber.add_response('describe_clusters', {'clusters': [BenchEcsClient.__get_cluster__(cluster_arn)]})
+
+        return lambda: len(client.list_clusters())
+
+    def bench_describe_clusters(self, scale):
+        client = self.create_client(Client)
+        stubber = self.get_stubber(client)
+        cluster_arns = BenchEcsClient.__get_cluster_arns__(scale)
+        BenchEcsClient.__add_list_pages__(stubber, 'list_clusters', 'clusterArns', cluster_arns)
+
+        for offset in range(0, scale, 100):
+            stubber.add_response('describe_clusters', {
+                'clusters': [BenchEcsClient.__get_cluster__(cluster_arn) for cluster_arn in cluster_arns[offset:offset + 100]]
+            })
+
+        return lambda: len(client.describe_clusters(client.list_cluster_arns()))
+
+    def bench_list_services(self, scale):
+        client = self.create_client(Client)
+        stubber = self.get_stubber(client)
+        service_arns = BenchEcsClient.__get_service_arns__(scale)
+        BenchEcsClient.__add_list_pages__(stubber, 'list_services', 'serviceArns', service_arns)
+
+        for service_arn in service_arns:
+            stubber.add_response('describe_services', {'services': [BenchEcsClient.__get_service__(service_arn)]})
+
+        return lambda: len(client.list_services(BenchEcsClient.__cluster_arn__))
+
+    def bench_describe_services(self, scale):
+        client = self.create_client(Client)
+        stubber = self.get_stubber(client)
+        service_arns = BenchEcsClient.__get_service_arns__(scale)
+        BenchEcsClient.__add_list_pages__(stubber, 'list_services', 'serviceArns', service_arns)
+
+        for offset in range(0, scale, 10):
+            stubber.add_response('describe_services', {
+                'services': [BenchEcsClient.__get_service__(service_arn) for service_arn in service_arns[offset:offset + 10]]
+            })
+
+        def run() -> int:
+            service_arns = client.list_service_arns(BenchEcsClient.__cluster_arn__)
+            return len(client.describe_services(BenchEcsClient.__cluster_arn__, service_arns))
+
+        return run
+
+    @staticmethod
+    def __add_list_pages__(stubber, method_name, data_key, arns, page_size=100) -> None:
+        """
+        Queue stubbed pages of ARNs
+
+        :param stubber: Stubber
+        :type stubber: Stubber
+
+        :param method_name: Boto3 method name
+        :type method_name: str
+
+        :param data_key: The key in the response containing the ARNs
+        :type data_key: str
+
+        :param arns: ARNs to return
+        :type arns: List[str]
+
+        :param page_size: Number of ARNs in each page
+        :type page_size: int
+        """
+        for offset in range(0, len(arns), page_size):
+            response = {data_key: arns[offset:offset + page_size]}
+
+            if offset + page_size < len(arns):
+                response['nextToken'] = str(offset + page_size)
+
+            stubber.add_response(method_name, response)
+
+    @staticmethod
+    def __get_cluster_arns__(count) -> list:
+        """
+        Generate cluster ARNs
+
+        :param count: Number of ARNs
+        :type count: int
+
+        :return: List of cluster ARNs
+        """
+        return ['arn:aws:ecs:ap-southeast-2:123456789012:cluster/benchmark-{index}'.format(index=index) for index in range(count)]
+
+    @staticmethod
+    def __get_service_arns__(count) -> list:
+        """
+        Generate service ARNs
+
+        :param count: Number of ARNs
+        :type count: int
+
+        :return: List of service ARNs
+        """
+        return ['arn:aws:ecs:ap-southeast-2:123456789012:service/benchmark/service-{index}'.format(index=index) for index in range(count)]
+
+    @staticmethod
+    def __get_cluster__(cluster_arn) -> dict:
+        """
+        Generate a described cluster
+
+        :param cluster_arn: The clusters ARN
+        :type cluster_arn: str
+
+        :return: Cluster values
+        """
+        return {
+            'clusterArn': cluster_arn,
+            'clusterName': cluster_arn.split('/')[-1],
+            'status': 'ACTIVE',
+            'registeredContainerInstancesCount': 0,
+            'runningTasksCount': 4,
+            'pendingTasksCount': 0,
+            'activeServicesCount': 2,
+            'tags': [{'key': 'Environment', 'value': 'benchmark'}]
+        }
+
+    @staticmethod
+    def __get_service__(service_arn) -> dict:
+        """
+        Generate a described service
+
+        :param service_arn: The services ARN
+        :type service_arn: str
+
+        :return: Service values
+        """
+        return {
+            'serviceArn': service_arn,
+            'serviceName': service_arn.split('/')[-1],
+            'clusterArn': BenchEcsClient.__cluster_arn__,
+            'status': 'ACTIVE',
+            'desiredCount': 2,
+            'runningCount': 2,
+            'pendingCount': 0,
+            'launchType': 'FARGATE',
+            'taskDefinition': 'arn:aws:ecs:ap-southeast-2:123456789012:task-definition/benchmark:1',
+            'tags': [{'key': 'Environment', 'value': 'benchmark'}]
+        }
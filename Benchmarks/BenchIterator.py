@@ -0,0 +1,61 @@
+from Aws.Ecs.Client import Client
+from Aws.Iterator import Iterator
+from Benchmarks.Benchmark import Benchmark
+
+
+class BenchIterator(Benchmark):
+    """
+    Pagination of results, each scale is the number of pages retrieved
+    """
+    __scales__ = (1, 10, 100)
+
+    # Number of results in each stubbed page
+    __page_size__ = 100
+
+    def bench_iterate(self, scale):
+        client = self.create_client(Client)
+        stubber = self.get_stubber(client)
+        self.__add_pages__(stubber, scale)
+
+        def run() -> int:
+            return len(Iterator.iterate(client=client.__client__, method_name='list_clusters', data_key='clusterArns'))
+
+        return run
+
+    def bench_stream(self, scale):
+        client = self.create_client(Client)
+        stubber = self.get_stubber(client)
+        self.__add_pages__(stubber, scale)
+
+        def run() -> int:
+            count = 0
+
+            for _ in Iterator.stream(client=client.__client__, method_name='list_clusters', data_key='clusterArns'):
+                count = count + 1
+
+            return count
+
+        return run
+
+    def __add_pages__(self, stubber, pages) -> None:
+        """
+        Queue stubbed pages of cluster ARNs
+
+        :param stubber: Stubber
+        :type stubber: Stubber
+
+        :param pages: Number of pages
+        :type pages: int
+        """
+        for page in range(pages):
+            response = {
+                'clusterArns': [
+                    'arn:aws:ecs:ap-southeast-2:123456789012:cluster/benchmark-{page}-{index}'.format(page=page, index=index)
+                    for index in range(self.__page_size__)
+                ]
+            }
+
+            if page < pages - 1:
+                response['nextToken'] = 'page-{page}'.format(page=page + 1)
+
+            stubber.add_response('list_clusters', response)
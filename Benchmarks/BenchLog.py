@@ -0,0 +1,45 @@
+import os
+
+from contextlib import redirect_stdout
+
+from Aws.Lambda.Log import Log
+from Benchmarks.Benchmark import Benchmark
+
+
+class BenchLog(Benchmark):
+    """
+    Logging overhead, each scale is the number of messages logged
+    """
+    # Logging is slow enough that larger scales only lengthen the run
+    __scales__ = (100, 1000)
+
+    def bench_filtered(self, scale):
+        def run() -> int:
+            level = Log.__level__
+            Log.set_level(Log.LEVEL_ERROR)
+
+            try:
+                for index in range(scale):
+                    Log.trace('Benchmark message')
+            finally:
+                Log.__level__ = level
+
+            return scale
+
+        return run
+
+    def bench_output(self, scale):
+        def run() -> int:
+            level = Log.__level__
+            Log.set_level(Log.LEVEL_TRACE)
+
+            try:
+                with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+                    for index in range(scale):
+                        Log.trace('Benchmark message')
+            finally:
+                Log.__level__ = level
+
+            return scale
+
+        return run
@@ -0,0 +1,236 @@
+import inspect
+import json
+import os
+import tracemalloc
+
+from time import perf_counter
+from typing import List
+
+from botocore.stub import Stubber
+
+from Aws.Credential import Credential
+from Aws.Lambda.Log import Log
+
+
+class Benchmark:
+    """
+    Base class for offline benchmarks. Subclasses define "bench_<name>(scale)" methods which prepare any stubbed AWS responses and return a
+    function to be timed, the function must return the number of operations it performed
+    """
+    # Scales at which every benchmark is run
+    __scales__ = (10, 100, 1000)
+
+    # Number of timed runs at each scale, the fastest is reported
+    __repeat__ = 5
+
+    # Region used by stubbed clients, no requests leave the process
+    __region_name__ = 'ap-southeast-2'
+
+    def __init__(self):
+        self.__stubbers__ = []
+
+    def create_client(self, client_class):
+        """
+        Create a client whose Boto3 client is stubbed, responses must be queued with get_stubber() before calling it
+
+        :param client_class: The client class (e.g. Aws.Ecs.Client.Client)
+        :type client_class: type
+
+        :return: Client instance
+        """
+        credential = Credential(aws_access_key_id='benchmark', aws_secret_access_key='benchmark')
+        client = client_class(credential, Benchmark.__region_name__)
+
+        stubber = Stubber(client.__client__)
+        stubber.activate()
+        self.__stubbers__.append(stubber)
+
+        return client
+
+    def get_stubber(self, client) -> Stubber:
+        """
+        Get the stubber of a client created with create_client()
+
+        :param client: Client instance
+        :type client: BaseClient
+
+        :return: Stubber
+        """
+        for stubber in self.__stubbers__:
+            if stubber.client is client.__client__:
+                return stubber
+
+        raise Exception('Client was not created by this benchmark')
+
+    def tear_down(self) -> None:
+        """
+        Deactivate all stubbers created by the benchmark
+        """
+        for stubber in self.__stubbers__:
+            stubber.deactivate()
+
+        self.__stubbers__ = []
+
+        # The log history grows with every message, do not let one benchmark inflate the memory use of the next
+        Log.__history__ = []
+
+    def run(self, name_filter=None) -> List[dict]:
+        """
+        Run every benchmark at every scale
+
+        :param name_filter: Optional substring, only benchmarks whose name contains it are run
+        :type name_filter: Optional[str]
+
+        :return: List of results, each containing the benchmark "name", "scale", "operations", fastest run time in "seconds",
+                 "operations_per_second" and "peak_bytes" allocated
+        """
+        results = []
+
+        for method_name, method in inspect.getmembers(self, predicate=inspect.ismethod):
+            if method_name.startswith('bench_') is False:
+                continue
+
+            name = '{class_name}.{method_name}'.format(class_name=type(self).__name__, method_name=method_name[len('bench_'):])
+
+            if name_filter is not None and name_filter not in name:
+                continue
+
+            for scale in self.__scales__:
+                results.append(self.__run_benchmark__(name, method, scale))
+
+        return results
+
+    def __run_benchmark__(self, name, method, scale) -> dict:
+        """
+        Time a benchmark at a single scale, memory is measured in a separate run as tracing allocations slows execution
+
+        :param name: Benchmark name
+        :type name: str
+
+        :param method: Benchmark method
+        :type method: Callable[[int], Callable[[], int]]
+
+        :param scale: Benchmark scale
+        :type scale: int
+
+        :return: Benchmark result
+        """
+        seconds = None
+        operations = 0
+
+        for repeat in range(self.__repeat__):
+            function = method(scale)
+
+            try:
+                start = perf_counter()
+                operations = function()
+                elapsed = perf_counter() - start
+            finally:
+                self.tear_down()
+
+            seconds = elapsed if seconds is None else min(seconds, elapsed)
+
+        function = method(scale)
+        tracemalloc.start()
+
+        try:
+            function()
+            peak_bytes = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+            self.tear_down()
+
+        return {
+            'name': name,
+            'scale': scale,
+            'operations': operations,
+            'seconds': seconds,
+            'operations_per_second': operations / seconds if seconds > 0 else 0.0,
+            'peak_bytes': peak_bytes
+        }
+
+    @staticmethod
+    def load_baseline(path) -> dict:
+        """
+        Load saved benchmark results
+
+        :param path: Baseline filename
+        :type path: str
+
+        :return: Results indexed by "<name>[<scale>]", empty if no baseline has been saved
+        """
+        if os.path.exists(path) is False:
+            return {}
+
+        with open(path) as context:
+            return json.load(context)
+
+    @staticmethod
+    def save_baseline(path, results) -> None:
+        """
+        Save benchmark results as the baseline for future comparisons
+
+        :param path: Baseline filename
+        :type path: str
+
+        :param results: Benchmark results
+        :type results: List[dict]
+        """
+        with open(path, 'w') as context:
+            json.dump({Benchmark.get_result_key(result): result for result in results}, context, indent=4, sort_keys=True)
+
+    @staticmethod
+    def compare(results, baseline, threshold=0.2) -> List[dict]:
+        """
+        Compare results against a baseline
+
+        :param results: Benchmark results
+        :type results: List[dict]
+
+        :param baseline: Baseline results returned by load_baseline()
+        :type baseline: dict
+
+        :param threshold: Fraction by which throughput may drop, or peak memory may grow, before a result is flagged as a regression
+        :type threshold: float
+
+        :return: List of regressions, each containing the "name", "scale", "metric", "baseline" and "current" values
+        """
+        regressions = []
+
+        for result in results:
+            previous = baseline.get(Benchmark.get_result_key(result))
+
+            if previous is None:
+                continue
+
+            if result['operations_per_second'] < previous['operations_per_second'] * (1 - threshold):
+                regressions.append({
+                    'name': result['name'],
+                    'scale': result['scale'],
+                    'metric': 'operations_per_second',
+                    'baseline': previous['operations_per_second'],
+                    'current': result['operations_per_second']
+                })
+
+            if result['peak_bytes'] > previous['peak_bytes'] * (1 + threshold):
+                regressions.append({
+                    'name': result['name'],
+                    'scale': result['scale'],
+                    'metric': 'peak_bytes',
+                    'baseline': previous['peak_bytes'],
+                    'current': result['peak_bytes']
+                })
+
+        return regressions
+
+    @staticmethod
+    def get_result_key(result) -> str:
+        """
+        Get the key identifying a result in the baseline
+
+        :param result: Benchmark result
+        :type result: dict
+
+        :return: Result key
+        """
+        return '{name}[{scale}]'.format(name=result['name'], scale=result['scale'])
@@ -0,0 +1,77 @@
+import argparse
+import importlib
+import os
+import sys
+
+from pathlib import Path
+
+from Aws.Lambda.Log import Log
+from Benchmarks.Benchmark import Benchmark
+
+
+def main() -> int:
+    """
+    Run all offline benchmarks, report throughput and memory and compare them against the saved baseline
+
+    :return: Exit code, non-zero if a regression was detected
+    """
+    parser = argparse.ArgumentParser(description='Run offline benchmarks against stubbed AWS responses')
+    parser.add_argument('--baseline', default=os.path.join(os.path.dirname(__file__), 'baseline.json'), help='Baseline filename')
+    parser.add_argument('--save', action='store_true', help='Save the results as the new baseline')
+    parser.add_argument('--threshold', type=float, default=0.2, help='Fraction by which a result may regress before failing')
+    parser.add_argument('--filter', default=None, help='Only run benchmarks whose name contains this value')
+    arguments = parser.parse_args()
+
+    # Keep library logging from dominating the measurements, the log benchmarks set their own level
+    Log.set_level(Log.LEVEL_ERROR)
+
+    results = []
+
+    for path in sorted(Path(os.path.dirname(__file__)).glob('Bench*.py')):
+        module = importlib.import_module('Benchmarks.{name}'.format(name=path.stem))
+        results.extend(getattr(module, path.stem)().run(name_filter=arguments.filter))
+
+    baseline = Benchmark.load_baseline(arguments.baseline)
+
+    print('{name:<48} {scale:>8} {rate:>16} {memory:>14} {change:>10}'.format(
+        name='Benchmark',
+        scale='Scale',
+        rate='Operations/sec',
+        memory='Peak bytes',
+        change='vs base'
+    ))
+
+    for result in results:
+        previous = baseline.get(Benchmark.get_result_key(result))
+        change = ''
+
+        if previous is not None and previous['operations_per_second'] > 0:
+            change = '{change:+.1%}'.format(change=result['operations_per_second'] / previous['operations_per_second'] - 1)
+
+        print('{name:<48} {scale:>8} {rate:>16.1f} {memory:>14} {change:>10}'.format(
+            name=result['name'],
+            scale=result['scale'],
+            rate=result['operations_per_second'],
+            memory=result['peak_bytes'],
+            change=change
+        ))
+
+    if arguments.save is True:
+        Benchmark.save_baseline(arguments.baseline, results)
+        print('Saved baseline to {path}'.format(path=arguments.baseline))
+        return 0
+
+    if len(baseline) == 0:
+        print('No baseline found at {path}, run with --save to create one'.format(path=arguments.baseline))
+        return 0
+
+    regressions = Benchmark.compare(results, baseline, threshold=arguments.threshold)
+
+    for regression in regressions:
+        print('REGRESSION {name}[{scale}] {metric}: {baseline:.1f} -> {current:.1f}'.format(**regression))
+
+    return 1 if len(regressions) > 0 else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
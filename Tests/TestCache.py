@@ -0,0 +1,33 @@
+import unittest
+
+from time import sleep
+
+from Aws.Cache import Cache
+
+
+class TestCache(unittest.TestCase):
+    """
+    Offline cache tests
+    """
+    def test_set_without_ttl(self):
+        """
+        Test values stored without a TTL never expire
+        """
+        cache = Cache(max_size=16)
+        cache.set('key', {'value': 1})
+
+        self.assertEqual({'value': 1}, cache.get('key'))
+
+    def test_set_with_ttl(self):
+        """
+        Test values stored with a TTL expire
+        """
+        cache = Cache(max_size=16)
+        cache.set('key', {'value': 1}, ttl=0.01)
+        sleep(0.02)
+
+        self.assertIsNone(cache.get('key'))
+
+
+if __name__ == '__main__':
+    unittest.main()
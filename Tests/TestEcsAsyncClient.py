@@ -0,0 +1,152 @@
+import asyncio
+import unittest
+
+from botocore.stub import Stubber
+
+from Aws.Cache import Cache
+from Aws.Credential import Credential
+from Aws.Ecs.AsyncClient import AsyncClient
+from Aws.Ecs.Client import Client
+
+
+class TestEcsAsyncClient(unittest.TestCase):
+    """
+    Offline asyncio ECS client tests, all responses are stubbed
+    """
+    __task_definition_prefix__ = 'arn:aws:ecs:ap-southeast-2:123456789012:task-definition/'
+
+    def setUp(self) -> None:
+        """
+        Setup for unit tests
+        """
+        self.credential = Credential(aws_access_key_id='unit-test', aws_secret_access_key='unit-test')
+
+        # Use a private cache so tests do not share task definitions
+        Client.set_task_definition_cache(Cache(max_size=16))
+
+    def tearDown(self) -> None:
+        """
+        Clean up after unit tests
+        """
+        Client.set_task_definition_cache(Cache(max_size=1024))
+
+    def test_list_task_definitions(self):
+        """
+        Test only the latest revision of each task definition is described, revisions already cached are not described again
+        """
+        Client.__set_cached_task_definition__(self.__get_arn__('first', 2), self.__create_result__('first', 2))
+
+        def add_responses(stubber):
+            stubber.add_response(
+                'list_task_definitions',
+                {'taskDefinitionArns': [self.__get_arn__('second', 3), self.__get_arn__('first', 2), self.__get_arn__('second', 1)]},
+                {'status': 'ACTIVE', 'sort': 'DESC'}
+            )
+            stubber.add_response(
+                'describe_task_definition',
+                self.__create_result__('second', 3),
+                {'taskDefinition': self.__get_arn__('second', 3), 'include': ['TAGS']}
+            )
+
+        task_definitions = asyncio.run(self.__list_task_definitions__(add_responses))
+
+        self.assertEqual({self.__get_arn__('first', 2), self.__get_arn__('second', 3)}, set(task_definitions))
+        self.assertEqual(3, task_definitions[self.__get_arn__('second', 3)].get('revision'))
+
+    def test_list_task_definitions_by_family(self):
+        """
+        Test the latest revision of each family is found by paging past longer family names matching the family prefix
+        """
+        def add_responses(stubber):
+            stubber.add_response('list_task_definition_families', {'families': ['first']}, {'status': 'ACTIVE'})
+            stubber.add_response(
+                'list_task_definitions',
+                {'taskDefinitionArns': [self.__get_arn__('first-worker', 4)], 'nextToken': 'page-2'},
+                {'familyPrefix': 'first', 'status': 'ACTIVE', 'sort': 'DESC'}
+            )
+            stubber.add_response(
+                'list_task_definitions',
+                {'taskDefinitionArns': [self.__get_arn__('first', 2), self.__get_arn__('first', 1)]},
+                {'familyPrefix': 'first', 'status': 'ACTIVE', 'sort': 'DESC', 'nextToken': 'page-2'}
+            )
+            stubber.add_response(
+                'describe_task_definition',
+                self.__create_result__('first', 2),
+                {'taskDefinition': self.__get_arn__('first', 2), 'include': ['TAGS']}
+            )
+
+        task_definitions = asyncio.run(self.__list_task_definitions__(add_responses, by_family=True))
+
+        self.assertEqual([self.__get_arn__('first', 2)], list(task_definitions))
+
+    def test_gather_max_concurrency(self):
+        """
+        Test no more than the maximum number of coroutines run at once and results keep their order
+        """
+        running = []
+        peak = []
+
+        async def work(value):
+            running.append(value)
+            peak.append(len(running))
+            await asyncio.sleep(0.01)
+            running.remove(value)
+
+            return value
+
+        results = asyncio.run(AsyncClient.__gather__([work(value) for value in range(10)], 3))
+
+        self.assertEqual(list(range(10)), results)
+        self.assertEqual(3, max(peak))
+
+    async def __list_task_definitions__(self, add_responses, **kwargs) -> dict:
+        """
+        List task definitions with an asyncio client whose responses are stubbed
+
+        :param add_responses: Function adding the expected responses to the stubber
+        :type add_responses: Callable
+
+        :return: Dictionary of task definitions indexed by their ARN
+        """
+        async with AsyncClient(self.credential, 'ap-southeast-2') as client:
+            with Stubber(client.__client__) as stubber:
+                add_responses(stubber)
+                task_definitions = await client.list_task_definitions(**kwargs)
+                stubber.assert_no_pending_responses()
+
+        return task_definitions
+
+    def __get_arn__(self, family, revision) -> str:
+        """
+        Get a task definition ARN
+
+        :param family: Task definition family
+        :type family: str
+
+        :param revision: Task definition revision
+        :type revision: int
+
+        :return: Task definition ARN
+        """
+        return '{prefix}{family}:{revision}'.format(prefix=self.__task_definition_prefix__, family=family, revision=revision)
+
+    def __create_result__(self, family, revision) -> dict:
+        """
+        Create a describe task definition result
+
+        :param family: Task definition family
+        :type family: str
+
+        :param revision: Task definition revision
+        :type revision: int
+
+        :return: Describe task definition result
+        """
+        return {
+            'taskDefinition': {'taskDefinitionArn': self.__get_arn__(family, revision), 'family': family, 'revision': revision, 'status': 'ACTIVE'},
+            'tags': []
+        }
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,180 @@
+import unittest
+
+from botocore.awsrequest import AWSResponse
+from botocore.stub import Stubber
+
+from Aws.Cache import Cache
+from Aws.Credential import Credential
+from Aws.Ecs.Client import Client
+from Aws.Ecs.Cluster import Cluster
+from Aws.Ecs.TaskDefinition import TaskDefinition
+from Aws.ResponseCache import ResponseCache
+
+
+class TestEcsClient(unittest.TestCase):
+    """
+    Offline ECS client tests, all responses are stubbed
+    """
+    __task_definition_arn__ = 'arn:aws:ecs:ap-southeast-2:123456789012:task-definition/unit-test:1'
+
+    def setUp(self) -> None:
+        """
+        Setup for unit tests
+        """
+        credential = Credential(aws_access_key_id='unit-test', aws_secret_access_key='unit-test')
+        self.client = Client(credential=credential, region_name='ap-southeast-2')
+        self.stubber = Stubber(self.client.__client__)
+        self.stubber.activate()
+
+        # Use a private cache so tests do not share task definitions
+        self.cache = Cache(max_size=16)
+        Client.set_task_definition_cache(self.cache)
+
+    def tearDown(self) -> None:
+        """
+        Clean up after unit tests
+        """
+        self.stubber.deactivate()
+        Client.set_task_definition_cache(Cache(max_size=1024))
+        ResponseCache.set_enabled(False)
+
+    def test_describe_task_definition_cached(self):
+        """
+        Test revisioned task definitions are described once and then served from the cache
+        """
+        self.stubber.add_response(
+            'describe_task_definition',
+            {
+                'taskDefinition': {
+                    'taskDefinitionArn': self.__task_definition_arn__,
+                    'family': 'unit-test',
+                    'revision': 1,
+                    'status': 'ACTIVE'
+                },
+                'tags': [{'key': 'Environment', 'value': 'test'}]
+            },
+            {'taskDefinition': self.__task_definition_arn__, 'include': ['TAGS']}
+        )
+
+        first = self.client.describe_task_definition(self.__task_definition_arn__)
+        second = self.client.describe_task_definition(self.__task_definition_arn__)
+
+        self.stubber.assert_no_pending_responses()
+        self.assertEqual('ACTIVE', first.get('status'))
+        self.assertEqual(first.get('revision'), second.get('revision'))
+        self.assertEqual([{'key': 'Environment', 'value': 'test'}], second.get('tags'))
+
+    def test_wait_for_tasks_missing(self):
+        """
+        Test tasks that cannot be found are reported as missing
+        """
+        cluster_arn = 'arn:aws:ecs:ap-southeast-2:123456789012:cluster/unit-test'
+        task_arn = 'arn:aws:ecs:ap-southeast-2:123456789012:task/unit-test/0'
+        self.stubber.add_response('describe_tasks', {'tasks': [], 'failures': [{'arn': task_arn, 'reason': 'MISSING'}]})
+
+        transitions = list(self.client.wait_for_tasks(cluster_arn=cluster_arn, task_arns=[task_arn], timeout=1))
+
+        self.assertEqual(1, len(transitions))
+        self.assertEqual('MISSING', transitions[0]['status'])
+        self.assertIsNone(transitions[0]['task'])
+
+    def test_wait_for_tasks_bypasses_response_cache(self):
+        """
+        Test waiting for tasks polls AWS even when a describe response has been cached
+        """
+        cluster_arn = 'arn:aws:ecs:ap-southeast-2:123456789012:cluster/unit-test'
+        task_arn = 'arn:aws:ecs:ap-southeast-2:123456789012:task/unit-test/0'
+        statuses = ['PENDING', 'RUNNING']
+
+        # The stubber answers before the response cache is consulted, answer after it instead as if the request had been sent
+        def send(**kwargs):
+            return AWSResponse(url='', status_code=200, headers={}, raw=None), {
+                'tasks': [{'taskArn': task_arn, 'lastStatus': statuses.pop(0)}],
+                'failures': []
+            }
+
+        self.stubber.deactivate()
+        self.client.__client__.meta.events.register('before-call', send)
+        ResponseCache.set_enabled(True)
+
+        self.assertEqual('PENDING', self.client.describe_task(cluster_arn=cluster_arn, task_arn=task_arn).get('lastStatus'))
+        self.assertEqual('PENDING', self.client.describe_task(cluster_arn=cluster_arn, task_arn=task_arn).get('lastStatus'))
+
+        transitions = list(self.client.wait_for_tasks(cluster_arn=cluster_arn, task_arns=[task_arn], desired_status='RUNNING', timeout=1))
+
+        self.assertEqual([], statuses)
+        self.assertEqual(['RUNNING'], [transition['status'] for transition in transitions])
+
+    def test_run_tasks_merges_overrides_and_reports_failures(self):
+        """
+        Test shared overrides are merged into each set of overrides and failures share a single shape
+        """
+        cluster = Cluster('arn:aws:ecs:ap-southeast-2:123456789012:cluster/unit-test')
+        task_definition = TaskDefinition(self.__task_definition_arn__)
+        overrides = {'containerOverrides': [{'name': 'app', 'environment': [{'name': 'STAGE', 'value': 'test'}]}], 'cpu': '256'}
+
+        self.stubber.add_response(
+            'run_task',
+            {'tasks': [], 'failures': [{'arn': 'arn:aws:ecs:ap-southeast-2:123456789012:container-instance/0', 'reason': 'RESOURCE:MEMORY'}]},
+            {
+                'cluster': cluster.get_arn(),
+                'taskDefinition': self.__task_definition_arn__,
+                'launchType': 'EC2',
+                'count': 1,
+                'overrides': {
+                    'containerOverrides': [{'name': 'app', 'environment': [{'name': 'STAGE', 'value': 'test'}], 'command': ['run']}],
+                    'cpu': '256'
+                }
+            }
+        )
+
+        result = self.client.run_tasks(
+            task_definition=task_definition,
+            cluster=cluster,
+            launch_type='EC2',
+            overrides=overrides,
+            overrides_list=[{'containerOverrides': [{'name': 'app', 'command': ['run']}]}]
+        )
+
+        self.stubber.assert_no_pending_responses()
+        self.assertEqual({}, result['tasks'])
+        self.assertEqual(1, len(result['failures']))
+        self.assertEqual(
+            ['arn', 'count', 'detail', 'overrides', 'reason'],
+            sorted(result['failures'][0].keys())
+        )
+        self.assertEqual('RESOURCE:MEMORY', result['failures'][0]['reason'])
+        self.assertEqual(1, result['failures'][0]['count'])
+
+    def test_list_task_definitions_by_family(self):
+        """
+        Test the latest revision of each family is found by paging past longer family names matching the family prefix
+        """
+        prefix = 'arn:aws:ecs:ap-southeast-2:123456789012:task-definition/'
+        task_definition_arn = prefix + 'unit-test:2'
+
+        self.stubber.add_response('list_task_definition_families', {'families': ['unit-test']}, {'status': 'ACTIVE'})
+        self.stubber.add_response(
+            'list_task_definitions',
+            {'taskDefinitionArns': [prefix + 'unit-test-worker:4'], 'nextToken': 'page-2'},
+            {'familyPrefix': 'unit-test', 'status': 'ACTIVE', 'sort': 'DESC'}
+        )
+        self.stubber.add_response(
+            'list_task_definitions',
+            {'taskDefinitionArns': [task_definition_arn, prefix + 'unit-test:1']},
+            {'familyPrefix': 'unit-test', 'status': 'ACTIVE', 'sort': 'DESC', 'nextToken': 'page-2'}
+        )
+        self.stubber.add_response(
+            'describe_task_definition',
+            {'taskDefinition': {'taskDefinitionArn': task_definition_arn, 'family': 'unit-test', 'revision': 2, 'status': 'ACTIVE'}},
+            {'taskDefinition': task_definition_arn, 'include': ['TAGS']}
+        )
+
+        task_definitions = self.client.list_task_definitions(by_family=True, max_workers=1)
+
+        self.stubber.assert_no_pending_responses()
+        self.assertEqual([task_definition_arn], list(task_definitions))
+
+
+if __name__ == '__main__':
+    unittest.main()
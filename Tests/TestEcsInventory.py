@@ -0,0 +1,114 @@
+import unittest
+
+from botocore.stub import Stubber
+
+from Aws.Credential import Credential
+from Aws.Ecs.Client import Client
+from Aws.Ecs.Inventory import Inventory
+
+
+class TestEcsInventory(unittest.TestCase):
+    """
+    Offline ECS inventory tests, all responses are stubbed
+    """
+    __cluster_arn__ = 'arn:aws:ecs:ap-southeast-2:123456789012:cluster/unit-test'
+    __service_arn__ = 'arn:aws:ecs:ap-southeast-2:123456789012:service/unit-test/web'
+    __task_prefix__ = 'arn:aws:ecs:ap-southeast-2:123456789012:task/unit-test/'
+
+    def setUp(self) -> None:
+        """
+        Setup for unit tests
+        """
+        credential = Credential(aws_access_key_id='unit-test', aws_secret_access_key='unit-test')
+        self.client = Client(credential=credential, region_name='ap-southeast-2')
+        self.stubber = Stubber(self.client.__client__)
+        self.stubber.activate()
+        self.inventory = Inventory(self.client)
+
+    def tearDown(self) -> None:
+        """
+        Clean up after unit tests
+        """
+        self.stubber.deactivate()
+
+    def test_refresh(self):
+        """
+        Test clusters, services and standalone tasks are diffed between refreshes and tasks of unchanged services are not fetched again
+        """
+        service_task = self.__task_prefix__ + 'service'
+        standalone_task = self.__task_prefix__ + 'standalone'
+
+        self.__add_cluster_responses__(running_tasks_count=2)
+        self.stubber.add_response('list_tasks', {'taskArns': [service_task]}, {'cluster': self.__cluster_arn__, 'serviceName': 'web'})
+        self.__add_describe_tasks_response__([(service_task, 'service:web')])
+        self.stubber.add_response('list_tasks', {'taskArns': [service_task, standalone_task]}, {'cluster': self.__cluster_arn__})
+        self.__add_describe_tasks_response__([(standalone_task, 'family:batch')])
+
+        diff = self.inventory.refresh()
+
+        self.stubber.assert_no_pending_responses()
+        self.assertEqual({'added': [self.__cluster_arn__], 'removed': [], 'changed': []}, diff['clusters'])
+        self.assertEqual({'added': [self.__service_arn__], 'removed': [], 'changed': []}, diff['services'])
+        self.assertEqual({service_task, standalone_task}, set(diff['tasks']['added']))
+        self.assertEqual([standalone_task], list(self.inventory.get_tasks(self.__cluster_arn__)))
+
+        # The standalone task has stopped, and the service has started a task since its tasks were last refreshed
+        replacement_task = self.__task_prefix__ + 'replacement'
+
+        self.__add_cluster_responses__(running_tasks_count=1)
+        self.stubber.add_response('list_tasks', {'taskArns': [service_task, replacement_task]}, {'cluster': self.__cluster_arn__})
+        self.__add_describe_tasks_response__([(replacement_task, 'service:web')])
+
+        diff = self.inventory.refresh()
+
+        self.stubber.assert_no_pending_responses()
+        self.assertEqual({'added': [], 'removed': [], 'changed': [self.__cluster_arn__]}, diff['clusters'])
+        self.assertEqual({'added': [], 'removed': [], 'changed': []}, diff['services'])
+        self.assertEqual({'added': [], 'removed': [standalone_task], 'changed': []}, diff['tasks'])
+        self.assertEqual([service_task], list(self.inventory.get_tasks()))
+
+    def __add_cluster_responses__(self, running_tasks_count) -> None:
+        """
+        Stub listing and describing the cluster and its service
+
+        :param running_tasks_count: Number of tasks running in the cluster
+        :type running_tasks_count: int
+        """
+        self.stubber.add_response('list_clusters', {'clusterArns': [self.__cluster_arn__]}, {})
+        self.stubber.add_response(
+            'describe_clusters',
+            {'clusters': [{'clusterArn': self.__cluster_arn__, 'status': 'ACTIVE', 'runningTasksCount': running_tasks_count}]},
+            {'clusters': [self.__cluster_arn__], 'include': ['ATTACHMENTS', 'SETTINGS', 'STATISTICS', 'TAGS']}
+        )
+        self.stubber.add_response('list_services', {'serviceArns': [self.__service_arn__]}, {'cluster': self.__cluster_arn__})
+        self.stubber.add_response(
+            'describe_services',
+            {
+                'services': [{
+                    'serviceArn': self.__service_arn__,
+                    'serviceName': 'web',
+                    'taskDefinition': 'arn:aws:ecs:ap-southeast-2:123456789012:task-definition/web:1',
+                    'desiredCount': 1,
+                    'runningCount': 1,
+                    'pendingCount': 0
+                }]
+            },
+            {'cluster': self.__cluster_arn__, 'services': [self.__service_arn__], 'include': ['TAGS']}
+        )
+
+    def __add_describe_tasks_response__(self, tasks) -> None:
+        """
+        Stub describing tasks
+
+        :param tasks: List of tuples of task ARN and group
+        :type tasks: List[tuple]
+        """
+        self.stubber.add_response(
+            'describe_tasks',
+            {'tasks': [{'taskArn': task_arn, 'group': group, 'lastStatus': 'RUNNING', 'desiredStatus': 'RUNNING'} for task_arn, group in tasks]},
+            {'cluster': self.__cluster_arn__, 'tasks': [task_arn for task_arn, _ in tasks], 'include': ['TAGS']}
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import socket
+import unittest
+
+import boto3
+
+from botocore.config import Config
+from botocore.exceptions import EndpointConnectionError
+
+from Aws.Instrumentation import Instrumentation
+
+
+class TestInstrumentation(unittest.TestCase):
+    """
+    Offline instrumentation tests
+    """
+    def setUp(self) -> None:
+        """
+        Setup for unit tests
+        """
+        Instrumentation.reset()
+
+    def tearDown(self) -> None:
+        """
+        Clean up after unit tests
+        """
+        Instrumentation.reset()
+
+    def test_connection_error_is_recorded_and_raised(self):
+        """
+        Test a request that never reaches AWS raises the botocore exception and is recorded as an error
+        """
+        # Find a local port with nothing listening on it
+        with socket.socket() as listener:
+            listener.bind(('127.0.0.1', 0))
+            port = listener.getsockname()[1]
+
+        client = boto3.client(
+            'ecs',
+            region_name='ap-southeast-2',
+            endpoint_url='http://127.0.0.1:{port}'.format(port=port),
+            aws_access_key_id='unit-test',
+            aws_secret_access_key='unit-test',
+            config=Config(retries={'total_max_attempts': 1}, connect_timeout=1)
+        )
+        Instrumentation.register(client)
+
+        with self.assertRaises(EndpointConnectionError):
+            client.list_clusters()
+
+        stats = Instrumentation.get_stats()['ecs.ListClusters']
+
+        self.assertEqual(1, stats['calls'])
+        self.assertEqual(1, stats['errors'])
+
+
+if __name__ == '__main__':
+    unittest.main()
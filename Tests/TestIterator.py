@@ -0,0 +1,79 @@
+import unittest
+
+from botocore.stub import Stubber
+
+from Aws.Credential import Credential
+from Aws.Iterator import Iterator
+from Aws.Route53.Client import Client
+
+
+class TestIterator(unittest.TestCase):
+    """
+    Offline iterator tests, all responses are stubbed
+    """
+    __hosted_zone_id__ = 'Z0000000UNITTEST'
+
+    def setUp(self) -> None:
+        """
+        Setup for unit tests
+        """
+        credential = Credential(aws_access_key_id='unit-test', aws_secret_access_key='unit-test')
+        self.client = Client(credential=credential, region_name='ap-southeast-2')
+        self.stubber = Stubber(self.client.__client__)
+        self.stubber.activate()
+
+    def tearDown(self) -> None:
+        """
+        Clean up after unit tests
+        """
+        self.stubber.deactivate()
+
+    def test_stream_compound_token(self):
+        """
+        Test every page of a compound pagination token is fetched exactly once, parts of the token absent from a page are not sent again
+        """
+        pages = [
+            (
+                {'NextRecordName': 'b.example.com.', 'NextRecordType': 'A', 'NextRecordIdentifier': 'blue'},
+                {}
+            ),
+            (
+                {'NextRecordName': 'c.example.com.', 'NextRecordType': 'CNAME'},
+                {'StartRecordName': 'b.example.com.', 'StartRecordType': 'A', 'StartRecordIdentifier': 'blue'}
+            ),
+            (
+                {},
+                {'StartRecordName': 'c.example.com.', 'StartRecordType': 'CNAME'}
+            )
+        ]
+
+        for index, (tokens, expected) in enumerate(pages):
+            response = {
+                'ResourceRecordSets': [{'Name': 'record{index}.example.com.'.format(index=index), 'Type': 'A'}],
+                'IsTruncated': len(tokens) > 0,
+                'MaxItems': '1'
+            }
+            response.update(tokens)
+            self.stubber.add_response('list_resource_record_sets', response, {'HostedZoneId': self.__hosted_zone_id__, **expected})
+
+        arguments = {'HostedZoneId': self.__hosted_zone_id__}
+        record_sets = list(Iterator.stream(
+            client=self.client.__client__,
+            method_name='list_resource_record_sets',
+            data_key='ResourceRecordSets',
+            arguments=arguments,
+            token_keys={
+                'NextRecordName': 'StartRecordName',
+                'NextRecordType': 'StartRecordType',
+                'NextRecordIdentifier': 'StartRecordIdentifier'
+            },
+            truncated_key='IsTruncated'
+        ))
+
+        self.stubber.assert_no_pending_responses()
+        self.assertEqual(['record0.example.com.', 'record1.example.com.', 'record2.example.com.'], [record_set['Name'] for record_set in record_sets])
+        self.assertEqual({'HostedZoneId': self.__hosted_zone_id__}, arguments)
+
+
+if __name__ == '__main__':
+    unittest.main()
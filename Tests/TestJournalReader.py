@@ -0,0 +1,43 @@
+import os
+import tempfile
+import unittest
+
+from Aws.Qldb.JournalReader import JournalReader
+
+
+class TestJournalReader(unittest.TestCase):
+    """
+    Offline QLDB journal reader tests using a local export directory
+    """
+    def setUp(self) -> None:
+        """
+        Setup for unit tests
+        """
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        """
+        Clean up after unit tests
+        """
+        self.directory.cleanup()
+
+    def test_list_files_in_journal_order(self):
+        """
+        Test data files are listed by their numeric start sequence number and manifests are excluded
+        """
+        names = ['strand.11-15.ion', 'strand.6-10.ion', 'strand.0-5.ion', 'export.started.manifest']
+
+        for name in names:
+            with open(os.path.join(self.directory.name, name), 'w') as file:
+                file.write('')
+
+        files = JournalReader(path=self.directory.name).list_files()
+
+        self.assertEqual(
+            ['strand.0-5.ion', 'strand.6-10.ion', 'strand.11-15.ion'],
+            [os.path.basename(file) for file in files]
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
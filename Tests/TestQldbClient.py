@@ -1,13 +1,17 @@
+import base64
+import hashlib
 import os
 import unittest
 import warnings
-from time import time, sleep
+from time import time
 
-import botocore
+from botocore.session import Session
+from botocore.stub import Stubber
 
 from Aws.Credential import Credential
 from Aws.Qldb.Client import Client
 from Aws.Qldb.LedgerState import LedgerState
+from Aws.Qldb.QldbException import QldbException
 
 
 class TestQldbClient(unittest.TestCase):
@@ -53,12 +57,8 @@ class TestQldbClient(unittest.TestCase):
         )
 
         print('Waiting for ledger to become active')
-        while True:
-            sleep(3)
-            ledger = self.client.describe_ledger(name=name)
-            state = ledger.get('State')
-            if state != LedgerState.CREATING.value:
-                break
+        ledger = self.client.wait_for_ledger(name=name, state=LedgerState.ACTIVE, timeout=300)
+        state = ledger.get('State')
 
         if state != LedgerState.ACTIVE.value:
             raise Exception('Unexpected ledger status ({state}), expected ACTIVE'.format(state=state))
@@ -72,24 +72,12 @@ class TestQldbClient(unittest.TestCase):
         if state != LedgerState.DELETING.value:
             raise Exception('Unexpected ledger status ({state}), expected DELETING'.format(state=state))
 
-        # Attempt to describe the ledger until we hit a ResourceNotFoundException. If this doesn't happen within 2 minutes, assume deletion failed
+        # Wait until the ledger can no longer be found. If this doesn't happen within 2 minutes, assume deletion failed
         print('Waiting for ledger deletion to complete')
-        count = 0
-        while True:
-            sleep(6)
-            try:
-                ledger = self.client.describe_ledger(name=name)
-                if state != LedgerState.DELETING.value:
-                    raise Exception('Unexpected ledger status ({state}), expected DELETING'.format(state=state))
-            except botocore.errorfactory.ResourceNotFoundException:
-                return
-
-            # After 20 attempts, give up waiting for deletion
-            count = count + 1
-            if count == 20:
-                break
-
-        raise Exception('Timed out waiting for deletion of QLDB ledger')
+        try:
+            self.client.wait_for_ledger(name=name, state=LedgerState.DELETED, timeout=120)
+        except QldbException:
+            raise Exception('Timed out waiting for deletion of QLDB ledger')
 
     def test_list_ledgers(self):
         """
@@ -97,3 +85,65 @@ class TestQldbClient(unittest.TestCase):
         """
         print('Listing ledgers')
         ledgers = self.client.list_ledgers()
+
+
+@unittest.skipUnless('qldb' in Session().get_available_services(), 'The installed botocore does not include the QLDB service model')
+class TestQldbClientOffline(unittest.TestCase):
+    """
+    Offline QLDB client tests, all responses are stubbed
+    """
+    def setUp(self) -> None:
+        """
+        Setup for unit tests
+        """
+        credential = Credential(aws_access_key_id='unit-test', aws_secret_access_key='unit-test')
+        self.client = Client(credential=credential, region_name='ap-southeast-2')
+        self.stubber = Stubber(self.client.__client__)
+        self.stubber.activate()
+
+        # Digests are cached process wide, use a ledger name unique to this test run
+        self.name = 'UnitTest{timestamp}'.format(timestamp=int(time() * 1000000))
+
+    def tearDown(self) -> None:
+        """
+        Clean up after unit tests
+        """
+        self.stubber.deactivate()
+
+    def test_get_digest_and_verify_revisions(self):
+        """
+        Test the digest is retrieved once and cached, and a revision is verified against it
+        """
+        from Aws.Qldb.Proof import Proof
+
+        revision_hash = hashlib.sha256(b'revision').digest()
+        proof_hash = hashlib.sha256(b'proof').digest()
+        digest = Proof.join_hashes(revision_hash, proof_hash)
+        tip_address = {'IonText': '{strandId: "unit-test", sequenceNo: 10}'}
+
+        self.stubber.add_response('get_digest', {'Digest': digest, 'DigestTipAddress': tip_address}, {'Name': self.name})
+        self.stubber.add_response(
+            'get_revision',
+            {
+                'Proof': {'IonText': '[{{{{{proof}}}}}]'.format(proof=base64.b64encode(proof_hash).decode())},
+                'Revision': {'IonText': '{{hash: {{{{{revision}}}}}}}'.format(revision=base64.b64encode(revision_hash).decode())}
+            },
+            {
+                'Name': self.name,
+                'BlockAddress': {'IonText': '{strandId: "unit-test", sequenceNo: 5}'},
+                'DocumentId': 'LtMNJYNjSwzBLgf7sLifrG',
+                'DigestTipAddress': tip_address
+            }
+        )
+
+        self.assertEqual(digest, self.client.get_digest(self.name)['Digest'])
+
+        results = self.client.verify_revisions(
+            name=self.name,
+            revisions=[{'document_id': 'LtMNJYNjSwzBLgf7sLifrG', 'block_address': {'strandId': 'unit-test', 'sequenceNo': 5}}],
+            use_processes=False
+        )
+
+        self.assertIsNone(results[0]['error'])
+        self.stubber.assert_no_pending_responses()
+        self.assertTrue(results[0]['verified'])
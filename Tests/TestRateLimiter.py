@@ -0,0 +1,97 @@
+import unittest
+
+from time import monotonic
+
+from Aws.RateLimiter import RateLimiter
+
+
+class TestRateLimiter(unittest.TestCase):
+    """
+    Offline rate limiter tests
+    """
+    def test_unconfigured_service_is_unlimited(self):
+        """
+        Test buckets of services without a configured rate never delay requests until throttled
+        """
+        limiter = RateLimiter.get_limiter('unit-test', 'ap-southeast-2', 'unlimited', 'Invoke')
+
+        self.assertIsNone(limiter.get_rate())
+        self.assertEqual(0.0, max([limiter.reserve() for _ in range(1000)]))
+
+    def test_configured_service_is_limited(self):
+        """
+        Test buckets of services with a configured rate start at that rate
+        """
+        self.assertEqual(5.0, RateLimiter.get_limiter('route53', None, 'configured', 'ChangeResourceRecordSets').get_rate())
+
+    def test_acquire(self):
+        """
+        Test requests beyond the burst wait for a token
+        """
+        limiter = RateLimiter(rate=20, burst=1)
+
+        self.assertEqual(0.0, limiter.acquire())
+
+        started = monotonic()
+        waited = limiter.acquire()
+
+        self.assertGreater(waited, 0.0)
+        self.assertGreaterEqual(monotonic() - started, waited * 0.9)
+
+    def test_reserve_queues_callers(self):
+        """
+        Test concurrent callers are queued behind each other rather than all waiting for the same token
+        """
+        limiter = RateLimiter(rate=10, burst=1)
+        delays = [limiter.reserve() for _ in range(3)]
+
+        self.assertEqual(0.0, delays[0])
+        self.assertAlmostEqual(0.1, delays[1], places=2)
+        self.assertAlmostEqual(0.2, delays[2], places=2)
+
+    def test_decrease_on_throttle(self):
+        """
+        Test the rate is reduced multiplicatively on throttle, once per cooldown, and never below the minimum rate
+        """
+        limiter = RateLimiter(rate=10)
+        limiter.on_throttle()
+        self.assertAlmostEqual(7.0, limiter.get_rate())
+
+        # Requests in flight when the limit was hit are throttled together
+        limiter.on_throttle()
+        self.assertAlmostEqual(7.0, limiter.get_rate())
+
+        limiter = RateLimiter(rate=0.6)
+        limiter.on_throttle()
+        self.assertEqual(0.5, limiter.get_rate())
+
+    def test_throttle_starts_limiting_from_observed_rate(self):
+        """
+        Test the first throttle of an unlimited bucket limits it below the rate requests were being sent at
+        """
+        limiter = RateLimiter()
+
+        for _ in range(49):
+            limiter.reserve()
+
+        limiter.on_throttle()
+
+        self.assertAlmostEqual(35.0, limiter.get_rate())
+        self.assertGreater(limiter.reserve(), 0.0)
+
+    def test_increase_on_success(self):
+        """
+        Test the rate grows additively while requests succeed, up to the maximum rate
+        """
+        limiter = RateLimiter(rate=10, max_rate=11)
+        limiter.on_success()
+        self.assertAlmostEqual(10.1, limiter.get_rate())
+
+        for _ in range(100):
+            limiter.on_success()
+
+        self.assertEqual(11.0, limiter.get_rate())
+
+
+if __name__ == '__main__':
+    unittest.main()
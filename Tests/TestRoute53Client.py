@@ -0,0 +1,222 @@
+import unittest
+
+from datetime import datetime
+
+from botocore.stub import Stubber
+
+from Aws.Credential import Credential
+from Aws.Route53.Client import Client
+
+
+class TestRoute53Client(unittest.TestCase):
+    """
+    Offline Route53 client tests, all responses are stubbed
+    """
+    __hosted_zone_id__ = 'Z0000000UNITTEST'
+
+    def setUp(self) -> None:
+        """
+        Setup for unit tests
+        """
+        credential = Credential(aws_access_key_id='unit-test', aws_secret_access_key='unit-test')
+        self.client = Client(credential=credential, region_name='ap-southeast-2')
+        self.stubber = Stubber(self.client.__client__)
+        self.stubber.activate()
+
+    def tearDown(self) -> None:
+        """
+        Clean up after unit tests
+        """
+        self.stubber.deactivate()
+
+    def test_pack_changes_max_changes(self):
+        """
+        Test change batches are split at the maximum number of changes
+        """
+        changes = [self.__create_change__('a{index}'.format(index=index)) for index in range(1001)]
+
+        self.assertEqual([1000, 1], [len(batch) for batch in Client.__pack_changes__(changes)])
+
+    def test_pack_changes_max_records(self):
+        """
+        Test change batches are split at the maximum number of records, UPSERT changes counting twice
+        """
+        changes = [self.__create_change__('a{index}'.format(index=index), values=['192.0.2.1', '192.0.2.2']) for index in range(501)]
+        self.assertEqual([500, 1], [len(batch) for batch in Client.__pack_changes__(changes)])
+
+        changes = [self.__create_change__('a{index}'.format(index=index), action='UPSERT') for index in range(501)]
+        self.assertEqual([500, 1], [len(batch) for batch in Client.__pack_changes__(changes)])
+
+    def test_pack_changes_max_characters(self):
+        """
+        Test change batches are split at the maximum number of characters, UPSERT changes counting twice
+        """
+        value = '"{text}"'.format(text='x' * 998)
+
+        changes = [self.__create_change__('a{index}'.format(index=index), record_type='TXT', values=[value]) for index in range(33)]
+        self.assertEqual([32, 1], [len(batch) for batch in Client.__pack_changes__(changes)])
+
+        changes = [self.__create_change__('a{index}'.format(index=index), record_type='TXT', values=[value], action='UPSERT') for index in range(17)]
+        self.assertEqual([16, 1], [len(batch) for batch in Client.__pack_changes__(changes)])
+
+    def test_pack_changes_oversized_change(self):
+        """
+        Test a single change larger than a change batch is rejected
+        """
+        values = ['"{index}"'.format(index=index) for index in range(501)]
+
+        with self.assertRaises(Exception):
+            Client.__pack_changes__([self.__create_change__('a', record_type='TXT', values=values, action='UPSERT')])
+
+    def test_change_resource_record_sets_batches(self):
+        """
+        Test changes are submitted in order in as few requests as the limits allow
+        """
+        changes = [self.__create_change__('a{index}'.format(index=index)) for index in range(1001)]
+
+        for change_id, batch in (('C1', changes[:1000]), ('C2', changes[1000:])):
+            self.stubber.add_response(
+                'change_resource_record_sets',
+                {'ChangeInfo': {'Id': change_id, 'Status': 'PENDING', 'SubmittedAt': datetime(2024, 1, 1)}},
+                {'HostedZoneId': self.__hosted_zone_id__, 'ChangeBatch': {'Changes': batch}}
+            )
+
+        result = self.client.change_resource_record_sets(changes={self.__hosted_zone_id__: changes})
+
+        self.stubber.assert_no_pending_responses()
+        self.assertEqual({}, result['errors'])
+        self.assertEqual(['C1', 'C2'], result['change_ids'][self.__hosted_zone_id__])
+
+    def test_sync_unchanged_zone(self):
+        """
+        Test reconciling an unchanged zone only lists the current record sets
+        """
+        record_sets = [self.__create_record_set__('a{index}.example.com.'.format(index=index)) for index in range(4)]
+
+        self.__add_list_responses__([record_sets[:2], record_sets[2:]])
+
+        # Name case and trailing dots are not significant
+        desired = [dict(record_set) for record_set in record_sets]
+        desired[0]['Name'] = 'A0.Example.com'
+
+        plan = self.client.sync_resource_record_sets(self.__hosted_zone_id__, desired)
+
+        self.stubber.assert_no_pending_responses()
+        self.assertEqual(4, plan['unchanged'])
+        self.assertEqual(([], [], [], []), (plan['create'], plan['update'], plan['delete'], plan['change_ids']))
+
+    def test_sync_never_deletes_apex_soa_and_ns(self):
+        """
+        Test unmanaged record sets are deleted except the zone apex SOA and NS records
+        """
+        apex_soa = self.__create_record_set__('example.com.', record_type='SOA', values=['ns.example.com. admin.example.com. 1 7200 900 1209600 86400'])
+        apex_ns = self.__create_record_set__('example.com.', record_type='NS', values=['ns.example.com.'])
+        delegation = self.__create_record_set__('sub.example.com.', record_type='NS', values=['ns.example.net.'])
+        unmanaged = self.__create_record_set__('old.example.com.')
+        managed = self.__create_record_set__('www.example.com.')
+        changed = self.__create_record_set__('api.example.com.', values=['192.0.2.9'])
+        created = self.__create_record_set__('new.example.com.')
+
+        self.stubber.add_response(
+            'get_hosted_zone',
+            {'HostedZone': {'Id': self.__hosted_zone_id__, 'Name': 'example.com.', 'CallerReference': 'unit-test'}},
+            {'Id': self.__hosted_zone_id__}
+        )
+        self.__add_list_responses__([[apex_soa, apex_ns, delegation, unmanaged, managed, self.__create_record_set__('api.example.com.')]])
+        self.stubber.add_response(
+            'change_resource_record_sets',
+            {'ChangeInfo': {'Id': 'C1', 'Status': 'PENDING', 'SubmittedAt': datetime(2024, 1, 1)}},
+            {
+                'HostedZoneId': self.__hosted_zone_id__,
+                'ChangeBatch': {
+                    'Changes': [
+                        {'Action': 'DELETE', 'ResourceRecordSet': delegation},
+                        {'Action': 'DELETE', 'ResourceRecordSet': unmanaged},
+                        {'Action': 'UPSERT', 'ResourceRecordSet': changed},
+                        {'Action': 'CREATE', 'ResourceRecordSet': created}
+                    ]
+                }
+            }
+        )
+
+        plan = self.client.sync_resource_record_sets(self.__hosted_zone_id__, [managed, changed, created], delete_unmanaged=True)
+
+        self.stubber.assert_no_pending_responses()
+        self.assertEqual(1, plan['unchanged'])
+        self.assertEqual(['C1'], plan['change_ids'])
+
+    def __add_list_responses__(self, pages) -> None:
+        """
+        Stub listing the hosted zone record sets a page at a time
+
+        :param pages: List of pages of record sets
+        :type pages: List[List[dict]]
+        """
+        expected = {'HostedZoneId': self.__hosted_zone_id__}
+
+        for index, page in enumerate(pages):
+            response = {'ResourceRecordSets': page, 'IsTruncated': index < len(pages) - 1, 'MaxItems': '300'}
+
+            if response['IsTruncated'] is True:
+                response['NextRecordName'] = pages[index + 1][0]['Name']
+                response['NextRecordType'] = pages[index + 1][0]['Type']
+
+            self.stubber.add_response('list_resource_record_sets', response, dict(expected))
+
+            if response['IsTruncated'] is True:
+                expected = {
+                    'HostedZoneId': self.__hosted_zone_id__,
+                    'StartRecordName': response['NextRecordName'],
+                    'StartRecordType': response['NextRecordType']
+                }
+
+    @staticmethod
+    def __create_record_set__(name, record_type='A', values=None) -> dict:
+        """
+        Create a record set
+
+        :param name: Record name
+        :type name: str
+
+        :param record_type: Record type
+        :type record_type: str
+
+        :param values: Record values
+        :type values: Optional[List[str]]
+
+        :return: Record set
+        """
+        return {
+            'Name': name,
+            'Type': record_type,
+            'TTL': 300,
+            'ResourceRecords': [{'Value': value} for value in (values or ['192.0.2.1'])]
+        }
+
+    @staticmethod
+    def __create_change__(name, record_type='A', values=None, action='CREATE') -> dict:
+        """
+        Create a record set change
+
+        :param name: Record name, relative to example.com
+        :type name: str
+
+        :param record_type: Record type
+        :type record_type: str
+
+        :param values: Record values
+        :type values: Optional[List[str]]
+
+        :param action: Change action
+        :type action: str
+
+        :return: Change
+        """
+        return {
+            'Action': action,
+            'ResourceRecordSet': TestRoute53Client.__create_record_set__('{name}.example.com.'.format(name=name), record_type, values)
+        }
+
+
+if __name__ == '__main__':
+    unittest.main()
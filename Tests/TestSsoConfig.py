@@ -0,0 +1,265 @@
+import json
+import os
+import stat
+import tempfile
+import threading
+import unittest
+
+from configparser import ConfigParser
+from datetime import datetime, timedelta
+from time import sleep
+from unittest import mock
+
+from botocore.exceptions import ClientError
+
+from Aws.Sso.Config import Config
+from Aws.Sso.ConfigException import ConfigException
+
+
+class TestSsoConfig(unittest.TestCase):
+    """
+    Offline SSO config tests using a temporary AWS configuration and SSO cache directory, role credentials are never requested from AWS
+    """
+    __start_url__ = 'https://unit-test.awsapps.com/start'
+
+    def setUp(self) -> None:
+        """
+        Setup for unit tests
+        """
+        self.directory = tempfile.TemporaryDirectory()
+        self.paths = (Config.__aws_config_path__, Config.__aws_credential_path__, Config.__aws_sso_cache_path__)
+
+        Config.__aws_config_path__ = os.path.join(self.directory.name, 'config')
+        Config.__aws_credential_path__ = os.path.join(self.directory.name, 'credentials')
+        Config.__aws_sso_cache_path__ = os.path.join(self.directory.name, 'sso', 'cache')
+        os.makedirs(Config.__aws_sso_cache_path__)
+
+        with open(Config.__aws_config_path__, 'w') as config_file:
+            for profile_name in ('first', 'second'):
+                config_file.write(
+                    '[profile {profile_name}]\n'
+                    'sso_start_url = {start_url}\n'
+                    'sso_region = ap-southeast-2\n'
+                    'sso_account_id = 123456789012\n'
+                    'sso_role_name = {profile_name}\n'
+                    'region = ap-southeast-2\n\n'.format(profile_name=profile_name, start_url=self.__start_url__)
+                )
+
+        # Role credentials are returned for the role named in the profile
+        self.requests = []
+        self.patcher = mock.patch.object(Config, '__get_sso_role_credentials__', side_effect=self.__get_role_credentials__)
+        self.get_role_credentials = self.patcher.start()
+
+    def tearDown(self) -> None:
+        """
+        Clean up after unit tests
+        """
+        self.patcher.stop()
+        Config.__aws_config_path__, Config.__aws_credential_path__, Config.__aws_sso_cache_path__ = self.paths
+        self.directory.cleanup()
+
+    def test_unrelated_cache_files_are_not_parsed(self):
+        """
+        Test SSO cache files of other logins never prevent credentials being refreshed, whatever their timestamp format
+        """
+        self.__write_login__('other.json', 'https://other.awsapps.com/start', 'not a timestamp')
+        self.__write_login__('login.json', self.__start_url__, self.__format_expiry__(hours=8, timestamp_format='%Y-%m-%dT%H:%M:%SZ'))
+
+        refreshed = Config.set_profiles_credentials(['first', 'second'])
+
+        self.assertEqual(['first', 'second'], refreshed)
+        self.assertEqual('first-key', self.__read_credentials__().get('first', 'aws_access_key_id'))
+
+    def test_unparseable_login_is_skipped(self):
+        """
+        Test a matching SSO cache file with an unrecognised expiry is ignored rather than raising
+        """
+        self.__write_login__('login.json', self.__start_url__, 'not a timestamp')
+
+        with self.assertRaises(ConfigException):
+            Config.set_profiles_credentials(['first'])
+
+    def test_expired_login(self):
+        """
+        Test an expired SSO login is reported as expired
+        """
+        self.__write_login__('login.json', self.__start_url__, self.__format_expiry__(hours=-1))
+
+        with self.assertRaisesRegex(ConfigException, 'expired'):
+            Config.set_profiles_credentials(['first'])
+
+    def test_valid_credentials_are_not_refreshed(self):
+        """
+        Test credentials are only requested again once they are within the refresh margin of expiring
+        """
+        self.__write_login__('login.json', self.__start_url__, self.__format_expiry__(hours=8))
+
+        self.assertEqual(['first', 'second'], Config.set_profiles_credentials(['first', 'second']))
+        self.assertEqual(2, len(self.requests))
+
+        self.assertEqual([], Config.set_profiles_credentials(['first', 'second']))
+        self.assertEqual(2, len(self.requests))
+
+        # Credentials expire in an hour, which is within a two hour margin
+        self.assertEqual(['first', 'second'], Config.set_profiles_credentials(['first', 'second'], refresh_margin=7200))
+        self.assertEqual(4, len(self.requests))
+
+        self.assertEqual(['first'], Config.set_profiles_credentials(['first'], force=True))
+        self.assertEqual(5, len(self.requests))
+
+    def test_expired_login_is_skipped(self):
+        """
+        Test a newer expired SSO cache entry does not hide an older unexpired login
+        """
+        self.__write_login__('valid.json', self.__start_url__, self.__format_expiry__(hours=8), modified=1000)
+        self.__write_login__('expired.json', self.__start_url__, self.__format_expiry__(hours=-1), modified=2000)
+
+        self.assertEqual(['first'], Config.set_profiles_credentials(['first']))
+        self.assertEqual('first-key', self.__read_credentials__().get('first', 'aws_access_key_id'))
+
+    def test_credentials_written_atomically(self):
+        """
+        Test the credentials file is replaced with a file readable only by its owner and no temporary files are left behind
+        """
+        self.__write_login__('login.json', self.__start_url__, self.__format_expiry__(hours=8))
+
+        with open(Config.__aws_credential_path__, 'w') as credentials_file:
+            credentials_file.write('[unmanaged]\naws_access_key_id = unmanaged-key\n')
+
+        Config.set_profiles_credentials(['first'])
+        credentials = self.__read_credentials__()
+
+        self.assertEqual(0o600, stat.S_IMODE(os.stat(Config.__aws_credential_path__).st_mode))
+        self.assertEqual(['config', 'credentials', 'credentials.lock', 'sso'], sorted(os.listdir(self.directory.name)))
+        self.assertEqual('unmanaged-key', credentials.get('unmanaged', 'aws_access_key_id'))
+        self.assertEqual('first-key', credentials.get('first', 'aws_access_key_id'))
+
+    def test_failed_write_keeps_credentials(self):
+        """
+        Test a failure while writing leaves the existing credentials file intact
+        """
+        self.__write_login__('login.json', self.__start_url__, self.__format_expiry__(hours=8))
+
+        with open(Config.__aws_credential_path__, 'w') as credentials_file:
+            credentials_file.write('[unmanaged]\naws_access_key_id = unmanaged-key\n')
+
+        with mock.patch.object(ConfigParser, 'write', side_effect=OSError('No space left on device')):
+            with self.assertRaises(OSError):
+                Config.set_profiles_credentials(['first'])
+
+        self.assertEqual(['unmanaged'], self.__read_credentials__().sections())
+        self.assertEqual(['config', 'credentials', 'credentials.lock', 'sso'], sorted(os.listdir(self.directory.name)))
+
+    def test_lock_serialises_updates(self):
+        """
+        Test an update waits for the credentials lock held by another process, then skips the credentials that process refreshed
+        """
+        self.__write_login__('login.json', self.__start_url__, self.__format_expiry__(hours=8))
+        results = []
+
+        with Config.__lock_credentials__():
+            thread = threading.Thread(target=lambda: results.append(Config.set_profiles_credentials(['first'])))
+            thread.start()
+            sleep(0.2)
+
+            self.assertEqual([], self.requests)
+
+            # Refresh the credentials while the lock is held, as a concurrent process would
+            credentials_config = Config.__read_config__(Config.__aws_credential_path__)
+            Config.__update_aws_credentials__(credentials_config, 'first', {}, self.__get_role_credentials__({'sso_role_name': 'first'}, {}))
+            Config.__write_config__(Config.__aws_credential_path__, credentials_config)
+
+        thread.join(timeout=5)
+
+        self.assertEqual([[]], results)
+        self.assertEqual(['first'], self.requests)
+
+    def test_watch_continues_after_client_error(self):
+        """
+        Test watching credentials carries on after a transient AWS error and refreshes them on the next check
+        """
+        self.__write_login__('login.json', self.__start_url__, self.__format_expiry__(hours=8))
+        throttled = ClientError({'Error': {'Code': 'TooManyRequestsException', 'Message': 'Rate exceeded'}}, 'GetRoleCredentials')
+        self.get_role_credentials.side_effect = [throttled, self.__get_role_credentials__({'sso_role_name': 'first'}, {})]
+
+        Config.watch_profiles_credentials(['first'], interval=0, iterations=2)
+
+        self.assertEqual(2, self.get_role_credentials.call_count)
+        self.assertEqual('first-key', self.__read_credentials__().get('first', 'aws_access_key_id'))
+
+    def __get_role_credentials__(self, profile, login) -> dict:
+        """
+        Return fake role credentials for a profile, recording the request
+
+        :param profile: The configuration profile
+        :type profile: dict
+
+        :param login: The cached SSO login
+        :type login: dict
+
+        :return: Role credentials
+        """
+        self.requests.append(profile['sso_role_name'])
+        expiration = datetime.utcnow() + timedelta(hours=1)
+
+        return {
+            'accessKeyId': '{role_name}-key'.format(role_name=profile['sso_role_name']),
+            'secretAccessKey': 'secret',
+            'sessionToken': 'token',
+            'expiration': int((expiration - datetime(1970, 1, 1)).total_seconds() * 1000)
+        }
+
+    def __write_login__(self, file_name, start_url, expires_at, modified=None) -> None:
+        """
+        Write a cached SSO login
+
+        :param file_name: Name of the cache file
+        :type file_name: str
+
+        :param start_url: SSO start URL
+        :type start_url: str
+
+        :param expires_at: Expiry timestamp
+        :type expires_at: str
+
+        :param modified: Optional modification time (epoch seconds), cache files are read most recently modified first
+        :type modified: Optional[float]
+        """
+        file_path = os.path.join(Config.__aws_sso_cache_path__, file_name)
+
+        with open(file_path, 'w') as cache_file:
+            json.dump({'startUrl': start_url, 'region': 'ap-southeast-2', 'accessToken': 'token', 'expiresAt': expires_at}, cache_file)
+
+        if modified is not None:
+            os.utime(file_path, (modified, modified))
+
+    @staticmethod
+    def __format_expiry__(hours, timestamp_format='%Y-%m-%dT%H:%M:%SUTC') -> str:
+        """
+        Format an expiry relative to now
+
+        :param hours: Number of hours from now
+        :type hours: float
+
+        :param timestamp_format: Timestamp format
+        :type timestamp_format: str
+
+        :return: Formatted timestamp
+        """
+        return (datetime.utcnow() + timedelta(hours=hours)).strftime(timestamp_format)
+
+    @staticmethod
+    def __read_credentials__() -> ConfigParser:
+        """
+        Read the temporary AWS credentials file
+
+        :return: Configuration parser
+        """
+        config = ConfigParser()
+        config.read(Config.__aws_credential_path__)
+
+        return config
+
+
+if __name__ == '__main__':
+    unittest.main()
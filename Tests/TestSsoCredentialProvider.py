@@ -0,0 +1,82 @@
+import unittest
+
+from datetime import datetime, timedelta
+from unittest import mock
+
+from Aws.Credential import Credential
+from Aws.Sso.Config import Config
+from Aws.Sso.CredentialProvider import CredentialProvider
+
+
+class TestSsoCredentialProvider(unittest.TestCase):
+    """
+    Offline SSO credential provider tests, role credentials are never requested from AWS
+    """
+    def setUp(self) -> None:
+        """
+        Setup for unit tests
+        """
+        CredentialProvider.clear_credentials()
+
+        # Role credentials are returned for the profile requested
+        self.patcher = mock.patch.object(Config, 'get_role_credentials', side_effect=self.__get_role_credentials__)
+        self.get_role_credentials = self.patcher.start()
+
+    def tearDown(self) -> None:
+        """
+        Clean up after unit tests
+        """
+        self.patcher.stop()
+        CredentialProvider.clear_credentials()
+
+    def test_credentials_shared_across_regions(self):
+        """
+        Test role credentials are retrieved once per profile, however many regions and sessions use them
+        """
+        credential = Credential(sso_profile_name='first')
+        sessions = [credential.get_boto3_session(region_name) for region_name in ('ap-southeast-2', 'us-east-1', 'eu-west-1')]
+        sessions.append(Credential(sso_profile_name='first').get_boto3_session('ap-southeast-2', cache=False))
+
+        access_keys = {session.get_credentials().get_frozen_credentials().access_key for session in sessions}
+
+        self.assertEqual({'first-key'}, access_keys)
+        self.assertEqual([mock.call('first')], self.get_role_credentials.call_args_list)
+
+        second = Credential(sso_profile_name='second').get_boto3_session('ap-southeast-2')
+
+        self.assertEqual('second-key', second.get_credentials().get_frozen_credentials().access_key)
+        self.assertEqual([mock.call('first'), mock.call('second')], self.get_role_credentials.call_args_list)
+
+    def test_clear_credentials(self):
+        """
+        Test cleared credentials are retrieved again on next use
+        """
+        CredentialProvider.get_credentials('first').get_frozen_credentials()
+        CredentialProvider.clear_credentials('first')
+        CredentialProvider.get_credentials('first').get_frozen_credentials()
+
+        self.assertEqual(2, self.get_role_credentials.call_count)
+
+    @staticmethod
+    def __get_role_credentials__(profile_name) -> dict:
+        """
+        Return fake role credentials for a profile
+
+        :param profile_name: The AWS profile name
+        :type profile_name: str
+
+        :return: Role credentials
+        """
+        expiration = datetime.utcnow() + timedelta(hours=1)
+
+        return {
+            'accessKeyId': '{profile_name}-key'.format(profile_name=profile_name),
+            'secretAccessKey': 'secret',
+            'sessionToken': 'token',
+            'expiration': int((expiration - datetime(1970, 1, 1)).total_seconds() * 1000),
+            'region': 'ap-southeast-2'
+        }
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -20,5 +20,9 @@ setup(
         'Aws.Qldb'
     ],
     zip_safe=False,
-    install_requires=['boto3']
+    install_requires=['boto3'],
+    extras_require={
+        'async': ['aiobotocore'],
+        'qldb': ['pyqldb']
+    }
 )
\ No newline at end of file